@@ -0,0 +1,66 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import string
+from typing import Iterable, List, NamedTuple, Tuple
+
+LONGITUD_MINIMA = 12
+# Exactamente las clases de la validación original: [A-Z], [a-z], \d y [!@#$%^&*(),.?":{}|<>]
+ESPECIALES = '!@#$%^&*(),.?":{}|<>'
+
+def _construir_tabla() -> bytes:
+    """Tabla de 256 bytes que traduce cada carácter latin-1 al código de su clase"""
+    tabla = bytearray(256)
+    for grupo, codigo in ((string.ascii_uppercase, b'M'), (string.ascii_lowercase, b'm'),
+                          (string.digits, b'd'), (ESPECIALES, b'e')):
+        for c in grupo:
+            tabla[ord(c)] = codigo[0]
+    return bytes(tabla)
+
+TABLA_CLASES = _construir_tabla()
+
+class Informe(NamedTuple):
+    segura: bool
+    fallos: Tuple[str, ...]
+    longitud: int
+    mayusculas: int
+    minusculas: int
+    numeros: int
+    especiales: int
+    otros: int
+
+def analizar(contraseña: str) -> Informe:
+    """Clasifica todos los caracteres de una pasada y devuelve todas las reglas que fallan.
+
+    La clasificación la hace bytes.translate con TABLA_CLASES; los caracteres fuera de
+    latin-1 se descartan al codificar y cuentan como "otros", salvo los dígitos de otras
+    escrituras ('٣', '３'...), que \\d también aceptaba y cuentan como números.
+    """
+    clases = contraseña.encode('latin-1', 'ignore').translate(TABLA_CLASES)
+    mayusculas = clases.count(b'M')
+    minusculas = clases.count(b'm')
+    numeros = clases.count(b'd')
+    if not contraseña.isascii():
+        # latin-1 no tiene más dígitos decimales que los ASCII
+        numeros += sum(1 for c in contraseña if c > '\xff' and c.isdecimal())
+    especiales = clases.count(b'e')
+    longitud = len(contraseña)
+
+    fallos = []
+    if longitud < LONGITUD_MINIMA:
+        fallos.append(f"La contraseña debe tener al menos {LONGITUD_MINIMA} caracteres")
+    if not mayusculas:
+        fallos.append("Debe contener al menos una letra mayúscula")
+    if not minusculas:
+        fallos.append("Debe contener al menos una letra minúscula")
+    if not numeros:
+        fallos.append("Debe contener al menos un número")
+    if not especiales:
+        fallos.append("Debe contener al menos un carácter especial")
+
+    return Informe(
+        not fallos, tuple(fallos), longitud, mayusculas, minusculas, numeros, especiales,
+        longitud - mayusculas - minusculas - numeros - especiales
+    )
+
+def analizar_lote(contraseñas: Iterable[str]) -> List[Informe]:
+    return list(map(analizar, contraseñas))
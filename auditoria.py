@@ -0,0 +1,153 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from typing import BinaryIO, Iterator, List, Optional, TextIO, Tuple
+
+from cache_veredictos import CacheVeredictos
+from rangos import AlmacenRangos
+from validador import motivo_rechazo, es_contraseña_comun, cargar_indice, cargar_automata, preparar_lista
+
+TAMAÑO_LOTE = 5000
+CAPACIDAD_CACHE = 100_000
+
+_lista_comunes = None
+_automata = None
+_cache: Optional[CacheVeredictos] = None
+_rangos: Optional[AlmacenRangos] = None
+
+def _iniciar_trabajador(ruta_lista: str, capacidad_cache: int = CAPACIDAD_CACHE, ruta_rangos: Optional[str] = None):
+    """Cada proceso abre sus propios mapas del índice y del autómata; las páginas se comparten"""
+    global _lista_comunes, _automata, _cache, _rangos
+    _lista_comunes = cargar_indice(ruta_lista)
+    _automata = cargar_automata(ruta_lista)
+    _cache = CacheVeredictos(capacidad_cache) if capacidad_cache > 0 else None
+    _rangos = AlmacenRangos(ruta_rangos) if ruta_rangos else None
+
+def _evaluar(contraseña: str, filtrada: bool = False) -> Tuple[bool, bool, str]:
+    """(segura, común, resto del veredicto en JSON tras el número de línea)"""
+    comun = filtrada or es_contraseña_comun(contraseña, _lista_comunes)
+    # Las mismas reglas que al crear un usuario: una contraseña segura aquí se acepta en el alta
+    motivo = motivo_rechazo(contraseña, automata=_automata, comun=comun)
+    segura = motivo is None
+    mensaje = "Contraseña segura" if segura else motivo
+    cola = json.dumps({"segura": segura, "comun": comun, "mensaje": mensaje}, ensure_ascii=False)[1:]
+    return segura, comun, cola
+
+def auditar_lote(primera_linea: int, lote: List[str]) -> Tuple[str, int, int, int]:
+    """Evalúa un lote de candidatas y devuelve sus veredictos ya serializados en JSONL.
+
+    Con la caché, una contraseña repetida solo cuesta su MAC: se reutiliza hasta el JSON.
+    Con el almacén de rangos, todo el lote se consulta de una vez agrupado por prefijo.
+    """
+    salida = []
+    inseguras = comunes = 0
+    aciertos = _cache.aciertos if _cache is not None else 0
+    filtradas = _rangos.consultar_lote(lote) if _rangos is not None else [0] * len(lote)
+    for n, contraseña, filtrada in zip(range(primera_linea, primera_linea + len(lote)), lote, filtradas):
+        if _cache is not None:
+            segura, comun, cola = _cache.obtener(contraseña, lambda: _evaluar(contraseña, filtrada > 0))
+        else:
+            segura, comun, cola = _evaluar(contraseña, filtrada > 0)
+        comunes += comun
+        inseguras += not segura
+        salida.append(f'{{"linea": {n}, {cola}')
+    salida.append('')
+    aciertos = _cache.aciertos - aciertos if _cache is not None else 0
+    return '\n'.join(salida), inseguras, comunes, aciertos
+
+def leer_lotes(entrada: BinaryIO, tamaño_lote: int) -> Iterator[Tuple[int, List[str]]]:
+    lote = []
+    primera = 1
+    for n, linea in enumerate(entrada, 1):
+        lote.append(linea.decode('utf-8', errors='replace').rstrip('\r\n'))
+        if len(lote) >= tamaño_lote:
+            yield primera, lote
+            primera = n + 1
+            lote = []
+    if lote:
+        yield primera, lote
+
+def auditar(entrada: BinaryIO, salida: TextIO, ruta_lista: str = 'TXT/contras.txt',
+            procesos: Optional[int] = None, tamaño_lote: int = TAMAÑO_LOTE,
+            capacidad_cache: int = CAPACIDAD_CACHE, ruta_rangos: Optional[str] = None) -> dict:
+    """Audita un flujo de contraseñas (una por línea) y escribe un veredicto JSONL por línea.
+
+    Como mucho hay procesos * 2 lotes en vuelo, así que la memoria no depende del tamaño
+    de la entrada, y los veredictos salen en el mismo orden que las líneas. Cada proceso
+    tiene su propia caché de capacidad_cache veredictos (0 la desactiva) y, si se indica
+    ruta_rangos, también se buscan las contraseñas en ese almacén de rangos SHA-1.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    resumen = {"total": 0, "inseguras": 0, "comunes": 0, "cache_aciertos": 0}
+    inicio = time.perf_counter()
+
+    def escribir(resultado: Tuple[str, int, int, int], cantidad: int):
+        texto, inseguras, comunes, aciertos = resultado
+        salida.write(texto)
+        resumen["total"] += cantidad
+        resumen["inseguras"] += inseguras
+        resumen["comunes"] += comunes
+        resumen["cache_aciertos"] += aciertos
+
+    if procesos == 1:
+        _iniciar_trabajador(ruta_lista, capacidad_cache, ruta_rangos)
+        for primera, lote in leer_lotes(entrada, tamaño_lote):
+            escribir(auditar_lote(primera, lote), len(lote))
+    else:
+        preparar_lista(ruta_lista)
+        with multiprocessing.Pool(procesos, initializer=_iniciar_trabajador,
+                                  initargs=(ruta_lista, capacidad_cache, ruta_rangos)) as pool:
+            pendientes = deque()
+            for primera, lote in leer_lotes(entrada, tamaño_lote):
+                if len(pendientes) >= procesos * 2:
+                    resultado, cantidad = pendientes.popleft()
+                    escribir(resultado.get(), cantidad)
+                pendientes.append((pool.apply_async(auditar_lote, (primera, lote)), len(lote)))
+            while pendientes:
+                resultado, cantidad = pendientes.popleft()
+                escribir(resultado.get(), cantidad)
+
+    salida.flush()
+    resumen["segundos"] = round(time.perf_counter() - inicio, 3)
+    resumen["por_segundo"] = round(resumen["total"] / resumen["segundos"]) if resumen["segundos"] else 0
+    return resumen
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='validador.py audit',
+        description='Audita contraseñas en bloque y emite un veredicto JSONL por línea'
+    )
+    parser.add_argument('archivo', nargs='?', default='-', help='Archivo con una contraseña por línea (por defecto: stdin)')
+    parser.add_argument('-o', '--salida', help='Archivo JSONL de salida (por defecto: stdout)')
+    parser.add_argument('-p', '--procesos', type=int, default=None, help='Procesos de trabajo (por defecto: todos los núcleos)')
+    parser.add_argument('--lote', type=int, default=TAMAÑO_LOTE, help=f'Contraseñas por lote (por defecto: {TAMAÑO_LOTE})')
+    parser.add_argument('--lista', default='TXT/contras.txt', help='Lista de contraseñas comunes')
+    parser.add_argument('--cache', type=int, default=CAPACIDAD_CACHE,
+                        help=f'Veredictos en caché por proceso, 0 para desactivarla (por defecto: {CAPACIDAD_CACHE})')
+    parser.add_argument('--rangos', default=None, help='Directorio de rangos SHA-1 (formato HIBP) a consultar además de la lista')
+    args = parser.parse_args(argv)
+
+    entrada = sys.stdin.buffer if args.archivo == '-' else open(args.archivo, 'rb')
+    salida = sys.stdout if not args.salida else open(args.salida, 'w', encoding='utf-8')
+    try:
+        resumen = auditar(entrada, salida, args.lista, args.procesos, args.lote, args.cache, args.rangos)
+    except KeyboardInterrupt:
+        print("\n[!] Auditoría cancelada por el usuario", file=sys.stderr)
+        return 1
+    finally:
+        if entrada is not sys.stdin.buffer:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+
+    print(json.dumps(resumen), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
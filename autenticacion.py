@@ -0,0 +1,147 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Container, Optional, Set, Tuple
+
+import persistencia
+from automata import AutomataComunes
+from hashing import hash_contraseña, comprobar_contraseña, necesita_rehash, calibrar_al_arrancar, MAX_BYTES_BCRYPT
+from limitador import LimitadorGCRA, clave_usuario, clave_usuario_ip
+from rangos import AlmacenRangos
+from validador import motivo_rechazo, contador_logins, contador_rehash
+
+# Las métricas se definen en validador; el registro devuelve los mismos contadores que usa el menú
+_M_LOGIN_VALIDO = contador_logins('valido')
+_M_LOGIN_INVALIDO = contador_logins('invalido')
+_M_LOGIN_DESCONOCIDO = contador_logins('usuario_desconocido')
+_M_REHASH = contador_rehash()
+
+class AutenticadorAsync:
+    """API asyncio para registrar usuarios e iniciar sesión sin bloquear el bucle de eventos.
+
+    bcrypt y SQLite se ejecutan en pools de hilos propios (bcrypt libera el GIL) y un
+    semáforo asyncio limita cuántos hashes hay en curso, de modo que miles de inicios de
+    sesión pueden esperar a la vez en el mismo bucle sin crear miles de hilos. El GCRA en
+    memoria se consulta en el propio bucle; un limitador con E/S (LimitadorSQLite) se usa
+    desde un hilo propio. Las penalizaciones por fallo se esperan con asyncio.sleep.
+    """
+
+    def __init__(self, ruta_bd: str = persistencia.RUTA_BD, limitador=None,
+                 lista_comunes: Optional[Container[str]] = None, hilos_hash: Optional[int] = None,
+                 retraso_fallo: float = 1.0, retraso_bloqueo: float = 2.0,
+                 automata: Optional[AutomataComunes] = None, rangos: Optional[AlmacenRangos] = None):
+        self.pool = persistencia.obtener_pool(ruta_bd)
+        self.limitador = limitador if limitador is not None else LimitadorGCRA()
+        self.lista_comunes = lista_comunes
+        self.automata = automata
+        self.rangos = rangos
+        self.retraso_fallo = retraso_fallo
+        self.retraso_bloqueo = retraso_bloqueo
+        hilos_hash = hilos_hash or os.cpu_count() or 1
+        self._hash = ThreadPoolExecutor(max_workers=hilos_hash, thread_name_prefix='bcrypt')
+        self._bd = ThreadPoolExecutor(max_workers=self.pool.tamaño, thread_name_prefix='sqlite')
+        # Un solo hilo: la conexión del limitador SQLite no se comparte entre hilos a la vez
+        self._hilo_limitador = (None if isinstance(self.limitador, LimitadorGCRA)
+                                else ThreadPoolExecutor(max_workers=1, thread_name_prefix='limitador'))
+        self._cupo_hash: Optional[asyncio.Semaphore] = None
+        self._hilos_hash = hilos_hash
+        self._señuelo: Optional[bytes] = None
+        self._segundo_plano: Set[asyncio.Task] = set()
+
+    async def _en_hilo(self, ejecutor: Optional[ThreadPoolExecutor], funcion, *args):
+        return await asyncio.get_running_loop().run_in_executor(ejecutor, funcion, *args)
+
+    async def _registrar_intento(self, claves: Tuple[str, ...], exito: bool) -> bool:
+        """Registra el intento en todas las claves; basta una bloqueada para rechazarlo"""
+        if self._hilo_limitador is None:
+            resultados = [self.limitador.registrar_intento(clave, exito) for clave in claves]
+        else:
+            resultados = [await self._en_hilo(self._hilo_limitador, self.limitador.registrar_intento, clave, exito)
+                          for clave in claves]
+        return all(resultados)
+
+    async def _bcrypt(self, funcion, *args):
+        if self._cupo_hash is None:
+            # Se crea aquí para que pertenezca al bucle que lo usa
+            self._cupo_hash = asyncio.Semaphore(self._hilos_hash * 2)
+        async with self._cupo_hash:
+            return await self._en_hilo(self._hash, funcion, *args)
+
+    async def inicializar(self):
+        await self._en_hilo(self._bd, persistencia.inicializar, self.pool)
+        await self._en_hilo(self._hash, calibrar_al_arrancar)
+        # Hash de un usuario inexistente: así fallar por usuario o por contraseña tarda lo mismo
+        self._señuelo = await self._bcrypt(hash_contraseña, os.urandom(16).hex())
+
+    async def verify(self, user: str, pw: str, ip: Optional[str] = None) -> bool:
+        # La IP la indica quien llama: cambiándola en cada intento no debe escapar del límite por
+        # usuario, así que se cuenta siempre en clave_usuario y, si la hay, también por usuario e IP
+        claves = (clave_usuario(user), clave_usuario_ip(user, ip)) if ip else (clave_usuario(user),)
+        # El intento se cuenta como fallo antes de bcrypt, así las peticiones que esperan su
+        # hash a la vez no pueden pasar del límite; si la contraseña es correcta se borra
+        if not await self._registrar_intento(claves, False):
+            await asyncio.sleep(self.retraso_bloqueo)
+            return False
+
+        guardado = await self._en_hilo(self._bd, persistencia.obtener_hash, self.pool, user)
+        # bcrypt no admite contraseñas de más de MAX_BYTES_BCRYPT; nunca coinciden, pero se
+        # compara igualmente contra el señuelo para que tarden lo mismo que las demás
+        demasiado_larga = len(pw.encode('utf-8')) > MAX_BYTES_BCRYPT
+        if guardado is None or demasiado_larga:
+            if self._señuelo is None:
+                await self.inicializar()
+            await self._bcrypt(comprobar_contraseña, '' if demasiado_larga else pw, self._señuelo)
+            valido = False
+            (_M_LOGIN_DESCONOCIDO if guardado is None else _M_LOGIN_INVALIDO).incrementar()
+        else:
+            valido = await self._bcrypt(comprobar_contraseña, pw, guardado.encode('utf-8'))
+            (_M_LOGIN_VALIDO if valido else _M_LOGIN_INVALIDO).incrementar()
+
+        if not valido:
+            await asyncio.sleep(self.retraso_fallo)
+            return False
+        # Si otras peticiones bloquearon la clave mientras se hasheaba, tampoco entra esta
+        if not await self._registrar_intento(claves, True):
+            await asyncio.sleep(self.retraso_bloqueo)
+            return False
+
+        if necesita_rehash(guardado.encode('utf-8')):
+            tarea = asyncio.ensure_future(self._rehash(user, pw, guardado))
+            self._segundo_plano.add(tarea)
+            tarea.add_done_callback(self._segundo_plano.discard)
+        return True
+
+    async def _rehash(self, user: str, pw: str, anterior: str):
+        nuevo = await self._bcrypt(hash_contraseña, pw)
+        if await self._en_hilo(self._bd, persistencia.actualizar_hash, self.pool, user, nuevo.decode('utf-8'), anterior):
+            _M_REHASH.incrementar()
+
+    async def register(self, user: str, pw: str) -> Tuple[bool, str]:
+        # El estimador y las búsquedas en el índice y el autómata no deben frenar el bucle
+        motivo = await self._en_hilo(None, motivo_rechazo, pw, self.lista_comunes, self.automata,
+                                     self.rangos)
+        if motivo is not None:
+            return False, motivo
+
+        hashed = await self._bcrypt(hash_contraseña, pw)
+        creado = await self._en_hilo(self._bd, persistencia.insertar_usuario, self.pool, user, hashed.decode('utf-8'))
+        if not creado:
+            return False, "El nombre de usuario ya existe"
+        return True, "Usuario creado exitosamente"
+
+    async def cerrar(self):
+        if self._segundo_plano:
+            await asyncio.gather(*self._segundo_plano, return_exceptions=True)
+        self._hash.shutdown(wait=True)
+        self._bd.shutdown(wait=True)
+        if self._hilo_limitador is not None:
+            self._hilo_limitador.shutdown(wait=True)
+
+    async def __aenter__(self):
+        await self.inicializar()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.cerrar()
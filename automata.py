@@ -0,0 +1,218 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Optional
+
+from indice import leer_lista, indice_actualizado, escritura_atomica
+
+MAGIA = b'PCAHOC1\0'
+# magia, estados, longitud mínima de los términos
+CABECERA = struct.Struct('<8sII')
+LONGITUD_MINIMA = 4
+RUTA_DATOS = 'data.JSON'
+
+def ruta_automata(ruta_lista: str) -> str:
+    return os.path.splitext(ruta_lista)[0] + '.aho'
+
+def leer_datos(ruta_datos: str) -> Iterator[str]:
+    """Todas las palabras de las categorías de data.JSON"""
+    with open(ruta_datos, 'r', encoding='utf-8') as f:
+        categorias = json.load(f).get('categorias', {})
+    for palabras in categorias.values():
+        yield from palabras
+
+def _hijo(primer_hijo, etiquetas, estado: int, byte: int) -> int:
+    """Estado al que se llega desde estado con byte, o 0 si no hay transición"""
+    inicio, fin = primer_hijo[estado], primer_hijo[estado + 1]
+    if inicio == fin:
+        return 0
+    k = bisect_left(etiquetas, byte, inicio, fin)
+    return k if k < fin and etiquetas[k] == byte else 0
+
+def compilar_automata(terminos: Iterable[str], destino: str, longitud_minima: int = LONGITUD_MINIMA) -> int:
+    """Compila los términos (en minúsculas, de longitud_minima caracteres o más) en un autómata Aho-Corasick.
+
+    Los estados se numeran por niveles, así que los hijos de cada estado son consecutivos
+    y basta guardar dónde empiezan: el trie entero son cuatro arrays planos (primer hijo,
+    etiqueta, fallo y longitud del término que acaba en el estado) que se escriben tal
+    cual y luego se mapean en memoria. Los términos ordenados permiten crear cada nivel
+    con búsquedas binarias, sin recorrer los términos letra a letra.
+    """
+    claves = sorted({
+        t.lower().encode('utf-8') for t in terminos if len(t) >= longitud_minima
+    })
+    claves = [c for c in claves if len(c) <= 0xFFFF]
+
+    primer_hijo = array('I')
+    etiquetas = array('B', [0])
+    fallo = array('I', [0])
+    coincide = array('H', [0])
+    siguiente = 1
+    nivel = [(0, 0, len(claves))]
+    profundidad = 0
+    while nivel:
+        nuevo = []
+        for estado, lo, hi in nivel:
+            primer_hijo.append(siguiente)
+            # Los términos que acaban en este estado van primero en su tramo
+            while lo < hi and len(claves[lo]) == profundidad:
+                lo += 1
+            while lo < hi:
+                clave = claves[lo]
+                byte = clave[profundidad]
+                if byte == 0xFF:
+                    fin = hi
+                else:
+                    fin = bisect_left(claves, clave[:profundidad] + bytes((byte + 1,)), lo, hi)
+
+                f = 0
+                if estado:
+                    f = fallo[estado]
+                    while True:
+                        g = _hijo(primer_hijo, etiquetas, f, byte)
+                        if g or not f:
+                            f = g
+                            break
+                        f = fallo[f]
+                etiquetas.append(byte)
+                fallo.append(f)
+                coincide.append(profundidad + 1 if len(clave) == profundidad + 1 else coincide[f])
+                nuevo.append((siguiente, lo, fin))
+                siguiente += 1
+                lo = fin
+        nivel = nuevo
+        profundidad += 1
+    primer_hijo.append(siguiente)
+
+    with escritura_atomica(destino) as f:
+        f.write(CABECERA.pack(MAGIA, siguiente, longitud_minima))
+        for datos in (primer_hijo, fallo, coincide, etiquetas):
+            if sys.byteorder != 'little':
+                datos.byteswap()
+            datos.tofile(f)
+    return len(claves)
+
+class AutomataComunes:
+    """Autómata Aho-Corasick de contraseñas comunes, mapeado en memoria desde disco.
+
+    Busca a la vez todos los términos dentro de la contraseña en una sola pasada por sus
+    bytes: cada paso sigue una transición o un enlace de fallo, de modo que el coste
+    depende de la longitud de la contraseña y no del tamaño del diccionario.
+    """
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        self._archivo = open(ruta, 'rb')
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._archivo.close()
+            raise
+        magia, estados, self.longitud_minima = CABECERA.unpack_from(self._mapa, 0)
+        if magia != MAGIA or len(self._mapa) != CABECERA.size + estados * 11 + 4:
+            self.cerrar()
+            raise ValueError(f"El archivo {ruta} no es un autómata de Passcor válido")
+        self.estados = estados
+        self._vista = memoryview(self._mapa)
+        tramos = ((estados + 1) * 4, estados * 4, estados * 2, estados)
+        self._arrays: List = []
+        inicio = CABECERA.size
+        for tamaño, tipo in zip(tramos, 'IIHB'):
+            tramo = self._vista[inicio:inicio + tamaño]
+            if sys.byteorder == 'little' or tipo == 'B':
+                self._arrays.append(tramo.cast(tipo))
+            else:
+                # En máquinas big-endian no se puede reinterpretar el mapa directamente
+                copia = array(tipo, tramo.tobytes())
+                copia.byteswap()
+                self._arrays.append(copia)
+            inicio += tamaño
+        self._primer_hijo, self._fallo, self._coincide, self._etiquetas = self._arrays
+
+    def __len__(self) -> int:
+        return self.estados
+
+    def buscar(self, contraseña: str) -> Optional[str]:
+        """Primer término contenido en la contraseña (sin distinguir mayúsculas), o None"""
+        primer_hijo, fallo, coincide, etiquetas = self._primer_hijo, self._fallo, self._coincide, self._etiquetas
+        datos = contraseña.lower().encode('utf-8')
+        estado = 0
+        for pos, byte in enumerate(datos):
+            while True:
+                inicio, fin = primer_hijo[estado], primer_hijo[estado + 1]
+                if inicio != fin:
+                    k = bisect_left(etiquetas, byte, inicio, fin)
+                    if k < fin and etiquetas[k] == byte:
+                        estado = k
+                        break
+                if not estado:
+                    break
+                estado = fallo[estado]
+            longitud = coincide[estado]
+            if longitud:
+                return datos[pos + 1 - longitud:pos + 1].decode('utf-8', 'replace')
+        return None
+
+    def __contains__(self, contraseña: str) -> bool:
+        return self.buscar(contraseña) is not None
+
+    def cerrar(self):
+        for vista in getattr(self, '_arrays', ()):
+            if isinstance(vista, memoryview):
+                vista.release()
+        self._arrays = []
+        if getattr(self, '_vista', None) is not None:
+            self._vista.release()
+        self._mapa.close()
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+def abrir_automata(ruta_lista: str, ruta_datos: Optional[str] = RUTA_DATOS,
+                   ruta_aho: Optional[str] = None) -> AutomataComunes:
+    """Abre el autómata de la lista y de data.JSON, compilándolo antes si falta o está desactualizado"""
+    return AutomataComunes(preparar_automata(ruta_lista, ruta_datos, ruta_aho))
+
+def preparar_automata(ruta_lista: str, ruta_datos: Optional[str] = RUTA_DATOS,
+                      ruta_aho: Optional[str] = None) -> str:
+    """Compila el autómata si falta o está desactualizado y devuelve su ruta (ver indice.preparar_indice)"""
+    ruta_aho = ruta_aho or ruta_automata(ruta_lista)
+    fuentes = [r for r in (ruta_lista, ruta_datos) if r and os.path.exists(r)]
+    if fuentes and not all(indice_actualizado(r, ruta_aho) for r in fuentes):
+        compilar_automata(leer_terminos(ruta_lista, ruta_datos), ruta_aho)
+    return ruta_aho
+
+def leer_terminos(ruta_lista: str, ruta_datos: Optional[str]) -> Iterator[str]:
+    """Las contraseñas de la lista y las palabras de data.JSON que existan, en ese orden"""
+    if os.path.exists(ruta_lista):
+        yield from leer_lista(ruta_lista)
+    if ruta_datos and os.path.exists(ruta_datos):
+        yield from leer_datos(ruta_datos)
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compila la lista de contraseñas comunes y data.JSON en un autómata Aho-Corasick')
+    parser.add_argument('lista', nargs='?', default='TXT/contras.txt', help='Archivo de texto con una contraseña por línea')
+    parser.add_argument('--datos', default=RUTA_DATOS, help=f'Categorías de data.JSON a incluir (por defecto: {RUTA_DATOS})')
+    parser.add_argument('--minimo', type=int, default=LONGITUD_MINIMA, help=f'Longitud mínima de los términos (por defecto: {LONGITUD_MINIMA})')
+    parser.add_argument('-o', '--salida', help='Ruta del autómata (por defecto junto a la lista, con extensión .aho)')
+    args = parser.parse_args()
+
+    destino = args.salida or ruta_automata(args.lista)
+    total = compilar_automata(leer_terminos(args.lista, args.datos), destino, args.minimo)
+    print(f"Autómata escrito en {destino}: {total} términos")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,345 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from typing import BinaryIO, Dict, Iterator, List, Optional, TextIO, Tuple
+
+import persistencia
+from hashing import MAX_BYTES_BCRYPT, es_hash_bcrypt
+from indice import escritura_atomica
+
+TAMAÑO_LOTE = 256
+INTERVALO_PROGRESO = 2.0
+# Cada cuántos segundos se guarda el punto de control (y siempre que aparece una coincidencia)
+INTERVALO_PUNTO = 30.0
+VERSION_PUNTO = 2
+
+# Una candidata: (línea del archivo, contraseña en bytes)
+Candidata = Tuple[int, bytes]
+
+_hashes: List[bytes] = []
+
+def _iniciar_trabajador(hashes: List[bytes]):
+    """Cada proceso recibe una vez todos los hashes; las tareas solo llevan índices"""
+    global _hashes
+    _hashes = hashes
+
+def comprobar_tarea(candidatas: List[Candidata], usuarios: List[int]) -> Tuple[List[Tuple[int, int]], int]:
+    """Prueba las candidatas contra cada usuario y se detiene en la primera que coincide.
+
+    Devuelve las coincidencias (índice de usuario, línea) y cuántas comprobaciones bcrypt se hicieron.
+    """
+    import bcrypt
+
+    encontrados = []
+    comprobaciones = 0
+    for indice in usuarios:
+        hashed = _hashes[indice]
+        for linea, contraseña in candidatas:
+            comprobaciones += 1
+            if bcrypt.checkpw(contraseña, hashed):
+                encontrados.append((indice, linea))
+                break
+    return encontrados, comprobaciones
+
+def cargar_usuarios(pool: persistencia.PoolConexiones) -> Tuple[List[str], List[bytes], int]:
+    """Todos los usuarios con hash bcrypt válido, leídos una sola vez: (nombres, hashes, descartados)"""
+    usuarios, hashes = [], []
+    descartados = 0
+    for pagina in persistencia.iterar_usuarios(pool):
+        for usuario, hashed in pagina:
+            if es_hash_bcrypt(hashed):
+                usuarios.append(usuario)
+                hashes.append(hashed.encode('ascii'))
+            else:
+                descartados += 1
+    return usuarios, hashes, descartados
+
+def leer_lotes(entrada: BinaryIO, tamaño_lote: int, posicion: int = 0,
+               linea: int = 0) -> Iterator[Tuple[List[Candidata], int, int]]:
+    """Lotes de candidatas sin repetir dentro del lote, con la posición en bytes y la última
+    línea leídas al terminar cada uno, que es lo que guarda el punto de control.
+    """
+    lote: Dict[bytes, int] = {}
+    for texto in entrada:
+        linea += 1
+        posicion += len(texto)
+        # bcrypt solo usa los primeros bytes y desde bcrypt 5 rechaza el resto en vez de truncar
+        contraseña = texto.rstrip(b'\r\n')[:MAX_BYTES_BCRYPT]
+        if contraseña and contraseña not in lote:
+            lote[contraseña] = linea
+        if len(lote) >= tamaño_lote:
+            yield [(n, c) for c, n in lote.items()], posicion, linea
+            lote = {}
+    if lote:
+        yield [(n, c) for c, n in lote.items()], posicion, linea
+
+def repartir(candidatas: List[Candidata], activos: List[int], procesos: int) -> Iterator[Tuple[List[Candidata], List[int]]]:
+    """Divide un lote en tareas para que todos los procesos tengan trabajo.
+
+    Se reparten los usuarios; si hay menos usuarios que procesos también se parten las
+    candidatas (entonces un usuario encontrado en una parte aún se prueba en las demás).
+    """
+    por_usuarios = -(-len(activos) // procesos)
+    partes_candidatas = max(1, min(len(candidatas), procesos // len(activos)))
+    por_candidatas = -(-len(candidatas) // partes_candidatas)
+    for i in range(0, len(activos), por_usuarios):
+        for j in range(0, len(candidatas), por_candidatas):
+            yield candidatas[j:j + por_candidatas], activos[i:i + por_usuarios]
+
+class PuntoControl:
+    """Progreso guardado en JSON: hasta dónde se leyó la entrada, qué usuarios cubre la pasada
+    en curso, cuáles esperan a la siguiente, cuáles ya pasaron por toda la entrada y cuáles
+    coincidieron.
+
+    Se escribe de forma atómica y solo cubre lotes terminados, así que tras un corte se
+    reanuda repitiendo como mucho los lotes que estaban en vuelo.
+    """
+
+    def __init__(self, ruta: Optional[str]):
+        self.ruta = ruta
+        self.datos: Dict[str, object] = {}
+
+    def cargar(self, entrada: str, tamaño: int) -> bool:
+        """Carga el punto de control si existe; ValueError si es de otro barrido"""
+        if not self.ruta or not os.path.exists(self.ruta):
+            return False
+        with open(self.ruta, 'r', encoding='utf-8') as f:
+            datos = json.load(f)
+        if datos.get("version") != VERSION_PUNTO or datos.get("entrada") != entrada:
+            raise ValueError(f"El punto de control {self.ruta} es de otra entrada")
+        if datos.get("tamaño_entrada") != tamaño:
+            raise ValueError(f"La entrada cambió desde el punto de control {self.ruta}")
+        self.datos = datos
+        return True
+
+    def guardar(self, **datos):
+        if not self.ruta:
+            return
+        self.datos.update(datos, version=VERSION_PUNTO)
+        with escritura_atomica(self.ruta) as f:
+            f.write(json.dumps(self.datos, ensure_ascii=False).encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+
+def barrer(entrada: BinaryIO, salida: TextIO, pool: Optional[persistencia.PoolConexiones] = None,
+           procesos: Optional[int] = None, tamaño_lote: int = TAMAÑO_LOTE,
+           ruta_punto: Optional[str] = None, mostrar: bool = False, progreso: bool = False) -> Dict[str, object]:
+    """Busca qué usuarios de la base de datos usan alguna contraseña de la entrada.
+
+    Los hashes se leen una vez y las candidatas se procesan por lotes repartidos entre
+    procesos; un usuario deja de probarse en cuanto coincide. Con ruta_punto el barrido se
+    puede interrumpir y reanudar (la entrada debe ser un archivo): la pasada en curso sigue
+    con los usuarios que ya cubría y los dados de alta después se barren en una pasada
+    aparte desde el principio de la entrada. Por cada usuario encontrado se escribe una
+    línea JSONL; la contraseña solo si mostrar es True.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    pool = pool or persistencia.obtener_pool()
+    persistencia.inicializar(pool)
+    usuarios, hashes, descartados = cargar_usuarios(pool)
+    if descartados:
+        print(f"Advertencia: {descartados} usuarios sin hash bcrypt válido no se comprueban", file=sys.stderr)
+
+    punto = PuntoControl(ruta_punto)
+    nombre = getattr(entrada, 'name', None)
+    ruta_entrada = os.path.abspath(nombre) if isinstance(nombre, str) and os.path.isfile(nombre) else None
+    if ruta_punto and ruta_entrada is None:
+        raise ValueError("El punto de control necesita leer la entrada desde un archivo")
+    tamaño_entrada = os.path.getsize(ruta_entrada) if ruta_entrada else 0
+    reanudado = punto.cargar(ruta_entrada, tamaño_entrada)
+
+    posicion = int(punto.datos.get("posicion", 0))
+    linea = int(punto.datos.get("lineas", 0))
+    encontrados: Dict[str, int] = dict(punto.datos.get("encontrados", {}))
+    comprobaciones = int(punto.datos.get("comprobaciones", 0))
+    previos = float(punto.datos.get("segundos", 0.0))
+
+    indices = {usuario: i for i, usuario in enumerate(usuarios)}
+    # Usuarios de la pasada en curso, de la siguiente y de las ya terminadas; los borrados
+    # desde el punto de control se olvidan
+    cubiertos = [u for u in punto.datos.get("cubiertos", usuarios) if u in indices]
+    siguientes = [u for u in punto.datos.get("siguientes", []) if u in indices]
+    terminados = [u for u in punto.datos.get("terminados", []) if u in indices]
+    if reanudado:
+        conocidos = set(cubiertos) | set(siguientes) | set(terminados) | set(encontrados)
+        nuevos = [u for u in usuarios if u not in conocidos]
+        if nuevos:
+            print(f"Advertencia: {len(nuevos)} usuarios nuevos desde el punto de control; "
+                  f"se comprobarán en una pasada aparte", file=sys.stderr)
+            siguientes.extend(nuevos)
+        if punto.datos.get("completado") and siguientes:
+            # La pasada anterior terminó: solo quedan los usuarios que esperaban la siguiente
+            terminados.extend(cubiertos)
+            cubiertos, siguientes = siguientes, []
+            posicion = linea = 0
+    if posicion:
+        entrada.seek(posicion)
+    pendientes = {indices[u] for u in cubiertos if u not in encontrados}
+    inicio = time.perf_counter()
+    ultimo_punto = ultimo_progreso = inicio
+    comprobaciones_sesion = 0
+    lineas_lote: Dict[int, Dict[int, bytes]] = {}
+
+    def guardar_punto(completado: bool = False):
+        punto.guardar(entrada=ruta_entrada, tamaño_entrada=tamaño_entrada, posicion=posicion, lineas=linea,
+                      cubiertos=cubiertos, siguientes=siguientes, terminados=terminados,
+                      encontrados=encontrados, comprobaciones=comprobaciones,
+                      segundos=round(previos + time.perf_counter() - inicio, 3), completado=completado)
+
+    def mostrar_progreso(final: bool = False):
+        nonlocal ultimo_progreso
+        ahora = time.perf_counter()
+        if not progreso or (not final and ahora - ultimo_progreso < INTERVALO_PROGRESO):
+            return
+        ultimo_progreso = ahora
+        porcentaje = f" ({posicion * 100 / tamaño_entrada:.1f}%)" if tamaño_entrada else ''
+        print(f"\r[+] línea {linea}{porcentaje}, {len(encontrados)}/{len(usuarios)} usuarios encontrados, "
+              f"{comprobaciones_sesion / (ahora - inicio) if ahora > inicio else 0:.1f} hashes/s",
+              end='\n' if final else '', file=sys.stderr, flush=True)
+
+    def aplicar(resultados: List[Tuple[List[Tuple[int, int]], int]], fin: int, ultima: int):
+        """Incorpora un lote terminado; los lotes se aplican en orden de lectura"""
+        nonlocal posicion, linea, comprobaciones, comprobaciones_sesion, ultimo_punto
+        nuevos = False
+        for coincidencias, hechas in resultados:
+            comprobaciones += hechas
+            comprobaciones_sesion += hechas
+            for indice, n in sorted(coincidencias, key=lambda c: c[1]):
+                usuario = usuarios[indice]
+                if usuario in encontrados:
+                    continue
+                encontrados[usuario] = n
+                pendientes.discard(indice)
+                registro = {"usuario": usuario, "linea": n}
+                if mostrar:
+                    registro["contraseña"] = lineas_lote[fin][n].decode('utf-8', errors='replace')
+                salida.write(json.dumps(registro, ensure_ascii=False))
+                salida.write('\n')
+                nuevos = True
+        lineas_lote.pop(fin, None)
+        posicion, linea = fin, ultima
+        if nuevos:
+            salida.flush()
+        ahora = time.perf_counter()
+        if nuevos or ahora - ultimo_punto >= INTERVALO_PUNTO:
+            guardar_punto()
+            ultimo_punto = ahora
+        mostrar_progreso()
+
+    def lotes() -> Iterator[Tuple[List[Candidata], int, int]]:
+        for candidatas, fin, ultima in leer_lotes(entrada, tamaño_lote, posicion, linea):
+            if not pendientes:
+                return
+            if mostrar:
+                lineas_lote[fin] = dict(candidatas)
+            yield candidatas, fin, ultima
+
+    def pasada(trabajadores):
+        if trabajadores is None:
+            for candidatas, fin, ultima in lotes():
+                aplicar([comprobar_tarea(candidatas, sorted(pendientes))], fin, ultima)
+            return
+        # Dos lotes en vuelo: mientras se termina uno, el siguiente ya ocupa los procesos libres
+        en_vuelo = deque()
+        for candidatas, fin, ultima in lotes():
+            if len(en_vuelo) >= 2:
+                tareas, fin_anterior, ultima_anterior = en_vuelo.popleft()
+                aplicar([t.get() for t in tareas], fin_anterior, ultima_anterior)
+            if not pendientes:
+                break
+            tareas = [trabajadores.apply_async(comprobar_tarea, tarea)
+                      for tarea in repartir(candidatas, sorted(pendientes), procesos)]
+            en_vuelo.append((tareas, fin, ultima))
+        while en_vuelo:
+            tareas, fin_anterior, ultima_anterior = en_vuelo.popleft()
+            aplicar([t.get() for t in tareas], fin_anterior, ultima_anterior)
+
+    def pasadas(trabajadores):
+        nonlocal cubiertos, siguientes, pendientes, posicion, linea
+        pasada(trabajadores)
+        while siguientes:
+            # Los usuarios dados de alta durante el barrido se comprueban con toda la entrada
+            terminados.extend(cubiertos)
+            cubiertos, siguientes = siguientes, []
+            pendientes = {indices[u] for u in cubiertos if u not in encontrados}
+            posicion = linea = 0
+            entrada.seek(0)
+            guardar_punto()
+            pasada(trabajadores)
+
+    completado = False
+    try:
+        if procesos == 1:
+            _iniciar_trabajador(hashes)
+            pasadas(None)
+        else:
+            with multiprocessing.Pool(procesos, initializer=_iniciar_trabajador, initargs=(hashes,)) as trabajadores:
+                pasadas(trabajadores)
+        completado = True
+    finally:
+        guardar_punto(completado)
+        salida.flush()
+        mostrar_progreso(final=True)
+
+    segundos = time.perf_counter() - inicio
+    return {
+        "usuarios": len(usuarios),
+        "encontrados": len(encontrados),
+        "lineas": linea,
+        "comprobaciones": comprobaciones,
+        "segundos": round(previos + segundos, 3),
+        "hashes_por_segundo": round(comprobaciones_sesion / segundos, 1) if segundos else 0,
+        "reanudado": reanudado,
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='validador.py sweep',
+        description='Comprueba qué usuarios de la base de datos usan alguna contraseña de un volcado '
+                    'y emite una línea JSONL por usuario encontrado'
+    )
+    parser.add_argument('archivo', nargs='?', default='-', help='Archivo con una contraseña por línea (por defecto: stdin)')
+    parser.add_argument('-o', '--salida', help='Archivo JSONL de usuarios encontrados (por defecto: stdout)')
+    parser.add_argument('-p', '--procesos', type=int, default=None, help='Procesos de trabajo (por defecto: todos los núcleos)')
+    parser.add_argument('--lote', type=int, default=TAMAÑO_LOTE, help=f'Candidatas por lote (por defecto: {TAMAÑO_LOTE})')
+    parser.add_argument('--punto-control', default=None,
+                        help='Archivo donde guardar el progreso; si ya existe se reanuda desde él')
+    parser.add_argument('--reiniciar', action='store_true', help='Ignorar el punto de control existente y empezar de cero')
+    parser.add_argument('--mostrar', action='store_true', help='Incluir en la salida la contraseña que coincide')
+    parser.add_argument('--bd', default=persistencia.RUTA_BD, help=f'Base de datos (por defecto: {persistencia.RUTA_BD})')
+    args = parser.parse_args(argv)
+
+    if args.reiniciar and args.punto_control and os.path.exists(args.punto_control):
+        os.remove(args.punto_control)
+
+    entrada = sys.stdin.buffer if args.archivo == '-' else open(args.archivo, 'rb')
+    # Al reanudar se añaden los nuevos usuarios encontrados a la salida anterior
+    modo = 'a' if args.punto_control and os.path.exists(args.punto_control) else 'w'
+    salida = sys.stdout if not args.salida else open(args.salida, modo, encoding='utf-8')
+    try:
+        resumen = barrer(entrada, salida, persistencia.obtener_pool(args.bd), args.procesos, args.lote,
+                         args.punto_control, args.mostrar, progreso=sys.stderr.isatty())
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        mensaje = "; se reanudará desde el punto de control" if args.punto_control else ''
+        print(f"\n[!] Barrido cancelado por el usuario{mensaje}", file=sys.stderr)
+        return 1
+    finally:
+        if entrada is not sys.stdin.buffer:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+
+    print(json.dumps(resumen, ensure_ascii=False), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
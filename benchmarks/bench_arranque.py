@@ -0,0 +1,80 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""Tiempo de arranque de generador.py y validador.py, comparado con la referencia guardada.
+
+Mide el tiempo acumulado de importación de cada módulo con `python -X importtime` y el
+tiempo total de generar una contraseña desde un script (`generador.py -q`). Cada medida
+es la mediana de varias ejecuciones. Si alguna supera la referencia en más de la
+tolerancia, termina con código 1.
+
+Uso: python3 benchmarks/bench_arranque.py [--repeticiones 15] [--guardar]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REFERENCIA = os.path.join(RAIZ, 'benchmarks', 'arranque_baseline.json')
+
+def importtime_ms(modulo: str) -> float:
+    resultado = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+                               cwd=RAIZ, capture_output=True, text=True, check=True)
+    for linea in resultado.stderr.splitlines():
+        partes = [p.strip() for p in linea.split('|')]
+        if len(partes) == 3 and partes[2] == modulo:
+            return int(partes[1]) / 1000
+    raise RuntimeError(f"No se encontró {modulo} en la salida de -X importtime")
+
+def comando_ms(*argumentos: str) -> float:
+    inicio = time.perf_counter()
+    subprocess.run([sys.executable, *argumentos], cwd=RAIZ, capture_output=True, check=True)
+    return (time.perf_counter() - inicio) * 1000
+
+def medir(repeticiones: int) -> dict:
+    medidas = {
+        "import_validador_ms": lambda: importtime_ms('validador'),
+        "import_generador_ms": lambda: importtime_ms('generador'),
+        "generador_quiet_ms": lambda: comando_ms('generador.py', '-q'),
+        "python_vacio_ms": lambda: comando_ms('-c', 'pass'),
+    }
+    return {nombre: round(statistics.median(f() for _ in range(repeticiones)), 2)
+            for nombre, f in medidas.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de arranque')
+    parser.add_argument('--repeticiones', type=int, default=15)
+    parser.add_argument('--tolerancia', type=float, default=0.5, help='Empeoramiento permitido (0.5 = 50%%)')
+    parser.add_argument('--guardar', action='store_true', help='Guardar las medidas como nueva referencia')
+    args = parser.parse_args()
+
+    resultados = medir(args.repeticiones)
+    print(json.dumps(resultados, indent=2))
+
+    if args.guardar:
+        with open(REFERENCIA, 'w') as f:
+            json.dump(resultados, f, indent=2)
+            f.write('\n')
+        return 0
+    if not os.path.exists(REFERENCIA):
+        return 0
+
+    with open(REFERENCIA) as f:
+        referencia = json.load(f)
+    # El intérprete vacío sirve para descontar lo que no depende del proyecto
+    escala = resultados["python_vacio_ms"] / referencia["python_vacio_ms"]
+    regresiones = []
+    for nombre, valor in resultados.items():
+        limite = referencia.get(nombre, float('inf')) * max(escala, 1.0) * (1 + args.tolerancia)
+        if nombre != "python_vacio_ms" and valor > limite:
+            regresiones.append(f"{nombre}: {valor} ms (referencia {referencia[nombre]} ms)")
+    for r in regresiones:
+        print(f"Regresión: {r}", file=sys.stderr)
+    return 1 if regresiones else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
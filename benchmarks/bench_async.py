@@ -0,0 +1,70 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""Generador de carga local para AutenticadorAsync: miles de inicios de sesión concurrentes en un bucle.
+
+Por defecto usa coste 4 de bcrypt (PASSCOR_BCRYPT_ROUNDS) para medir la capa asyncio y no
+la CPU de bcrypt; con el coste real el rendimiento lo marca bcrypt.
+
+Uso: python3 benchmarks/bench_async.py [--concurrencia 5000] [--usuarios 1000]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('PASSCOR_BCRYPT_ROUNDS', '4')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import persistencia
+from autenticacion import AutenticadorAsync
+from hashing import hash_contraseña, percentiles
+from limitador import LimitadorGCRA
+
+async def carga(ruta_bd: str, usuarios: int, concurrencia: int, fallos: float):
+    async with AutenticadorAsync(ruta_bd, limitador=LimitadorGCRA(max_intentos=10 ** 6),
+                                 retraso_fallo=0.05, retraso_bloqueo=0.05) as api:
+        hashed = hash_contraseña('Clave#Bench2024').decode('utf-8')
+        persistencia.insertar_usuarios(api.pool, ((f"usuario{i}", hashed) for i in range(usuarios)))
+
+        en_vuelo = maximo = 0
+        latencias = []
+
+        async def login(n: int) -> bool:
+            nonlocal en_vuelo, maximo
+            en_vuelo += 1
+            maximo = max(maximo, en_vuelo)
+            inicio = time.perf_counter()
+            pw = 'incorrecta' if random.random() < fallos else 'Clave#Bench2024'
+            resultado = await api.verify(f"usuario{n % usuarios}", pw, ip=f"10.0.{n % 250}.1")
+            latencias.append(time.perf_counter() - inicio)
+            en_vuelo -= 1
+            return resultado
+
+        inicio = time.perf_counter()
+        resultados = await asyncio.gather(*(login(n) for n in range(concurrencia)))
+        duracion = time.perf_counter() - inicio
+
+    print(f"Inicios de sesión:  {concurrencia} ({sum(resultados)} correctos)")
+    print(f"Máximo en vuelo:    {maximo}")
+    print(f"Duración:           {duracion:.2f} s")
+    print(f"Rendimiento:        {concurrencia / duracion:.0f} logins/s")
+    print(f"Latencia:           {percentiles(latencias)}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de la API asyncio')
+    parser.add_argument('--concurrencia', type=int, default=5000)
+    parser.add_argument('--usuarios', type=int, default=1000)
+    parser.add_argument('--fallos', type=float, default=0.1, help='Fracción de contraseñas incorrectas')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(carga(os.path.join(tmp, 'usuarios.db'), args.usuarios, args.concurrencia, args.fallos))
+        persistencia.obtener_pool(os.path.join(tmp, 'usuarios.db')).cerrar()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
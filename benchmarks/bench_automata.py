@@ -0,0 +1,69 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""Coste de compilar y de consultar el autómata Aho-Corasick de contraseñas comunes.
+
+Uso: python3 benchmarks/bench_automata.py [--entradas N] [--consultas M]
+
+Compila un diccionario sintético de N términos y otro cien veces menor, y mide el
+tiempo por contraseña en ambos para comprobar que no depende del tamaño del diccionario.
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from automata import compilar_automata, AutomataComunes
+
+def terminos(cantidad: int, semilla: int):
+    azar = random.Random(semilla)
+    letras = string.ascii_lowercase
+    for _ in range(cantidad):
+        palabra = ''.join(azar.choice(letras) for _ in range(azar.randint(4, 10)))
+        yield palabra + str(azar.randint(0, 9999)) if azar.random() < 0.5 else palabra
+
+def medir(automata: AutomataComunes, consultas) -> float:
+    inicio = time.perf_counter()
+    for c in consultas:
+        automata.buscar(c)
+    return (time.perf_counter() - inicio) / len(consultas) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark del autómata Aho-Corasick')
+    parser.add_argument('--entradas', type=int, default=1_000_000)
+    parser.add_argument('--consultas', type=int, default=100_000)
+    args = parser.parse_args()
+
+    azar = random.Random(1)
+    consultas = [''.join(azar.choice(string.ascii_letters + string.digits + '!#$') for _ in range(16))
+                 for _ in range(args.consultas)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for entradas in (max(1, args.entradas // 100), args.entradas):
+            ruta = os.path.join(tmp, f'{entradas}.aho')
+            inicio = time.perf_counter()
+            total = compilar_automata(terminos(entradas, entradas), ruta)
+            t_compilar = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            automata = AutomataComunes(ruta)
+            t_abrir = time.perf_counter() - inicio
+            with automata:
+                encontradas = sum(1 for c in consultas if c in automata)
+                print(f"Términos:            {total}")
+                print(f"Estados:             {len(automata)}")
+                print(f"Compilación:         {t_compilar:.2f} s")
+                print(f"Tamaño en disco:     {os.path.getsize(ruta) / 1e6:.1f} MB")
+                print(f"Apertura (mmap):     {t_abrir * 1000:.2f} ms")
+                print(f"Consulta, 16 chars:  {medir(automata, consultas):.1f} µs/op "
+                      f"({encontradas / len(consultas):.2%} contienen un término)")
+                print()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
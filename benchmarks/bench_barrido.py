@@ -0,0 +1,67 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""Cruce de un volcado con usuarios.db: verificar_contraseña por cada par (usuario, candidata)
+frente a validador.py sweep (hashes leídos una vez, pool de procesos y salida temprana por usuario).
+
+Usa coste 4 de bcrypt (PASSCOR_BCRYPT_ROUNDS) para que la prueba dure segundos; con el
+coste real la diferencia la marcan los núcleos y las comprobaciones que se ahorran.
+
+Uso: python3 benchmarks/bench_barrido.py [--usuarios 20] [--candidatas 500]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('PASSCOR_BCRYPT_ROUNDS', '4')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import persistencia
+from barrido import barrer
+from hashing import hash_contraseña
+from validador import verificar_contraseña
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark del cruce de volcados con la base de datos')
+    parser.add_argument('--usuarios', type=int, default=20)
+    parser.add_argument('--candidatas', type=int, default=500)
+    args = parser.parse_args()
+
+    candidatas = [f"filtrada{i}" for i in range(args.candidatas)]
+    # La mitad de los usuarios usa una contraseña del volcado, repartidas a lo largo de él
+    usuarios = {f"usuario{i}": candidatas[i * args.candidatas // args.usuarios] if i % 2 else f"propia{i}"
+                for i in range(args.usuarios)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        anterior = os.getcwd()
+        os.chdir(tmp)
+        try:
+            pool = persistencia.obtener_pool()
+            persistencia.inicializar(pool)
+            persistencia.insertar_usuarios(pool, [(u, hash_contraseña(c).decode('utf-8')) for u, c in usuarios.items()])
+
+            inicio = time.perf_counter()
+            por_pares = 0
+            for usuario in usuarios:
+                for candidata in candidatas:
+                    por_pares += verificar_contraseña(usuario, candidata)
+            t_pares = time.perf_counter() - inicio
+
+            entrada = io.BytesIO(''.join(c + '\n' for c in candidatas).encode('utf-8'))
+            resumen = barrer(entrada, io.StringIO(), pool)
+        finally:
+            os.chdir(anterior)
+
+    pares = args.usuarios * args.candidatas
+    print(f"Usuarios x candidatas: {args.usuarios} x {args.candidatas} (coste bcrypt {os.environ['PASSCOR_BCRYPT_ROUNDS']})")
+    print(f"Por pares:             {t_pares:.2f} s ({pares} comprobaciones, {pares / t_pares:.0f} hashes/s, "
+          f"{por_pares} encontrados)")
+    print(f"validador.py sweep:    {resumen['segundos']:.2f} s ({resumen['comprobaciones']} comprobaciones, "
+          f"{resumen['hashes_por_segundo']:.0f} hashes/s, {resumen['encontrados']} encontrados)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""Peticiones por segundo del demonio frente a lanzar un proceso nuevo por contraseña.
+
+Arranca demonio.py en un directorio temporal, lo consulta con cliente.Cliente desde
+varios hilos (una conexión por hilo) y compara con el coste de un `python -c` que importa
+validador para una sola comprobación, que es lo que hacen hoy los scripts de CI.
+
+Uso: python3 benchmarks/bench_demonio.py [--peticiones 20000] [--conexiones 4]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from cliente import Cliente
+
+def esperar(ruta: str, limite: float = 30):
+    fin = time.time() + limite
+    while time.time() < fin:
+        try:
+            with Cliente(ruta) as c:
+                c.peticion(op='ping')
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("El demonio no arrancó a tiempo")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark del demonio')
+    parser.add_argument('--peticiones', type=int, default=20000)
+    parser.add_argument('--conexiones', type=int, default=4)
+    parser.add_argument('--procesos', type=int, default=5, help='Procesos nuevos a medir para comparar')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copytree(os.path.join(RAIZ, 'TXT'), os.path.join(tmp, 'TXT'))
+        ruta = os.path.join(tmp, 'passcor.sock')
+        entorno = dict(os.environ, PASSCOR_BCRYPT_ROUNDS=os.environ.get('PASSCOR_BCRYPT_ROUNDS', '4'))
+        demonio = subprocess.Popen([sys.executable, os.path.join(RAIZ, 'demonio.py'), '--socket', ruta],
+                                   cwd=tmp, env=entorno, stderr=subprocess.DEVNULL)
+        try:
+            esperar(ruta)
+            por_conexion = args.peticiones // args.conexiones
+
+            def trabajar():
+                with Cliente(ruta) as c:
+                    for i in range(por_conexion):
+                        if i % 2:
+                            c.comun(f"Candidata#{i}xyz")
+                        else:
+                            c.fortaleza(f"Candidata#{i}xyz")
+
+            hilos = [threading.Thread(target=trabajar) for _ in range(args.conexiones)]
+            inicio = time.perf_counter()
+            for h in hilos:
+                h.start()
+            for h in hilos:
+                h.join()
+            duracion = time.perf_counter() - inicio
+        finally:
+            demonio.terminate()
+            demonio.wait()
+
+        total = por_conexion * args.conexiones
+        inicio = time.perf_counter()
+        for _ in range(args.procesos):
+            subprocess.run([sys.executable, '-c',
+                            "import validador; validador.validar_fortaleza('Candidata#1xyz'); "
+                            "validador.es_contraseña_comun('Candidata#1xyz', validador.cargar_indice('TXT/contras.txt'))"],
+                           cwd=tmp, check=True, env=dict(os.environ, PYTHONPATH=RAIZ))
+        por_proceso = (time.perf_counter() - inicio) / args.procesos
+
+    print(f"Demonio:         {total / duracion:.0f} peticiones/s ({args.conexiones} conexiones, "
+          f"{duracion / total * 1e6:.0f} µs por petición)")
+    print(f"Proceso nuevo:   {1 / por_proceso:.1f} comprobaciones/s ({por_proceso * 1000:.0f} ms por proceso)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""Latencia del estimador de intentos sobre un corpus grande de contraseñas.
+
+Uso: python3 benchmarks/bench_estimador.py [--cantidad N] [--corpus archivo.txt]
+
+Sin --corpus se mezclan contraseñas aleatorias del generador con otras construidas a
+partir de los patrones de data.JSON (palabra + año, l33t, paseos de teclado, repeticiones).
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estimador import Estimador, RUTA_DATOS, RUTA_LISTA
+from generador import GeneradorLotes
+
+def corpus_sintetico(cantidad: int, ruta_datos: str):
+    with open(ruta_datos, 'r', encoding='utf-8') as f:
+        palabras = [p for lista in json.load(f)['categorias'].values() for p in lista]
+    aleatorias = GeneradorLotes(16).generar(cantidad // 2)
+    azar = random.Random(0)
+    l33t = str.maketrans('aeios', '43105')
+    formas = (
+        lambda p: p.capitalize() + str(azar.randint(1950, 2025)) + azar.choice('!#$.'),
+        lambda p: p.translate(l33t) + str(azar.randint(0, 99)),
+        lambda p: (p + str(azar.randint(0, 9))) * 2,
+        lambda p: azar.choice(('qwerty', 'asdfgh', 'zxcvbn', '1qaz2wsx')) + p[::-1],
+        lambda p: f"{azar.randint(1, 28):02d}/{azar.randint(1, 12):02d}/{azar.randint(1950, 2025)}{p}",
+    )
+    construidas = [azar.choice(formas)(azar.choice(palabras)) for _ in range(cantidad - len(aleatorias))]
+    return aleatorias + construidas
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark del estimador de intentos')
+    parser.add_argument('--cantidad', type=int, default=100_000)
+    parser.add_argument('--corpus', default=None, help='Archivo con una contraseña por línea')
+    parser.add_argument('--datos', default=RUTA_DATOS)
+    parser.add_argument('--lista', default=RUTA_LISTA)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    estimador = Estimador(args.datos, args.lista)
+    t_carga = time.perf_counter() - inicio
+
+    if args.corpus:
+        with open(args.corpus, 'r', encoding='utf-8', errors='replace') as f:
+            corpus = [linea.rstrip('\n') for linea, _ in zip(f, range(args.cantidad))]
+    else:
+        corpus = corpus_sintetico(args.cantidad, args.datos)
+
+    latencias = []
+    puntuaciones = [0] * 5
+    reloj = time.perf_counter
+    inicio = reloj()
+    for contraseña in corpus:
+        t = reloj()
+        puntuaciones[estimador.estimar(contraseña).puntuacion] += 1
+        latencias.append(reloj() - t)
+    total = reloj() - inicio
+
+    latencias.sort()
+    def p(q: float) -> float:
+        return latencias[min(len(latencias) - 1, int(q * len(latencias)))] * 1e6
+
+    print(f"Diccionario:          {len(estimador)} palabras, cargado en {t_carga * 1000:.0f} ms")
+    print(f"Contraseñas:          {len(corpus)}")
+    print(f"Total:                {total:.2f} s ({len(corpus) / total:,.0f}/s)")
+    print(f"Latencia p50/p99/max: {p(0.5):.0f} / {p(0.99):.0f} / {p(1.0):.0f} µs")
+    print(f"Por debajo de 1 ms:   {sum(1 for l in latencias if l < 1e-3) / len(latencias):.2%}")
+    print(f"Puntuaciones 0-4:     {puntuaciones}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""Tasa de falsos positivos y coste por consulta del filtro de Bloom frente al índice exacto.
+
+Uso: python3 benchmarks/bench_filtro.py [--entradas N] [--consultas M]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filtro import construir_filtro, FiltroBloom, BITS_POR_ENTRADA
+from indice import compilar_indice, IndiceComunes
+
+def medir(funcion, consultas) -> float:
+    inicio = time.perf_counter()
+    for c in consultas:
+        funcion(c)
+    return (time.perf_counter() - inicio) / len(consultas) * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark del filtro de Bloom')
+    parser.add_argument('--entradas', type=int, default=1_000_000)
+    parser.add_argument('--consultas', type=int, default=200_000)
+    parser.add_argument('--bits', type=int, default=BITS_POR_ENTRADA)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        lista = os.path.join(tmp, 'lista.txt')
+        with open(lista, 'w', encoding='utf-8') as f:
+            for i in range(args.entradas):
+                f.write(f"filtrada{i}\n")
+
+        inicio = time.perf_counter()
+        construir_filtro(lista, bits_por_entrada=args.bits)
+        t_filtro = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        compilar_indice(lista)
+        t_indice = time.perf_counter() - inicio
+
+        ausentes = [f"limpia{i}" for i in range(args.consultas)]
+        presentes = [f"filtrada{i}" for i in range(0, args.entradas, max(1, args.entradas // args.consultas))]
+
+        with FiltroBloom(os.path.join(tmp, 'lista.bloom')) as filtro, \
+                IndiceComunes(os.path.join(tmp, 'lista.idx')) as indice:
+            falsos = sum(1 for c in ausentes if c in filtro)
+            tamaño = os.path.getsize(filtro.ruta)
+
+            print(f"Entradas:               {args.entradas}")
+            print(f"Construcción filtro:    {t_filtro:.2f} s")
+            print(f"Construcción índice:    {t_indice:.2f} s")
+            print(f"Tamaño del filtro:      {tamaño / args.entradas:.2f} bytes/entrada "
+                  f"(capacidad {filtro.capacidad}, k={filtro.funciones})")
+            print(f"Falsos positivos:       {falsos / len(ausentes):.4%}")
+            print(f"Filtro, ausentes:       {medir(filtro.__contains__, ausentes):.0f} ns/op")
+            print(f"Filtro, presentes:      {medir(filtro.__contains__, presentes):.0f} ns/op")
+            print(f"Índice, ausentes:       {medir(indice.__contains__, ausentes):.0f} ns/op")
+            indice.filtro = filtro
+            print(f"Filtro+índice, ausentes: {medir(indice.__contains__, ausentes):.0f} ns/op")
+            indice.filtro = None
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
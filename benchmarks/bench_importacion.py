@@ -0,0 +1,71 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""Alta de usuarios uno a uno (una conexión y un commit por fila, como el menú) frente a
+validador.py import (validación en paralelo, pool de bcrypt y executemany por lotes).
+
+Por defecto usa coste 4 de bcrypt (PASSCOR_BCRYPT_ROUNDS) para que se vea el coste de
+todo lo demás; con el coste real ambos caminos quedan limitados por bcrypt, pero la
+importación reparte los hashes entre todos los núcleos.
+
+Uso: python3 benchmarks/bench_importacion.py [--usuarios 5000]
+"""
+
+import argparse
+import io
+import os
+import random
+import sqlite3
+import string
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('PASSCOR_BCRYPT_ROUNDS', '4')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import persistencia
+from hashing import hash_contraseña
+from importacion import importar
+
+def contraseñas(cantidad: int):
+    azar = random.Random(7)
+    simbolos = string.ascii_letters + string.digits + '!#$%&*'
+    return [''.join(azar.choice(simbolos) for _ in range(16)) + 'aA1!' for _ in range(cantidad)]
+
+def una_a_una(ruta_bd: str, filas) -> float:
+    """Lo que hacía guardar_usuario antes del pool: conexión nueva y commit por fila"""
+    inicio = time.perf_counter()
+    for usuario, contraseña in filas:
+        conn = sqlite3.connect(ruta_bd)
+        conn.execute(persistencia.ESQUEMA)
+        try:
+            conn.execute("INSERT INTO usuarios (usuario, hash_contraseña) VALUES (?, ?)",
+                         (usuario, hash_contraseña(contraseña).decode('utf-8')))
+            conn.commit()
+        finally:
+            conn.close()
+    return time.perf_counter() - inicio
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de la importación de usuarios')
+    parser.add_argument('--usuarios', type=int, default=5000)
+    args = parser.parse_args()
+
+    filas = [(f"usuario{i}", c) for i, c in enumerate(contraseñas(args.usuarios))]
+    csv_texto = 'usuario,contraseña\n' + ''.join(f"{u},{c}\n" for u, c in filas)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t_uno = una_a_una(os.path.join(tmp, 'uno.db'), filas)
+
+        pool = persistencia.PoolConexiones(os.path.join(tmp, 'lote.db'))
+        resumen = importar(io.StringIO(csv_texto), io.StringIO(), pool=pool)
+        pool.cerrar()
+
+    print(f"Usuarios:            {args.usuarios} (coste bcrypt {os.environ['PASSCOR_BCRYPT_ROUNDS']})")
+    print(f"Uno a uno:           {t_uno:.2f} s ({args.usuarios / t_uno:.0f} usuarios/s)")
+    print(f"validador.py import: {resumen['segundos']:.2f} s ({resumen['por_segundo']:.0f} usuarios/s, "
+          f"{resumen['creados']} creados, {resumen['rechazados']} rechazados)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
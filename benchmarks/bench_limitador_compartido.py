@@ -0,0 +1,81 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""Prueba de estrés multiproceso del LimitadorSQLite: latencia por intento y cero actualizaciones perdidas.
+
+Cada proceso registra fallos sobre el mismo conjunto de claves. El intervalo del GCRA se
+elige mucho mayor que la duración de la prueba, así que el TAT de cada clave solo avanza
+un intervalo por fallo y de él se puede recuperar exactamente cuántos fallos recibió.
+
+Uso: python3 benchmarks/bench_limitador_compartido.py [--procesos 4] [--intentos 20000] [--claves 100]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from limitador import LimitadorSQLite
+
+INTERVALO = 10_000.0
+
+def crear(ruta: str) -> LimitadorSQLite:
+    return LimitadorSQLite(ruta, max_intentos=10 ** 9, ventana_segundos=INTERVALO * 10 ** 9,
+                           limpieza_cada=10 ** 12)
+
+def trabajador(ruta: str, claves: int, intentos: int, semilla: int, salida):
+    limitador = crear(ruta)
+    aleatorio = random.Random(semilla)
+    enviados = [0] * claves
+    inicio = time.perf_counter()
+    for _ in range(intentos):
+        k = aleatorio.randrange(claves)
+        limitador.registrar_intento(f"clave{k}", False)
+        enviados[k] += 1
+    salida.put((enviados, time.perf_counter() - inicio))
+    limitador.cerrar()
+
+def main():
+    parser = argparse.ArgumentParser(description='Estrés multiproceso del limitador compartido')
+    parser.add_argument('--procesos', type=int, default=4)
+    parser.add_argument('--intentos', type=int, default=20000, help='Intentos por proceso')
+    parser.add_argument('--claves', type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, 'limites.db')
+        crear(ruta)._conexion()
+        inicio = time.time()
+        cola = multiprocessing.Queue()
+        procesos = [multiprocessing.Process(target=trabajador, args=(ruta, args.claves, args.intentos, i, cola))
+                    for i in range(args.procesos)]
+        for p in procesos:
+            p.start()
+        resultados = [cola.get() for _ in procesos]
+        for p in procesos:
+            p.join()
+
+        esperados = [sum(r[0][k] for r in resultados) for k in range(args.claves)]
+        limitador = crear(ruta)
+        perdidos = 0
+        for k in range(args.claves):
+            fila = limitador._leer(f"clave{k}")
+            registrados = int((fila[0] - inicio) // INTERVALO) if fila else 0
+            perdidos += abs(esperados[k] - registrados)
+        limitador.cerrar()
+
+    total = args.procesos * args.intentos
+    segundos = max(r[1] for r in resultados)
+    print(f"Procesos:               {args.procesos}")
+    print(f"Intentos totales:       {total}")
+    print(f"Latencia media:         {sum(r[1] for r in resultados) / total * 1e6:.1f} µs/intento")
+    print(f"Rendimiento agregado:   {total / segundos:.0f} intentos/s")
+    print(f"Actualizaciones perdidas: {perdidos}")
+    return 1 if perdidos else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
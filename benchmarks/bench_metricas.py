@@ -0,0 +1,96 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""Coste de la instrumentación por evento, con las métricas activas y desactivadas.
+
+Mide un incremento de contador, una observación de histograma y una llamada a través de
+metricas.cronometrado frente a la misma función sin decorar, y el coste añadido a
+RateLimiter.register_attempt. Termina con código 1 si algún evento cuesta más del límite.
+
+Uso: python3 benchmarks/bench_metricas.py [--eventos 1000000] [--limite-ns 1000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import metricas
+from validador import RateLimiter
+
+def por_evento(funcion, eventos: int) -> float:
+    """ns por llamada a funcion, descontando el coste del propio bucle"""
+    def vacio():
+        pass
+    mejor = float('inf')
+    for _ in range(3):
+        inicio = time.perf_counter()
+        for _ in range(eventos):
+            funcion()
+        medio = time.perf_counter()
+        for _ in range(eventos):
+            vacio()
+        mejor = min(mejor, (medio - inicio) - (time.perf_counter() - medio))
+    return max(mejor, 0.0) / eventos * 1e9
+
+def medir_limitador(intentos: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        limitador = RateLimiter(max_attempts=10 ** 9, lock_file=os.path.join(tmp, 'intentos.json'))
+        claves = [f"10.0.{i >> 8 & 255}.{i & 255}" for i in range(1000)]
+        inicio = time.perf_counter()
+        for n in range(intentos):
+            limitador.register_attempt('bench', n % 10 == 0, claves[n % 1000])
+        duracion = time.perf_counter() - inicio
+        limitador._log.close()
+    return duracion / intentos * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de la instrumentación')
+    parser.add_argument('--eventos', type=int, default=1_000_000)
+    parser.add_argument('--limite-ns', type=float, default=1000, help='Coste máximo por evento en ns (por defecto: 1000)')
+    args = parser.parse_args()
+
+    registro = metricas.Registro()
+    contador = registro.contador('bench_total', 'Contador de prueba')
+    hist = registro.histograma('bench_segundos', 'Histograma de prueba')
+
+    def funcion():
+        pass
+    decorada = metricas.cronometrado(hist)(funcion)
+
+    casos = {
+        "Contador.incrementar": (lambda: contador.incrementar(), None),
+        "Histograma.observar": (lambda: hist.observar(0.003), None),
+        "cronometrado (añadido)": (decorada, funcion),
+    }
+    excedidos = []
+    print(f"{'evento':<26} {'activas ns':>11} {'apagadas ns':>12}")
+    for nombre, (llamada, base) in casos.items():
+        tiempos = []
+        for activas in (True, False):
+            metricas.activar(activas)
+            coste = por_evento(llamada, args.eventos)
+            if base is not None:
+                coste -= por_evento(base, args.eventos)
+            tiempos.append(max(coste, 0.0))
+        print(f"{nombre:<26} {tiempos[0]:>11.1f} {tiempos[1]:>12.1f}")
+        if tiempos[0] > args.limite_ns:
+            excedidos.append(nombre)
+
+    intentos = max(1000, args.eventos // 10)
+    metricas.activar(True)
+    con = medir_limitador(intentos)
+    metricas.activar(False)
+    sin = medir_limitador(intentos)
+    metricas.activar(True)
+    print(f"\nRateLimiter.register_attempt: {con:.0f} ns con métricas, {sin:.0f} ns sin ellas "
+          f"({con - sin:+.0f} ns)")
+
+    for nombre in excedidos:
+        print(f"Demasiado caro: {nombre} supera {args.limite_ns:.0f} ns por evento", file=sys.stderr)
+    return 1 if excedidos else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""Coste por intento del RateLimiter y del LimitadorGCRA según el número de claves que siguen.
+
+Uso: python3 benchmarks/bench_rate_limiter.py [--claves 10 1000 100000 1000000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validador import RateLimiter
+from limitador import LimitadorGCRA
+
+def medir(claves: int, intentos: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        # Sin bloqueos para que el benchmark no mida los mensajes por pantalla
+        limitador = RateLimiter(max_attempts=10 ** 9, lock_file=os.path.join(tmp, 'intentos.json'))
+        for i in range(claves):
+            limitador.register_attempt('bench', False, f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}")
+
+        muestra = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in
+                   (random.randrange(claves) for _ in range(intentos))]
+        inicio = time.perf_counter()
+        for n, clave in enumerate(muestra):
+            limitador.register_attempt('bench', n % 10 == 0, clave)
+        duracion = time.perf_counter() - inicio
+        if limitador._log is not None:
+            limitador._log.close()
+    return duracion / intentos * 1e6
+
+def medir_gcra(claves: int, intentos: int) -> float:
+    limitador = LimitadorGCRA(max_intentos=10 ** 9, max_claves=max(claves, 1))
+    for i in range(claves):
+        limitador.registrar_intento(f"ip:{i}", False)
+    muestra = [f"ip:{random.randrange(claves)}" for _ in range(intentos)]
+    inicio = time.perf_counter()
+    for n, clave in enumerate(muestra):
+        limitador.registrar_intento(clave, n % 10 == 0)
+    return (time.perf_counter() - inicio) / intentos * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark del RateLimiter')
+    parser.add_argument('--claves', type=int, nargs='+', default=[10, 1000, 100_000, 1_000_000])
+    parser.add_argument('--intentos', type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'claves':>10}  {'RateLimiter µs':>14}  {'GCRA µs':>8}")
+    for claves in args.claves:
+        print(f"{claves:>10}  {medir(claves, args.intentos):>14.2f}  {medir_gcra(claves, args.intentos):>8.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
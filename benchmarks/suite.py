@@ -0,0 +1,280 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""Suite de benchmarks de los caminos calientes, comparada con la referencia guardada.
+
+Mide cada operación a varias escalas (tamaño de la lista de comunes, claves que sigue el
+limitador, tamaño de lote y coste de bcrypt) y emite los resultados en JSON por stdout.
+Cada medida es el mínimo de varias repeticiones, cada una lo bastante larga para que el
+reloj no cuente. Si alguna empeora respecto a la referencia más de la tolerancia,
+termina con código 1.
+
+La referencia se guarda por máquina (intérprete, arquitectura, procesador y núcleos): la
+E/S de SQLite y del registro del limitador o NumPy no escalan como Python puro, así que
+solo se compara con medidas de la misma máquina. En una máquina sin referencia se avisa
+y no se compara. Dentro de la misma máquina, una vuelta de un bucle de Python puro sirve
+de calibración: si la máquina va más lenta que al grabar la referencia, los límites se
+escalan en la misma proporción.
+
+Uso: python3 benchmarks/suite.py [--rapida] [--solo validar] [--guardar] [--json resultados.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import string
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, List, Tuple
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REFERENCIA = os.path.join(RAIZ, 'benchmarks', 'suite_baseline.json')
+sys.path.insert(0, RAIZ)
+
+import hashing
+import metricas
+import persistencia
+from generador import generar_contraseña, calcular_entropia
+from indice import abrir_indice
+from validador import RateLimiter, validar_fortaleza, es_contraseña_comun, verificar_contraseña
+from hashing import hash_contraseña
+
+# Escalas de cada familia; --rapida usa solo las primeras
+ESCALAS = {
+    "longitud": [12, 32, 128],
+    "lista": [1_000, 100_000, 1_000_000],
+    "costo": [4, 8, 10],
+    "claves": [10, 10_000, 100_000],
+    "lote": [100, 1_000, 10_000],
+}
+# Tiempo mínimo de cada repetición
+DURACION_MINIMA = 0.05
+
+# Un caso: (nombre, función que hace ops operaciones, ops)
+Caso = Tuple[str, Callable[[], object], int]
+
+def _contraseñas(cantidad: int, longitud: int, semilla: int) -> List[str]:
+    azar = random.Random(semilla)
+    simbolos = string.ascii_letters + string.digits + '!@#$%^&*'
+    return [''.join(azar.choice(simbolos) for _ in range(longitud)) for _ in range(cantidad)]
+
+def casos_referencia(escalas: Dict[str, List[int]], tmp: str) -> Iterator[Caso]:
+    yield "referencia_python", lambda: sum(range(1000)), 1
+
+def casos_generador(escalas: Dict[str, List[int]], tmp: str) -> Iterator[Caso]:
+    for longitud in escalas["longitud"]:
+        muestra = _contraseñas(100, longitud, longitud)
+        yield f"generar_contraseña[longitud={longitud}]", lambda n=longitud: [generar_contraseña(n) for _ in range(100)], 100
+        yield f"calcular_entropia[longitud={longitud}]", lambda m=muestra: [calcular_entropia(c) for c in m], 100
+
+def casos_validador(escalas: Dict[str, List[int]], tmp: str) -> Iterator[Caso]:
+    for longitud in escalas["longitud"]:
+        muestra = _contraseñas(100, longitud, longitud)
+        yield f"validar_fortaleza[longitud={longitud}]", lambda m=muestra: [validar_fortaleza(c) for c in m], 100
+
+def _lista_comunes(tmp: str, entradas: int) -> Tuple[str, List[str]]:
+    """Lista sintética de entradas contraseñas y 1000 consultas, mitad en la lista y mitad no"""
+    ruta = os.path.join(tmp, f'lista_{entradas}.txt')
+    lista = _contraseñas(entradas, 10, entradas)
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lista))
+        f.write('\n')
+    azar = random.Random(1)
+    consultas = [azar.choice(lista) for _ in range(500)] + _contraseñas(500, 11, 2)
+    azar.shuffle(consultas)
+    return ruta, consultas
+
+def casos_comunes(escalas: Dict[str, List[int]], tmp: str) -> Iterator[Caso]:
+    for entradas in escalas["lista"]:
+        ruta, consultas = _lista_comunes(tmp, entradas)
+        indice = abrir_indice(ruta, usar_filtro=True)
+        yield (f"es_contraseña_comun[lista={entradas}]",
+               lambda i=indice, q=consultas: [es_contraseña_comun(c, i) for c in q], len(consultas))
+
+def casos_hash(escalas: Dict[str, List[int]], tmp: str) -> Iterator[Caso]:
+    for costo in escalas["costo"]:
+        yield f"hash_contraseña[costo={costo}]", lambda c=costo: hash_contraseña('Clave#Bench2024!', c), 1
+
+def casos_verificacion(escalas: Dict[str, List[int]], tmp: str) -> Iterator[Caso]:
+    # verificar_contraseña usa el pool de usuarios.db del directorio actual, que es tmp
+    persistencia.inicializar(persistencia.obtener_pool())
+    for costo in escalas["costo"]:
+        usuario = f"bench{costo}"
+        persistencia.insertar_usuario(persistencia.obtener_pool(), usuario,
+                                      hash_contraseña('Clave#Bench2024!', costo).decode('utf-8'))
+
+        def verificar(u=usuario, c=costo):
+            # Con el coste objetivo igual al del hash no se rehashea, que es el caso normal
+            hashing._costo_objetivo = c
+            return verificar_contraseña(u, 'Clave#Bench2024!')
+        yield f"verificar_contraseña[costo={costo}]", verificar, 1
+
+def casos_limitador(escalas: Dict[str, List[int]], tmp: str) -> Iterator[Caso]:
+    for claves in escalas["claves"]:
+        limitador = RateLimiter(max_attempts=10 ** 9, lock_file=os.path.join(tmp, f'intentos_{claves}.json'))
+        ips = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(claves)]
+        for ip in ips:
+            limitador.register_attempt('bench', False, ip)
+        azar = random.Random(claves)
+        muestra = [(azar.choice(ips), n % 10 == 0) for n in range(1000)]
+        yield (f"RateLimiter.register_attempt[claves={claves}]",
+               lambda l=limitador, m=muestra: [l.register_attempt('bench', ok, ip) for ip, ok in m], len(muestra))
+
+def casos_auditoria(escalas: Dict[str, List[int]], tmp: str) -> Iterator[Caso]:
+    import auditoria
+    import estimador
+
+    # La auditoría aplica las reglas del alta: el estimador, con los diccionarios del proyecto
+    # y no con los del directorio temporal, que no existen
+    estimador._estimador = estimador.Estimador(os.path.join(RAIZ, 'data.JSON'),
+                                               os.path.join(RAIZ, 'TXT', 'contras.txt'))
+
+    ruta, _ = _lista_comunes(tmp, escalas["lista"][min(1, len(escalas["lista"]) - 1)])
+    # Sin caché, para medir la evaluación y no los aciertos
+    auditoria._iniciar_trabajador(ruta, 0)
+    for lote in escalas["lote"]:
+        muestra = _contraseñas(lote, 14, lote)
+        yield f"auditar_lote[lote={lote}]", lambda m=muestra: auditoria.auditar_lote(1, m), lote
+
+def casos_metricas(escalas: Dict[str, List[int]], tmp: str) -> Iterator[Caso]:
+    registro = metricas.Registro()
+    contador = registro.contador('bench_total', 'Contador de prueba')
+    hist = registro.histograma('bench_segundos', 'Histograma de prueba')
+    yield "metricas.Contador.incrementar", lambda: [contador.incrementar() for _ in range(1000)], 1000
+    yield "metricas.Histograma.observar", lambda: [hist.observar(0.003) for _ in range(1000)], 1000
+
+def casos_estadisticas(escalas: Dict[str, List[int]], tmp: str) -> Iterator[Caso]:
+    # numpy es opcional; sin él no hay casos que medir
+    try:
+        from estadisticas import estadisticas_lote
+    except ImportError:
+        return
+    for lote in escalas["lote"]:
+        muestra = _contraseñas(lote, 16, lote)
+        yield f"estadisticas_lote[lote={lote}]", lambda m=muestra: estadisticas_lote(m), lote
+
+CASOS = [casos_referencia, casos_generador, casos_validador, casos_comunes, casos_hash,
+         casos_verificacion, casos_limitador, casos_auditoria, casos_metricas, casos_estadisticas]
+
+def huella_maquina() -> str:
+    """Identifica la máquina de una referencia; el nombre del equipo no, que cambia en cada contenedor"""
+    modelo = platform.processor()
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as f:
+            for linea in f:
+                if linea.startswith('model name'):
+                    modelo = linea.split(':', 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    return (f"{platform.python_implementation()} {platform.python_version()} {platform.system()} "
+            f"{platform.machine()} {modelo or 'desconocido'} x{os.cpu_count()}")
+
+def cargar_referencias() -> Dict[str, Dict[str, float]]:
+    if not os.path.exists(REFERENCIA):
+        return {}
+    with open(REFERENCIA, encoding='utf-8') as f:
+        return json.load(f)
+
+def medir(funcion: Callable[[], object], ops: int, repeticiones: int) -> float:
+    """Mínimo en ns por operación; cada repetición da las vueltas que quepan en DURACION_MINIMA.
+
+    El mínimo es la repetición menos contaminada por el resto de la máquina: el ruido solo
+    puede sumar tiempo, nunca restarlo.
+    """
+    inicio = time.perf_counter()
+    funcion()
+    una = time.perf_counter() - inicio
+    vueltas = max(1, int(DURACION_MINIMA / una) if una > 0 else 1)
+    muestras = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for _ in range(vueltas):
+            funcion()
+        muestras.append((time.perf_counter() - inicio) / (vueltas * ops))
+    return min(muestras) * 1e9
+
+def ejecutar(escalas: Dict[str, List[int]], repeticiones: int, solo: str = '') -> Dict[str, float]:
+    resultados = {}
+    anterior = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='passcor-bench-') as tmp:
+        os.chdir(tmp)
+        try:
+            for familia in CASOS:
+                for nombre, funcion, ops in familia(escalas, tmp):
+                    if solo and solo not in nombre and nombre != "referencia_python":
+                        continue
+                    resultados[nombre] = round(medir(funcion, ops, repeticiones), 1)
+                    print(f"{nombre:<45} {resultados[nombre]:>14,.1f} ns/op", file=sys.stderr)
+        finally:
+            for pool in list(persistencia._pools.values()):
+                pool.cerrar()
+            persistencia._pools.clear()
+            os.chdir(anterior)
+    return resultados
+
+def comparar(resultados: Dict[str, float], referencia: Dict[str, float], tolerancia: float) -> List[str]:
+    """Medidas que superan la referencia, escalada por la calibración, en más de la tolerancia"""
+    escala = max(resultados["referencia_python"] / referencia["referencia_python"], 1.0)
+    regresiones = []
+    for nombre, valor in resultados.items():
+        if nombre == "referencia_python" or nombre not in referencia:
+            continue
+        limite = referencia[nombre] * escala * (1 + tolerancia)
+        if valor > limite:
+            regresiones.append(f"{nombre}: {valor:,.1f} ns/op (referencia {referencia[nombre]:,.1f} ns/op)")
+    return regresiones
+
+def main():
+    parser = argparse.ArgumentParser(description='Suite de benchmarks de Passcor')
+    parser.add_argument('--rapida', action='store_true', help='Solo las dos escalas menores de cada familia')
+    parser.add_argument('--solo', default='', help='Medir solo los casos cuyo nombre contiene este texto')
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--tolerancia', type=float, default=0.5, help='Empeoramiento permitido (0.5 = 50%%)')
+    parser.add_argument('--json', help='Guardar también los resultados en este archivo')
+    parser.add_argument('--guardar', action='store_true', help='Guardar las medidas como nueva referencia')
+    args = parser.parse_args()
+
+    escalas = {familia: valores[:2] for familia, valores in ESCALAS.items()} if args.rapida else ESCALAS
+    resultados = ejecutar(escalas, args.repeticiones, args.solo)
+    huella = huella_maquina()
+    informe = {
+        "entorno": {"python": platform.python_version(), "plataforma": platform.platform(),
+                    "nucleos": os.cpu_count(), "maquina": huella},
+        "resultados_ns_op": resultados,
+    }
+    print(json.dumps(informe, indent=2, ensure_ascii=False))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(informe, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+
+    referencias = cargar_referencias()
+    referencia = referencias.get(huella)
+    if args.guardar:
+        # Se mezcla con la referencia de esta máquina para que --solo o --rapida no borren el resto
+        referencia = referencias.setdefault(huella, {})
+        if "referencia_python" in referencia:
+            # Las medidas nuevas se expresan en la escala de la calibración guardada
+            factor = referencia["referencia_python"] / resultados["referencia_python"]
+            resultados = {nombre: round(valor * factor, 1) for nombre, valor in resultados.items()
+                          if nombre != "referencia_python"}
+        referencia.update(resultados)
+        with open(REFERENCIA, 'w', encoding='utf-8') as f:
+            json.dump(referencias, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        return 0
+    if referencia is None:
+        print(f"Advertencia: No hay referencia para esta máquina ({huella}); "
+              f"grábala con --guardar para poder comparar", file=sys.stderr)
+        return 0
+
+    regresiones = comparar(resultados, referencia, args.tolerancia)
+    for r in regresiones:
+        print(f"Regresión: {r}", file=sys.stderr)
+    return 1 if regresiones else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+CAPACIDAD = 100_000
+
+T = TypeVar('T')
+
+class CacheVeredictos:
+    """Caché LRU acotada, con caducidad opcional, de veredictos sobre contraseñas.
+
+    Las claves son un MAC (BLAKE2b con clave, equivalente a HMAC y más rápido) de la
+    contraseña con una clave aleatoria que solo vive en este objeto: la caché nunca
+    guarda texto plano y sus claves no sirven para comprobar contraseñas fuera del
+    proceso. No es segura entre hilos; cada proceso o bucle usa la suya.
+    """
+
+    def __init__(self, capacidad: int = CAPACIDAD, ttl: Optional[float] = None, clave: Optional[bytes] = None):
+        if capacidad < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1")
+        self.capacidad = capacidad
+        self.ttl = ttl
+        self._clave = clave or os.urandom(32)
+        self._entradas: "OrderedDict[bytes, Tuple[float, object]]" = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.caducados = 0
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def _clave_de(self, contraseña: str) -> bytes:
+        return hashlib.blake2b(contraseña.encode('utf-8', 'surrogatepass'), key=self._clave, digest_size=16).digest()
+
+    def obtener(self, contraseña: str, calcular: Callable[[], T]) -> T:
+        """Devuelve el veredicto guardado o lo calcula con calcular() y lo guarda"""
+        clave = self._clave_de(contraseña)
+        entrada = self._entradas.get(clave)
+        if entrada is not None:
+            if self.ttl is None or entrada[0] > time.monotonic():
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return entrada[1]
+            del self._entradas[clave]
+            self.caducados += 1
+        self.fallos += 1
+        valor = calcular()
+        self._guardar(clave, valor)
+        return valor
+
+    def _guardar(self, clave: bytes, valor: object):
+        expira = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        self._entradas[clave] = (expira, valor)
+        if len(self._entradas) > self.capacidad:
+            self._entradas.popitem(last=False)
+            self.desalojos += 1
+
+    def limpiar(self):
+        self._entradas.clear()
+
+    def estadisticas(self) -> Dict[str, int]:
+        return {"entradas": len(self._entradas), "capacidad": self.capacidad, "aciertos": self.aciertos,
+                "fallos": self.fallos, "desalojos": self.desalojos, "caducados": self.caducados}
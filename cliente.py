@@ -0,0 +1,98 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import argparse
+import getpass
+import json
+import socket
+import sys
+from typing import Optional
+
+SOCKET_POR_DEFECTO = 'passcor.sock'
+
+class Cliente:
+    """Cliente mínimo del demonio (demonio.py): solo usa la biblioteca estándar y arranca al instante"""
+
+    def __init__(self, socket_unix: str = SOCKET_POR_DEFECTO, puerto: Optional[int] = None, timeout: float = 30):
+        if puerto is not None:
+            self._sock = socket.create_connection(('127.0.0.1', puerto), timeout=timeout)
+        else:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.settimeout(timeout)
+            self._sock.connect(socket_unix)
+        self._lector = self._sock.makefile('rb')
+
+    def peticion(self, **datos) -> dict:
+        self._sock.sendall(json.dumps(datos).encode('utf-8') + b'\n')
+        linea = self._lector.readline()
+        if not linea:
+            raise ConnectionError("El demonio cerró la conexión")
+        return json.loads(linea)
+
+    def fortaleza(self, pw: str) -> dict:
+        return self.peticion(op="fortaleza", pw=pw)
+
+    def comun(self, pw: str) -> dict:
+        return self.peticion(op="comun", pw=pw)
+
+    def login(self, usuario: str, pw: str, ip: Optional[str] = None) -> dict:
+        return self.peticion(op="login", usuario=usuario, pw=pw, ip=ip)
+
+    def registro(self, usuario: str, pw: str) -> dict:
+        return self.peticion(op="registro", usuario=usuario, pw=pw)
+
+    def cerrar(self):
+        self._lector.close()
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Consulta al demonio de Passcor. La contraseña se lee de stdin para que no aparezca en ps.'
+    )
+    parser.add_argument('operacion', choices=['fortaleza', 'comun', 'login', 'registro', 'ping', 'estado', 'metricas'])
+    parser.add_argument('usuario', nargs='?', help='Usuario (login y registro)')
+    parser.add_argument('--socket', default=SOCKET_POR_DEFECTO)
+    parser.add_argument('--puerto', type=int, default=None)
+    parser.add_argument('--prometheus', action='store_true', help='Con metricas, imprimir el formato de texto de Prometheus')
+    args = parser.parse_args(argv)
+
+    if args.operacion in ('login', 'registro') and not args.usuario:
+        parser.error(f"{args.operacion} necesita un usuario")
+
+    try:
+        with Cliente(args.socket, args.puerto) as cliente:
+            if args.operacion in ('ping', 'estado'):
+                respuesta = cliente.peticion(op=args.operacion)
+            elif args.operacion == 'metricas':
+                respuesta = cliente.peticion(op='metricas', formato='prometheus' if args.prometheus else 'json')
+                if args.prometheus and respuesta.get("ok"):
+                    sys.stdout.write(respuesta["prometheus"])
+                    return 0
+            else:
+                pw = getpass.getpass("Contraseña: ") if sys.stdin.isatty() else sys.stdin.readline().rstrip('\r\n')
+                if args.operacion in ('login', 'registro'):
+                    respuesta = getattr(cliente, args.operacion)(args.usuario, pw)
+                else:
+                    respuesta = getattr(cliente, args.operacion)(pw)
+    except OSError as e:
+        print(f"Error: No se pudo contactar con el demonio: {e}", file=sys.stderr)
+        return 2
+
+    print(json.dumps(respuesta, ensure_ascii=False))
+    # Código de salida útil en scripts: 0 si la contraseña/credencial es aceptable
+    if not respuesta.get("ok"):
+        return 2
+    if args.operacion == 'comun':
+        return 1 if respuesta["comun"] or respuesta.get("contiene") else 0
+    for campo in ('segura', 'valido', 'creado'):
+        if campo in respuesta:
+            return 0 if respuesta[campo] else 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
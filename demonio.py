@@ -0,0 +1,141 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+from typing import Optional, Tuple
+
+import metricas
+from autenticacion import AutenticadorAsync
+from cache_veredictos import CacheVeredictos
+from limitador import limitador_compartido
+from validador import (cargar_indice, cargar_automata, cargar_rangos, motivo_rechazo, es_contraseña_comun,
+                       contiene_contraseña_comun)
+
+SOCKET_POR_DEFECTO = 'passcor.sock'
+
+class Demonio:
+    """Servidor de larga duración que mantiene en caliente el índice, el pool de SQLite y el limitador.
+
+    Habla JSON por líneas (una petición y una respuesta por línea) sobre un socket Unix o
+    TCP en localhost. Cada conexión atiende sus peticiones en orden; las conexiones
+    distintas se atienden a la vez.
+    """
+
+    def __init__(self, ruta_lista: str = 'TXT/contras.txt', ruta_bd: str = 'usuarios.db',
+                 ruta_limites: Optional[str] = None, ruta_rangos: str = 'TXT/rangos'):
+        self.lista = cargar_indice(ruta_lista)
+        self.automata = cargar_automata(ruta_lista)
+        self.rangos = cargar_rangos(ruta_rangos)
+        self.cache = CacheVeredictos()
+        # Con ruta_limites varios demonios (o el menú) comparten los fallos a través de SQLite
+        self.api = AutenticadorAsync(ruta_bd, limitador=limitador_compartido(ruta_limites),
+                                     lista_comunes=self.lista, automata=self.automata, rangos=self.rangos)
+
+    def veredicto(self, pw: str) -> Tuple[bool, bool, Optional[str]]:
+        """(común, contiene una común, motivo de rechazo): las mismas reglas que registro"""
+        def calcular() -> Tuple[bool, bool, Optional[str]]:
+            comun = es_contraseña_comun(pw, self.lista, self.rangos)
+            motivo = motivo_rechazo(pw, automata=self.automata, comun=comun)
+            return comun, contiene_contraseña_comun(pw, self.automata), motivo
+        return self.cache.obtener(pw, calcular)
+
+    async def procesar(self, peticion: dict) -> dict:
+        op = peticion.get("op")
+        if op == "ping":
+            return {"ok": True}
+        if op == "estado":
+            return {"ok": True, "cache": self.cache.estadisticas()}
+        if op == "metricas":
+            if peticion.get("formato") == "prometheus":
+                return {"ok": True, "prometheus": metricas.REGISTRO.prometheus()}
+            return {"ok": True, "metricas": metricas.REGISTRO.instantanea()}
+        if op in ("fortaleza", "comun"):
+            comun, contiene, motivo = self.veredicto(peticion["pw"])
+            respuesta = {"ok": True, "segura": motivo is None, "mensaje": motivo or "Contraseña segura"}
+            if op == "comun":
+                respuesta.update(comun=comun, contiene=contiene)
+            return respuesta
+        if op == "login":
+            valido = await self.api.verify(peticion["usuario"], peticion["pw"], peticion.get("ip"))
+            return {"ok": True, "valido": valido}
+        if op == "registro":
+            creado, mensaje = await self.api.register(peticion["usuario"], peticion["pw"])
+            return {"ok": True, "creado": creado, "mensaje": mensaje}
+        return {"ok": False, "error": f"Operación desconocida: {op}"}
+
+    async def atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                try:
+                    respuesta = await self.procesar(json.loads(linea))
+                except (ValueError, KeyError, TypeError) as e:
+                    respuesta = {"ok": False, "error": f"Petición no válida: {e}"}
+                except Exception as e:
+                    respuesta = {"ok": False, "error": f"Error interno: {e}"}
+                escritor.write(json.dumps(respuesta, ensure_ascii=False).encode('utf-8') + b'\n')
+                await escritor.drain()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            escritor.close()
+
+    async def servir(self, socket_unix: Optional[str] = SOCKET_POR_DEFECTO, puerto: Optional[int] = None):
+        await self.api.inicializar()
+        if puerto is not None:
+            servidor = await asyncio.start_server(self.atender, '127.0.0.1', puerto)
+            direccion = f"127.0.0.1:{puerto}"
+        else:
+            if os.path.exists(socket_unix):
+                os.unlink(socket_unix)
+            # El socket nace ya con permisos 0600: con chmod después del bind habría un momento
+            # en que otros usuarios podrían conectarse
+            mascara = os.umask(0o177)
+            try:
+                servidor = await asyncio.start_unix_server(self.atender, socket_unix)
+            finally:
+                os.umask(mascara)
+            direccion = socket_unix
+        print(f"Passcor escuchando en {direccion}", file=sys.stderr)
+        parada = asyncio.Event()
+        for señal in (signal.SIGINT, signal.SIGTERM):
+            try:
+                asyncio.get_running_loop().add_signal_handler(señal, parada.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+        try:
+            async with servidor:
+                await parada.wait()
+        finally:
+            await self.api.cerrar()
+            if puerto is None and os.path.exists(socket_unix):
+                os.unlink(socket_unix)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Demonio de validación de Passcor')
+    parser.add_argument('--socket', default=SOCKET_POR_DEFECTO, help=f'Socket Unix (por defecto: {SOCKET_POR_DEFECTO})')
+    parser.add_argument('--puerto', type=int, default=None, help='Escuchar en TCP 127.0.0.1:PUERTO en lugar del socket Unix')
+    parser.add_argument('--lista', default='TXT/contras.txt', help='Lista de contraseñas comunes')
+    parser.add_argument('--bd', default='usuarios.db', help='Base de datos de usuarios')
+    parser.add_argument('--limites', default=os.environ.get('PASSCOR_LIMITES'),
+                        help='Base de datos SQLite de intentos compartida entre procesos (por defecto: '
+                             'PASSCOR_LIMITES; sin ella, limitador en memoria)')
+    parser.add_argument('--rangos', default='TXT/rangos',
+                        help='Directorio de rangos SHA-1 (formato HIBP) a consultar además de la lista')
+    args = parser.parse_args(argv)
+
+    demonio = Demonio(args.lista, args.bd, args.limites, args.rangos)
+    try:
+        asyncio.run(demonio.servir(args.socket, args.puerto))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import argparse
+import json
+import sys
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from analizador import TABLA_CLASES
+
+# numpy es opcional: solo lo necesita este módulo
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Celdas (filas x ancho) que se procesan a la vez; acota la memoria de cada bloque
+CELDAS_POR_BLOQUE = 1 << 22
+# Los mismos umbrales que ascii.mostrar_estadisticas
+UMBRAL_MODERADA = 40
+UMBRAL_FUERTE = 80
+ANCHO_CUBETA_ENTROPIA = 10
+# Los percentiles salen de un histograma de cubetas de RESOLUCION_ENTROPIA bits (error de
+# media cubeta como mucho); por encima de MAXIMA_ENTROPIA_PERCENTILES se saturan. Son unos
+# 1,6 MB fijos, sea cual sea el número de contraseñas
+RESOLUCION_ENTROPIA = 0.01
+MAXIMA_ENTROPIA_PERCENTILES = 2048
+CLASES = (('mayusculas', b'M'), ('minusculas', b'm'), ('numeros', b'd'), ('especiales', b'e'))
+
+class Columnas(NamedTuple):
+    """Estadísticas de cada contraseña de un lote, una columna de numpy por campo"""
+    entropia: 'np.ndarray'
+    longitud: 'np.ndarray'
+    mayusculas: 'np.ndarray'
+    minusculas: 'np.ndarray'
+    numeros: 'np.ndarray'
+    especiales: 'np.ndarray'
+
+def _requerir_numpy():
+    if np is None:
+        raise ImportError("estadisticas.py necesita numpy; instálalo con: pip install numpy")
+
+def matriz_caracteres(contraseñas: Sequence[str]) -> 'np.ndarray':
+    """Matriz filas x longitud máxima con el código de cada carácter, rellena con ceros.
+
+    Si todos los caracteres son latin-1 es una matriz de bytes (uint8); si no, de puntos
+    de código (uint32).
+    """
+    _requerir_numpy()
+    if not contraseñas:
+        return np.zeros((0, 0), dtype=np.uint8)
+    # El tipo str de numpy guarda cada cadena en UCS-4 de ancho fijo: verla como uint32
+    # da los puntos de código sin recorrer los caracteres en Python
+    texto = np.array(contraseñas, dtype=str)
+    ancho = texto.dtype.itemsize // 4
+    if ancho == 0:
+        return np.zeros((len(contraseñas), 0), dtype=np.uint8)
+    puntos = texto.view(np.uint32).reshape(len(contraseñas), ancho)
+    return puntos.astype(np.uint8) if puntos.max() < 256 else puntos
+
+def _bloques(longitudes: 'np.ndarray') -> Iterator['np.ndarray']:
+    """Índices de filas agrupadas por longitud parecida, de como mucho CELDAS_POR_BLOQUE celdas.
+
+    Así una sola contraseña muy larga no ensancha la matriz de todo el lote.
+    """
+    orden = np.argsort(longitudes, kind='stable')
+    inicio = 0
+    while inicio < len(orden):
+        # Se toman las filas que caben con el ancho de la primera y se recorta mientras
+        # la última (la más larga, porque van ordenadas) no quepa
+        fin = min(len(orden), inicio + max(1, CELDAS_POR_BLOQUE // max(1, int(longitudes[orden[inicio]]))))
+        while fin - inicio > 1 and (fin - inicio) * int(longitudes[orden[fin - 1]]) > CELDAS_POR_BLOQUE:
+            fin = inicio + max(1, CELDAS_POR_BLOQUE // int(longitudes[orden[fin - 1]]))
+        yield orden[inicio:fin]
+        inicio = fin
+
+def _entropia_bloque(codigos: 'np.ndarray', longitudes: 'np.ndarray') -> 'np.ndarray':
+    """Entropía de Shannon por carácter multiplicada por la longitud, como calcular_entropia.
+
+    H·L = L·log2 L - Σ c·log2 c, con c las veces que aparece cada carácter. Al ordenar cada
+    fila los caracteres iguales quedan juntos; la k-ésima repetición de un carácter aporta
+    f(k) - f(k-1) con f(x) = x·log2 x, y sumando todas las de una racha se obtiene c·log2 c.
+    """
+    filas, ancho = codigos.shape
+    if ancho == 0:
+        return np.zeros(filas)
+    # numpy recorta los NUL finales al guardar cadenas; esos caracteres no cuentan
+    longitudes = np.minimum(longitudes, ancho)
+    # El relleno se marca con -1 para que al ordenar no se confunda con ningún carácter
+    valores = codigos.astype(np.int16 if codigos.dtype == np.uint8 else np.int64)
+    relleno = np.arange(ancho) >= longitudes[:, None]
+    valores[relleno] = -1
+    valores.sort(axis=1)
+
+    nueva_racha = np.ones(valores.shape, dtype=bool)
+    nueva_racha[:, 1:] = valores[:, 1:] != valores[:, :-1]
+    posiciones = np.broadcast_to(np.arange(ancho, dtype=np.int32), valores.shape)
+    inicio_racha = np.maximum.accumulate(np.where(nueva_racha, posiciones, 0), axis=1)
+    repeticion = posiciones - inicio_racha
+
+    x = np.arange(ancho + 1, dtype=np.float64)
+    f = np.zeros(ancho + 1)
+    f[1:] = x[1:] * np.log2(x[1:])
+    aporte = f[repeticion + 1] - f[repeticion]
+    aporte[valores < 0] = 0.0
+    return f[longitudes] - aporte.sum(axis=1)
+
+def _sumar_histograma(acumulado: 'np.ndarray', nuevo: 'np.ndarray') -> 'np.ndarray':
+    """Suma dos histogramas de bincount, alargando el acumulado si el nuevo es más largo"""
+    if len(nuevo) > len(acumulado):
+        nuevo[:len(acumulado)] += acumulado
+        return nuevo
+    acumulado[:len(nuevo)] += nuevo
+    return acumulado
+
+def _percentiles(histograma: 'np.ndarray', total: int, qs: Sequence[float]) -> List[float]:
+    """Percentiles (interpolación lineal, como np.percentile) a partir del histograma fino de entropías.
+
+    Cada valor se sustituye por el múltiplo de RESOLUCION_ENTROPIA más cercano.
+    """
+    acumulado = np.cumsum(histograma)
+    resultados = []
+    for q in qs:
+        rango = q / 100 * (total - 1)
+        bajo, alto = int(np.floor(rango)), int(np.ceil(rango))
+        # Cubeta de los valores en la posición bajo y alto de la serie ordenada
+        v_bajo, v_alto = np.searchsorted(acumulado, np.array([bajo, alto]), side='right') * RESOLUCION_ENTROPIA
+        resultados.append(float(v_bajo + (v_alto - v_bajo) * (rango - bajo)))
+    return resultados
+
+def estadisticas_lote(contraseñas: Sequence[str]) -> Columnas:
+    """Entropía, longitud y caracteres de cada clase de todas las contraseñas, vectorizado"""
+    _requerir_numpy()
+    n = len(contraseñas)
+    longitudes = np.fromiter(map(len, contraseñas), dtype=np.int64, count=n)
+    entropia = np.zeros(n)
+    por_clase = {nombre: np.zeros(n, dtype=np.int64) for nombre, _ in CLASES}
+    tabla = np.frombuffer(TABLA_CLASES, dtype=np.uint8)
+
+    for filas in _bloques(longitudes):
+        codigos = matriz_caracteres([contraseñas[i] for i in filas])
+        entropia[filas] = _entropia_bloque(codigos, longitudes[filas])
+        # Fuera de latin-1 solo los dígitos de otras escrituras tienen clase (números), igual
+        # que en analizador.py; el relleno es el código 0, que no tiene clase
+        clases = tabla[np.where(codigos < 256, codigos, 0)]
+        for nombre, codigo in CLASES:
+            por_clase[nombre][filas] = np.count_nonzero(clases == codigo[0], axis=1)
+        if codigos.dtype != np.uint8:
+            digitos = [c for c in np.unique(codigos[codigos >= 256]).tolist() if chr(c).isdecimal()]
+            if digitos:
+                por_clase['numeros'][filas] += np.count_nonzero(np.isin(codigos, digitos), axis=1)
+
+    return Columnas(entropia, longitudes, **por_clase)
+
+class Acumulador:
+    """Informe agregado de muchos lotes sin guardar las contraseñas.
+
+    La memoria no crece con el número de contraseñas: solo se conservan sumas, mínimo y
+    máximo, histogramas que se suman lote a lote (uno fino de entropías para los
+    percentiles) y las peores contraseñas vistas hasta el momento.
+    """
+
+    def __init__(self, peores: int = 10, guardar_texto: bool = False):
+        _requerir_numpy()
+        self.peores = peores
+        self.guardar_texto = guardar_texto
+        self.total = 0
+        self._suma_entropia = 0.0
+        self._minima = float('inf')
+        self._maxima = float('-inf')
+        self._fino = np.zeros(0, dtype=np.int64)
+        self._cubetas = np.zeros(0, dtype=np.int64)
+        self._fortaleza = np.zeros(3, dtype=np.int64)
+        self._longitudes = np.zeros(0, dtype=np.int64)
+        self._con_clase = {nombre: 0 for nombre, _ in CLASES}
+        self._num_clases = np.zeros(len(CLASES) + 1, dtype=np.int64)
+        self._peores: List[tuple] = []
+
+    def agregar(self, contraseñas: Sequence[str]):
+        columnas = estadisticas_lote(contraseñas)
+        entropia = columnas.entropia
+        if len(entropia):
+            self._suma_entropia += float(entropia.sum())
+            self._minima = min(self._minima, float(entropia.min()))
+            self._maxima = max(self._maxima, float(entropia.max()))
+            fino = np.minimum(np.rint(entropia / RESOLUCION_ENTROPIA).astype(np.int64),
+                              int(MAXIMA_ENTROPIA_PERCENTILES / RESOLUCION_ENTROPIA))
+            self._fino = _sumar_histograma(self._fino, np.bincount(fino))
+            self._cubetas = _sumar_histograma(self._cubetas,
+                                              np.bincount((entropia // ANCHO_CUBETA_ENTROPIA).astype(np.int64)))
+            self._fortaleza += np.bincount(np.searchsorted([UMBRAL_MODERADA, UMBRAL_FUERTE], entropia, side='right'),
+                                           minlength=3)
+
+        self._longitudes = _sumar_histograma(self._longitudes, np.bincount(columnas.longitud))
+
+        presentes = np.zeros(len(contraseñas), dtype=np.int64)
+        for nombre, _ in CLASES:
+            tiene = getattr(columnas, nombre) > 0
+            self._con_clase[nombre] += int(np.count_nonzero(tiene))
+            presentes += tiene
+        self._num_clases += np.bincount(presentes, minlength=len(CLASES) + 1)
+
+        if self.peores:
+            k = min(self.peores, len(contraseñas))
+            candidatas = np.argpartition(columnas.entropia, k - 1)[:k] if k else []
+            for i in candidatas:
+                self._peores.append((float(columnas.entropia[i]), self.total + int(i),
+                                     contraseñas[i] if self.guardar_texto else None))
+            self._peores = sorted(self._peores)[:self.peores]
+        self.total += len(contraseñas)
+
+    def informe(self) -> Dict[str, object]:
+        if not self.total:
+            return {"total": 0}
+        p5, p25, p50, p75, p95 = (round(v, 2) for v in _percentiles(self._fino, self.total, [5, 25, 50, 75, 95]))
+        cubetas = self._cubetas
+        longitudes = np.nonzero(self._longitudes)[0]
+        peores = []
+        for entropia, indice, texto in self._peores:
+            peor = {"indice": indice, "entropia": round(entropia, 2)}
+            if texto is not None:
+                peor["contraseña"] = texto
+            peores.append(peor)
+
+        return {
+            "total": self.total,
+            "entropia": {
+                "media": round(self._suma_entropia / self.total, 2), "minima": round(self._minima, 2),
+                "p5": p5, "p25": p25, "p50": p50, "p75": p75, "p95": p95,
+                "maxima": round(self._maxima, 2),
+                "histograma": {f"{i * ANCHO_CUBETA_ENTROPIA}-{(i + 1) * ANCHO_CUBETA_ENTROPIA}": int(c)
+                               for i, c in enumerate(cubetas) if c},
+            },
+            "fortaleza": {
+                "debil": int(self._fortaleza[0]),
+                "moderada": int(self._fortaleza[1]),
+                "fuerte": int(self._fortaleza[2]),
+            },
+            "longitud": {
+                "minima": int(longitudes[0]), "maxima": int(longitudes[-1]),
+                "media": round(float((np.arange(len(self._longitudes)) * self._longitudes).sum() / self.total), 2),
+                "histograma": {int(l): int(self._longitudes[l]) for l in longitudes},
+            },
+            "cobertura": {
+                **{nombre: round(n / self.total, 4) for nombre, n in self._con_clase.items()},
+                "todas": round(int(self._num_clases[-1]) / self.total, 4),
+                "clases_presentes": {i: int(n) for i, n in enumerate(self._num_clases)},
+            },
+            "peores": peores,
+        }
+
+def informe_lote(contraseñas: Sequence[str], peores: int = 10, guardar_texto: bool = False) -> Dict[str, object]:
+    """Informe agregado de un lote que ya está en memoria"""
+    acumulador = Acumulador(peores, guardar_texto)
+    acumulador.agregar(contraseñas)
+    return acumulador.informe()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Informe agregado (entropía, longitudes, clases de caracteres) de una lista de contraseñas'
+    )
+    parser.add_argument('archivo', nargs='?', default='-', help='Una contraseña por línea (por defecto: stdin)')
+    parser.add_argument('--peores', type=int, default=10, help='Cuántas contraseñas de menor entropía listar (por defecto: 10)')
+    parser.add_argument('--mostrar', action='store_true', help='Incluir el texto de las peores contraseñas en el informe')
+    parser.add_argument('--lote', type=int, default=100_000, help='Contraseñas por lote (por defecto: 100000)')
+    args = parser.parse_args(argv)
+
+    try:
+        acumulador = Acumulador(args.peores, args.mostrar)
+    except ImportError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    entrada = sys.stdin.buffer if args.archivo == '-' else open(args.archivo, 'rb')
+    try:
+        lote = []
+        for linea in entrada:
+            lote.append(linea.decode('utf-8', errors='replace').rstrip('\r\n'))
+            if len(lote) >= args.lote:
+                acumulador.agregar(lote)
+                lote = []
+        if lote:
+            acumulador.agregar(lote)
+    except KeyboardInterrupt:
+        print("\n[!] Operación cancelada por el usuario", file=sys.stderr)
+        return 1
+    finally:
+        if entrada is not sys.stdin.buffer:
+            entrada.close()
+
+    print(json.dumps(acumulador.informe(), ensure_ascii=False, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,482 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import argparse
+import itertools
+import json
+import math
+import re
+import sys
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+RUTA_DATOS = 'data.JSON'
+RUTA_LISTA = 'TXT/contras.txt'
+# Como zxcvbn, solo se usan las primeras palabras de la lista (las más frecuentes)
+MAX_PALABRAS_LISTA = 30000
+# Solo se analiza el principio de la contraseña; lo que pasa de esta longitud se cuenta como
+# una repetición, que solo añade cuántos caracteres más hay
+LONGITUD_MAXIMA = 100
+# Por debajo de 10^10 intentos una contraseña se considera predecible (puntuación < 4)
+MINIMO_LOG10 = 10.0
+
+CARDINALIDAD_BRUTA = 10
+MIN_INTENTOS_CARACTER = 10
+MIN_INTENTOS_SUBCADENA = 50
+PENALIZACION_PIEZAS = 10000
+AÑO_REFERENCIA = time.localtime().tm_year
+MIN_DISTANCIA_AÑOS = 20
+MAX_DELTA_SECUENCIA = 5
+
+L33T = {'4': 'a', '@': 'a', '8': 'b', '(': 'c', '3': 'e', '6': 'g', '9': 'g', '1': 'i', '!': 'i',
+        '|': 'l', '0': 'o', '$': 's', '5': 's', '7': 't', '+': 't', '2': 'z'}
+TABLA_L33T = str.maketrans(L33T)
+
+FILAS_QWERTY = (
+    ('`~', '1!', '2@', '3#', '4$', '5%', '6^', '7&', '8*', '9(', '0)', '-_', '=+'),
+    ('qQ', 'wW', 'eE', 'rR', 'tT', 'yY', 'uU', 'iI', 'oO', 'pP', '[{', ']}', '\\|'),
+    ('aA', 'sS', 'dD', 'fF', 'gG', 'hH', 'jJ', 'kK', 'lL', ';:', '\'"'),
+    ('zZ', 'xX', 'cC', 'vV', 'bB', 'nN', 'mM', ',<', '.>', '/?'),
+)
+# Teclado inclinado: a está bajo q y w, z bajo a y s
+DIRECCIONES = ((-1, 0), (0, -1), (1, -1), (1, 0), (0, 1), (-1, 1))
+
+# Separaciones día/mes/año posibles de una fecha sin separadores según su longitud
+CORTES_FECHA = {
+    4: ((1, 2), (2, 3)),
+    5: ((1, 3), (2, 3)),
+    6: ((1, 2), (2, 4), (4, 5)),
+    7: ((1, 3), (2, 3), (4, 5), (4, 6)),
+    8: ((2, 4), (4, 6)),
+}
+FECHA_CON_SEPARADOR = re.compile(r'(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})')
+AÑO = re.compile(r'19\d\d|20\d\d')
+REPETICION_VORAZ = re.compile(r'(.+)\1+', re.S)
+REPETICION_PEREZOSA = re.compile(r'(.+?)\1+', re.S)
+REPETICION_ANCLADA = re.compile(r'^(.+?)\1+$', re.S)
+
+def _construir_teclado() -> Dict[str, Tuple[str, ...]]:
+    """Para cada carácter, las dos teclas (sin y con mayúsculas) vecinas en cada dirección"""
+    posiciones = {}
+    for y, fila in enumerate(FILAS_QWERTY):
+        for x, tecla in enumerate(fila):
+            posiciones[(x + (1 if y else 0), y)] = tecla
+    vecinos = {}
+    for (x, y), tecla in posiciones.items():
+        adyacentes = tuple(posiciones.get((x + dx, y + dy), '') for dx, dy in DIRECCIONES)
+        for c in tecla:
+            vecinos[c] = adyacentes
+    return vecinos
+
+TECLADO = _construir_teclado()
+TECLAS_INICIALES = len(TECLADO)
+GRADO_MEDIO = sum(sum(1 for v in ady if v) for ady in TECLADO.values()) / len(TECLADO)
+DESPLAZADOS = frozenset(tecla[1] for fila in FILAS_QWERTY for tecla in fila)
+
+class Coincidencia(NamedTuple):
+    patron: str
+    i: int
+    j: int
+    token: str
+    intentos: float
+    detalle: str = ''
+
+class Estimacion(NamedTuple):
+    intentos: float
+    log10: float
+    bits: float
+    puntuacion: int
+    secuencia: Tuple[Coincidencia, ...]
+
+def _variaciones(presentes: int, ausentes: int) -> int:
+    """Formas de repartir una transformación (mayúsculas, l33t, shift) entre los caracteres"""
+    if not presentes or not ausentes:
+        return 2
+    return sum(math.comb(presentes + ausentes, i) for i in range(1, min(presentes, ausentes) + 1))
+
+def _variaciones_mayusculas(token: str) -> int:
+    if token.islower() or not any(c.isupper() for c in token):
+        return 1
+    if token.isupper() or (token[0].isupper() and token[1:].islower()) or (token[-1].isupper() and token[:-1].islower()):
+        return 2
+    mayusculas = sum(1 for c in token if c.isupper())
+    minusculas = sum(1 for c in token if c.islower())
+    return _variaciones(mayusculas, minusculas)
+
+def _variaciones_l33t(token: str) -> int:
+    variaciones = 1
+    minusculas = token.lower()
+    for letra in set(L33T[c] for c in minusculas if c in L33T):
+        sustituidas = sum(1 for c in minusculas if L33T.get(c) == letra)
+        variaciones *= _variaciones(sustituidas, minusculas.count(letra))
+    return variaciones
+
+def _minusculas(texto: str) -> str:
+    """lower() que conserva la longitud, para que las posiciones sigan valiendo ('İ' pasa a dos caracteres)"""
+    minusculas = texto.lower()
+    if len(minusculas) == len(texto):
+        return minusculas
+    return ''.join(c.lower() if len(c.lower()) == 1 else c for c in texto)
+
+def _log10_factorial(n: int) -> float:
+    return math.lgamma(n + 1) / math.log(10)
+
+def _sumar_log10(a: float, b: float) -> float:
+    mayor, menor = max(a, b), min(a, b)
+    return mayor + math.log10(1 + 10 ** (menor - mayor))
+
+def _puntuacion(log10: float) -> int:
+    for puntos, umbral in enumerate((3, 6, 8, 10)):
+        if log10 < umbral:
+            return puntos
+    return 4
+
+class Estimador:
+    """Estimador de intentos al estilo zxcvbn con los diccionarios de data.JSON y la lista de comunes.
+
+    Busca palabras de diccionario (también invertidas y con sustituciones l33t), paseos por
+    el teclado, secuencias, repeticiones y fechas, y con programación dinámica elige la
+    descomposición de la contraseña que un atacante probaría antes. Las palabras se guardan
+    en un trie aplanado: un diccionario de todos sus prefijos, que permite cortar la
+    búsqueda en cuanto un prefijo no existe sin el coste en memoria de un nodo por letra.
+    """
+
+    def __init__(self, ruta_datos: Optional[str] = RUTA_DATOS, ruta_lista: Optional[str] = RUTA_LISTA,
+                 max_lista: int = MAX_PALABRAS_LISTA):
+        self._trie: Dict[str, Optional[Tuple[int, str]]] = {}
+        if ruta_datos:
+            self._cargar_datos(ruta_datos)
+        if ruta_lista:
+            self._cargar_lista(ruta_lista, max_lista)
+
+    def __len__(self) -> int:
+        return sum(1 for v in self._trie.values() if v is not None)
+
+    def agregar(self, palabra: str, rango: int, categoria: str):
+        palabra = palabra.lower()
+        if len(palabra) < 3:
+            return
+        actual = self._trie.get(palabra)
+        if actual is not None and actual[0] <= rango:
+            return
+        self._trie[palabra] = (rango, categoria)
+        for k in range(1, len(palabra)):
+            self._trie.setdefault(palabra[:k], None)
+
+    def _cargar_datos(self, ruta: str):
+        try:
+            with open(ruta, 'r', encoding='utf-8') as f:
+                categorias = json.load(f).get('categorias', {})
+        except FileNotFoundError:
+            print(f"Advertencia: No se encontró el archivo {ruta}", file=sys.stderr)
+            return
+        for categoria, palabras in categorias.items():
+            for rango, palabra in enumerate(palabras, 1):
+                self.agregar(palabra, rango, categoria)
+
+    def _cargar_lista(self, ruta: str, max_lista: int):
+        try:
+            with open(ruta, 'r', encoding='utf-8', errors='replace') as f:
+                palabras = (linea.strip() for linea in f)
+                for rango, palabra in enumerate(itertools.islice(filter(None, palabras), max_lista), 1):
+                    self.agregar(palabra, rango, 'lista')
+        except FileNotFoundError:
+            print(f"Advertencia: No se encontró el archivo {ruta}", file=sys.stderr)
+
+    def _palabras(self, texto: str) -> Iterator[Tuple[int, int, Tuple[int, str]]]:
+        trie = self._trie
+        n = len(texto)
+        for i in range(n - 2):
+            for j in range(i + 1, n + 1):
+                if texto[i:j] not in trie:
+                    break
+                entrada = trie[texto[i:j]]
+                if entrada is not None:
+                    yield i, j - 1, entrada
+
+    def _diccionario(self, contraseña: str) -> Iterator[Coincidencia]:
+        minusculas = _minusculas(contraseña)
+        for i, j, (rango, categoria) in self._palabras(minusculas):
+            token = contraseña[i:j + 1]
+            yield Coincidencia('diccionario', i, j, token, rango * _variaciones_mayusculas(token), categoria)
+
+        n = len(contraseña)
+        for i, j, (rango, categoria) in self._palabras(minusculas[::-1]):
+            i, j = n - 1 - j, n - 1 - i
+            token = contraseña[i:j + 1]
+            yield Coincidencia('diccionario', i, j, token, rango * _variaciones_mayusculas(token) * 2, f"{categoria} (invertida)")
+
+        traducida = minusculas.translate(TABLA_L33T)
+        if traducida != minusculas:
+            for i, j, (rango, categoria) in self._palabras(traducida):
+                token = contraseña[i:j + 1]
+                if traducida[i:j + 1] == minusculas[i:j + 1]:
+                    continue
+                intentos = rango * _variaciones_mayusculas(token) * _variaciones_l33t(token)
+                yield Coincidencia('diccionario', i, j, token, intentos, f"{categoria} (l33t)")
+
+    def _teclado(self, contraseña: str) -> Iterator[Coincidencia]:
+        n = len(contraseña)
+        i = 0
+        while i < n - 1:
+            j = i
+            giros = 0
+            ultima = None
+            desplazados = 1 if contraseña[i] in DESPLAZADOS else 0
+            while j + 1 < n:
+                vecinos = TECLADO.get(contraseña[j])
+                siguiente = contraseña[j + 1]
+                direccion = next((d for d, tecla in enumerate(vecinos) if siguiente in tecla), None) if vecinos else None
+                if direccion is None:
+                    break
+                if direccion != ultima:
+                    giros += 1
+                    ultima = direccion
+                if siguiente in DESPLAZADOS:
+                    desplazados += 1
+                j += 1
+            longitud = j - i + 1
+            if longitud >= 3:
+                intentos = 0.0
+                for k in range(2, longitud + 1):
+                    for g in range(1, min(giros, k - 1) + 1):
+                        intentos += math.comb(k - 1, g - 1) * TECLAS_INICIALES * GRADO_MEDIO ** g
+                if desplazados:
+                    intentos *= _variaciones(desplazados, longitud - desplazados)
+                yield Coincidencia('teclado', i, j, contraseña[i:j + 1], intentos, f"{giros} giros")
+            i = max(j, i + 1)
+
+    def _secuencias(self, contraseña: str) -> Iterator[Coincidencia]:
+        n = len(contraseña)
+        if n < 3:
+            return
+
+        def coincidencia(i: int, j: int, delta: int) -> Optional[Coincidencia]:
+            if j - i < 2 or not 0 < abs(delta) <= MAX_DELTA_SECUENCIA:
+                return None
+            token = contraseña[i:j + 1]
+            primero = token[0]
+            if primero in 'aAzZ019':
+                base = 4
+            elif primero.isdigit():
+                base = 10
+            else:
+                base = 26
+            if delta < 0:
+                base *= 2
+            return Coincidencia('secuencia', i, j, token, base * len(token), f"delta {delta}")
+
+        i = 0
+        ultimo = ord(contraseña[1]) - ord(contraseña[0])
+        for k in range(2, n):
+            delta = ord(contraseña[k]) - ord(contraseña[k - 1])
+            if delta != ultimo:
+                encontrada = coincidencia(i, k - 1, ultimo)
+                if encontrada:
+                    yield encontrada
+                i, ultimo = k - 1, delta
+        encontrada = coincidencia(i, n - 1, ultimo)
+        if encontrada:
+            yield encontrada
+
+    def _repeticiones(self, contraseña: str) -> Iterator[Coincidencia]:
+        i = 0
+        while i < len(contraseña):
+            voraz = REPETICION_VORAZ.search(contraseña, i)
+            if not voraz:
+                return
+            perezosa = REPETICION_PEREZOSA.search(contraseña, i)
+            if len(voraz.group(0)) > len(perezosa.group(0)):
+                encontrada = voraz
+                base = REPETICION_ANCLADA.match(voraz.group(0)).group(1)
+            else:
+                encontrada = perezosa
+                base = perezosa.group(1)
+            token = encontrada.group(0)
+            intentos = self.estimar(base).intentos * (len(token) // len(base))
+            yield Coincidencia('repeticion', encontrada.start(), encontrada.end() - 1, token, intentos, base)
+            i = encontrada.end()
+
+    def _fechas(self, contraseña: str) -> Iterator[Coincidencia]:
+        n = len(contraseña)
+        for i in range(n - 3):
+            for longitud in range(4, 9):
+                j = i + longitud
+                if j > n:
+                    break
+                token = contraseña[i:j]
+                if not token.isdecimal():
+                    break
+                candidatas = [_dia_mes_año((int(token[:a]), int(token[a:b]), int(token[b:])))
+                              for a, b in CORTES_FECHA[longitud]]
+                candidatas = [c for c in candidatas if c]
+                if candidatas:
+                    año = min(candidatas, key=lambda c: abs(c[2] - AÑO_REFERENCIA))[2]
+                    yield Coincidencia('fecha', i, j - 1, token, _intentos_fecha(año, False), str(año))
+            for longitud in range(6, 11):
+                j = i + longitud
+                if j > n:
+                    break
+                encontrada = FECHA_CON_SEPARADOR.fullmatch(contraseña, i, j)
+                if encontrada:
+                    fecha = _dia_mes_año((int(encontrada.group(1)), int(encontrada.group(3)), int(encontrada.group(4))))
+                    if fecha:
+                        yield Coincidencia('fecha', i, j - 1, encontrada.group(0), _intentos_fecha(fecha[2], True), str(fecha[2]))
+        for encontrada in AÑO.finditer(contraseña):
+            año = int(encontrada.group(0))
+            yield Coincidencia('año', encontrada.start(), encontrada.end() - 1, encontrada.group(0),
+                               max(abs(año - AÑO_REFERENCIA), MIN_DISTANCIA_AÑOS), str(año))
+
+    def coincidencias(self, contraseña: str) -> List[Coincidencia]:
+        """Todas las coincidencias de patrones, con su número de intentos ya ajustado al mínimo"""
+        encontradas = []
+        n = len(contraseña)
+        for buscador in (self._diccionario, self._teclado, self._secuencias, self._repeticiones, self._fechas):
+            for c in buscador(contraseña):
+                if c.i == 0 and c.j == n - 1:
+                    minimo = 1
+                elif c.i == c.j:
+                    minimo = MIN_INTENTOS_CARACTER
+                else:
+                    minimo = MIN_INTENTOS_SUBCADENA
+                if c.intentos < minimo:
+                    c = c._replace(intentos=minimo)
+                encontradas.append(c)
+        return encontradas
+
+    def estimar(self, contraseña: str) -> Estimacion:
+        """Número de intentos que necesitaría un atacante que prueba primero los patrones conocidos.
+
+        Para cada posición y cada número de piezas l se guarda el menor producto de intentos
+        (en log10) de las descomposiciones que terminan ahí, separando las que acaban en un
+        tramo de fuerza bruta para poder alargarlo carácter a carácter. Al final se elige el
+        mínimo de l! · producto + PENALIZACION_PIEZAS^(l-1), la misma función que zxcvbn.
+        """
+        cola = contraseña[LONGITUD_MAXIMA:]
+        contraseña = contraseña[:LONGITUD_MAXIMA]
+        n = len(contraseña)
+        if not n:
+            return Estimacion(1.0, 0.0, 0.0, 0, ())
+
+        por_final: Dict[int, List[Coincidencia]] = {}
+        for c in self.coincidencias(contraseña):
+            por_final.setdefault(c.j, []).append(c)
+
+        log_bruta = math.log10(CARDINALIDAD_BRUTA)
+        # Estados: {piezas: (log10 del producto, anterior)}; anterior = (posición, tipo, piezas)
+        patron: List[Dict[int, tuple]] = [dict() for _ in range(n)]
+        bruta: List[Dict[int, tuple]] = [dict() for _ in range(n)]
+
+        for k in range(n):
+            for c in por_final.get(k, ()):
+                log_c = math.log10(c.intentos)
+                if c.i == 0:
+                    candidatos = [(1, log_c, None)]
+                else:
+                    candidatos = [(l + 1, log + log_c, (c.i - 1, tipo, l))
+                                  for tipo, estados in ((0, patron[c.i - 1]), (1, bruta[c.i - 1]))
+                                  for l, (log, _, _) in estados.items()]
+                for l, log, anterior in candidatos:
+                    actual = patron[k].get(l)
+                    if actual is None or log < actual[0]:
+                        patron[k][l] = (log, anterior, c)
+
+            if k == 0:
+                bruta[0][1] = (log_bruta, None, 0)
+                continue
+            for l, (log, anterior, inicio) in bruta[k - 1].items():
+                bruta[k][l] = (log + log_bruta, anterior, inicio)
+            for l, (log, _, _) in patron[k - 1].items():
+                actual = bruta[k].get(l + 1)
+                if actual is None or log + log_bruta < actual[0]:
+                    bruta[k][l + 1] = (log + log_bruta, (k - 1, 0, l), k)
+
+        mejor = None
+        for tipo, estados in ((0, patron[n - 1]), (1, bruta[n - 1])):
+            for l, (log, _, _) in estados.items():
+                total = _sumar_log10(_log10_factorial(l) + log, math.log10(PENALIZACION_PIEZAS) * (l - 1))
+                if mejor is None or total < mejor[0]:
+                    mejor = (total, (n - 1, tipo, l))
+
+        secuencia = []
+        estado = mejor[1]
+        while estado is not None:
+            k, tipo, l = estado
+            if tipo == 0:
+                _, estado, c = patron[k][l]
+                secuencia.append(c)
+            else:
+                _, estado, inicio = bruta[k][l]
+                token = contraseña[inicio:k + 1]
+                secuencia.append(Coincidencia('fuerza_bruta', inicio, k, token, float(CARDINALIDAD_BRUTA ** len(token))))
+        secuencia.reverse()
+
+        log10 = mejor[0]
+        if cola:
+            # Contar la cola como fuerza bruta daría 10^103 intentos a 'x' * 200; como repetición
+            # de lo anterior solo multiplica por las longitudes posibles de la cola
+            log10 += math.log10(len(cola) + 1)
+            secuencia.append(Coincidencia('repeticion', n, n + len(cola) - 1, cola, float(len(cola) + 1)))
+        intentos = 10 ** log10 if log10 < 300 else math.inf
+        return Estimacion(intentos, log10, log10 * math.log2(10), _puntuacion(log10), tuple(secuencia))
+
+def _dia_mes(a: int, b: int) -> Optional[Tuple[int, int]]:
+    for dia, mes in ((a, b), (b, a)):
+        if 1 <= dia <= 31 and 1 <= mes <= 12:
+            return dia, mes
+    return None
+
+def _dia_mes_año(enteros: Tuple[int, int, int]) -> Optional[Tuple[int, int, int]]:
+    """Interpreta tres números como fecha (día, mes, año) si alguna ordenación tiene sentido"""
+    if not 1 <= enteros[1] <= 31:
+        return None
+    for año, resto in ((enteros[2], enteros[:2]), (enteros[0], enteros[1:])):
+        if 1000 <= año <= 2050:
+            dia_mes = _dia_mes(*resto)
+            if dia_mes:
+                return dia_mes + (año,)
+    for año, resto in ((enteros[2], enteros[:2]), (enteros[0], enteros[1:])):
+        if año < 100:
+            dia_mes = _dia_mes(*resto)
+            if dia_mes:
+                return dia_mes + (año + (1900 if año > 50 else 2000),)
+    return None
+
+def _intentos_fecha(año: int, separador: bool) -> float:
+    intentos = max(abs(año - AÑO_REFERENCIA), MIN_DISTANCIA_AÑOS) * 365
+    return intentos * 4 if separador else intentos
+
+_estimador: Optional[Estimador] = None
+
+def obtener_estimador() -> Estimador:
+    """Estimador compartido del proceso; los diccionarios se cargan en la primera llamada"""
+    global _estimador
+    if _estimador is None:
+        _estimador = Estimador()
+    return _estimador
+
+def estimar(contraseña: str) -> Estimacion:
+    return obtener_estimador().estimar(contraseña)
+
+def es_predecible(contraseña: str) -> bool:
+    return estimar(contraseña).log10 < MINIMO_LOG10
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Estima cuántos intentos necesitaría un atacante para adivinar una contraseña')
+    parser.add_argument('contraseñas', nargs='*', help='Contraseñas a estimar (si no se indican se leen de la entrada estándar)')
+    parser.add_argument('--datos', default=RUTA_DATOS, help=f'Categorías de patrones (por defecto: {RUTA_DATOS})')
+    parser.add_argument('--lista', default=RUTA_LISTA, help=f'Lista de contraseñas comunes (por defecto: {RUTA_LISTA})')
+    parser.add_argument('--detalle', action='store_true', help='Muestra la descomposición elegida')
+    args = parser.parse_args(argv)
+
+    estimador = Estimador(args.datos, args.lista)
+    contraseñas = args.contraseñas or (linea.rstrip('\n') for linea in sys.stdin)
+    for contraseña in contraseñas:
+        e = estimador.estimar(contraseña)
+        print(f"{contraseña}\t10^{e.log10:.1f} intentos\t{e.bits:.1f} bits\tpuntuación {e.puntuacion}/4")
+        if args.detalle:
+            for c in e.secuencia:
+                print(f"    {c.patron:<12} {c.token!r:<20} 10^{math.log10(c.intentos):.1f}  {c.detalle}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+from typing import Iterable, Iterator, Optional, Tuple
+
+from indice import clave_contraseña, escritura_atomica
+
+MAGIA = b'PCBLOOM1'
+# magia, bits, funciones hash, entradas, capacidad, bytes procesados de la lista, huella de la lista
+CABECERA = struct.Struct('<8sQIQQQ16s')
+BITS_POR_ENTRADA = 10
+# Capacidad extra reservada para poder añadir entradas sin reconstruir
+MARGEN_CRECIMIENTO = 1.25
+VENTANA_HUELLA = 4096
+
+def ruta_filtro(ruta_lista: str) -> str:
+    return os.path.splitext(ruta_lista)[0] + '.bloom'
+
+def _posiciones(clave: int, bits: int, funciones: int) -> Iterable[int]:
+    h1 = clave & 0xFFFFFFFF
+    h2 = (clave >> 32) | 1
+    for i in range(funciones):
+        yield (h1 + i * h2) % bits
+
+def _parametros(capacidad: int, bits_por_entrada: int) -> Tuple[int, int]:
+    bits = max(64, capacidad * bits_por_entrada)
+    bits = (bits + 7) // 8 * 8
+    funciones = max(1, round(bits_por_entrada * math.log(2)))
+    return bits, funciones
+
+def _huella(f, hasta: int) -> bytes:
+    """Resumen de los últimos bytes ya procesados, para detectar si la lista se reescribió"""
+    inicio = max(0, hasta - VENTANA_HUELLA)
+    f.seek(inicio)
+    return hashlib.blake2b(f.read(hasta - inicio), digest_size=16).digest()
+
+def _fin_lineas_completas(f) -> int:
+    """Offset justo después del último salto de línea; una última línea a medias se deja para luego"""
+    pos = os.fstat(f.fileno()).st_size
+    while pos > 0:
+        inicio = max(0, pos - 65536)
+        f.seek(inicio)
+        corte = f.read(pos - inicio).rfind(b'\n')
+        if corte >= 0:
+            return inicio + corte + 1
+        pos = inicio
+    return 0
+
+def _contar_lineas(f, desde: int, hasta: int) -> int:
+    f.seek(desde)
+    total = 0
+    while desde < hasta:
+        bloque = f.read(min(1 << 20, hasta - desde))
+        total += bloque.count(b'\n')
+        desde += len(bloque)
+    return total
+
+def _leer_lineas(f, desde: int, hasta: int) -> Iterator[str]:
+    f.seek(desde)
+    restante = hasta - desde
+    for linea in f:
+        if restante <= 0:
+            break
+        restante -= len(linea)
+        linea = linea.decode('utf-8', errors='replace').strip()
+        if linea:
+            yield linea
+
+class FiltroBloom:
+    """Filtro de Bloom mapeado en memoria que descarta casi todas las contraseñas que no están en la lista.
+
+    Un resultado negativo es definitivo; uno positivo hay que confirmarlo en el índice exacto.
+    """
+
+    def __init__(self, ruta: str, escritura: bool = False):
+        self.ruta = ruta
+        self._archivo = open(ruta, 'r+b' if escritura else 'rb')
+        acceso = mmap.ACCESS_WRITE if escritura else mmap.ACCESS_READ
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=acceso)
+        except Exception:
+            self._archivo.close()
+            raise
+        (magia, self.bits, self.funciones, self.entradas,
+         self.capacidad, self.procesado, self.huella) = CABECERA.unpack_from(self._mapa, 0)
+        if magia != MAGIA or len(self._mapa) != CABECERA.size + self.bits // 8:
+            self.cerrar()
+            raise ValueError(f"El archivo {ruta} no es un filtro de Passcor válido")
+
+    def contiene_clave(self, clave: int) -> bool:
+        mapa = self._mapa
+        bits = self.bits
+        h1 = clave & 0xFFFFFFFF
+        h2 = (clave >> 32) | 1
+        for i in range(self.funciones):
+            pos = (h1 + i * h2) % bits
+            if not mapa[CABECERA.size + (pos >> 3)] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __contains__(self, contraseña: str) -> bool:
+        return self.contiene_clave(clave_contraseña(contraseña))
+
+    def agregar(self, contraseñas: Iterable[str]):
+        mapa = self._mapa
+        for contraseña in contraseñas:
+            for pos in _posiciones(clave_contraseña(contraseña), self.bits, self.funciones):
+                mapa[CABECERA.size + (pos >> 3)] |= 1 << (pos & 7)
+            self.entradas += 1
+
+    def _guardar_cabecera(self):
+        CABECERA.pack_into(self._mapa, 0, MAGIA, self.bits, self.funciones, self.entradas,
+                           self.capacidad, self.procesado, self.huella)
+        self._mapa.flush()
+
+    def cerrar(self):
+        self._mapa.close()
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+def construir_filtro(ruta_lista: str, destino: Optional[str] = None,
+                     bits_por_entrada: int = BITS_POR_ENTRADA, capacidad: Optional[int] = None) -> int:
+    """Construye el filtro completo de una lista, con algo de capacidad libre para crecer"""
+    destino = destino or ruta_filtro(ruta_lista)
+    with open(ruta_lista, 'rb') as f:
+        procesado = _fin_lineas_completas(f)
+        capacidad = max(capacidad or 0, int(MARGEN_CRECIMIENTO * _contar_lineas(f, 0, procesado)), 1024)
+        bits, funciones = _parametros(capacidad, bits_por_entrada)
+
+        tabla = bytearray(bits // 8)
+        entradas = 0
+        for contraseña in _leer_lineas(f, 0, procesado):
+            for pos in _posiciones(clave_contraseña(contraseña), bits, funciones):
+                tabla[pos >> 3] |= 1 << (pos & 7)
+            entradas += 1
+        huella = _huella(f, procesado)
+
+    with escritura_atomica(destino) as f:
+        f.write(CABECERA.pack(MAGIA, bits, funciones, entradas, capacidad, procesado, huella))
+        f.write(tabla)
+    return entradas
+
+def actualizar_filtro(ruta_lista: str, destino: Optional[str] = None,
+                      bits_por_entrada: int = BITS_POR_ENTRADA) -> int:
+    """Añade al filtro solo las líneas agregadas al final de la lista desde la última vez.
+
+    Si la lista se reescribió o el filtro superaría su capacidad, se reconstruye entero.
+    Devuelve el número de entradas añadidas.
+    """
+    destino = destino or ruta_filtro(ruta_lista)
+    if not os.path.exists(destino):
+        return construir_filtro(ruta_lista, destino, bits_por_entrada)
+
+    capacidad = None
+    with FiltroBloom(destino, escritura=True) as filtro, open(ruta_lista, 'rb') as f:
+        procesado = _fin_lineas_completas(f)
+        if procesado >= filtro.procesado and _huella(f, filtro.procesado) == filtro.huella:
+            nuevas = _contar_lineas(f, filtro.procesado, procesado)
+            if filtro.entradas + nuevas <= filtro.capacidad:
+                antes = filtro.entradas
+                filtro.agregar(_leer_lineas(f, filtro.procesado, procesado))
+                filtro.procesado = procesado
+                filtro.huella = _huella(f, procesado)
+                filtro._guardar_cabecera()
+                return filtro.entradas - antes
+            capacidad = int(MARGEN_CRECIMIENTO * (filtro.entradas + nuevas))
+
+    return construir_filtro(ruta_lista, destino, bits_por_entrada, capacidad)
+
+def abrir_filtro(ruta_lista: str, ruta: Optional[str] = None) -> FiltroBloom:
+    """Abre el filtro de una lista, poniéndolo al día antes si la lista cambió"""
+    ruta = ruta or ruta_filtro(ruta_lista)
+    if os.path.exists(ruta_lista):
+        if not os.path.exists(ruta) or os.path.getmtime(ruta) < os.path.getmtime(ruta_lista):
+            actualizar_filtro(ruta_lista, ruta)
+    return FiltroBloom(ruta)
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Construye o actualiza el filtro de Bloom de una lista de contraseñas')
+    parser.add_argument('lista', nargs='?', default='TXT/contras.txt', help='Archivo de texto con una contraseña por línea')
+    parser.add_argument('-o', '--salida', help='Ruta del filtro (por defecto junto a la lista, con extensión .bloom)')
+    parser.add_argument('--bits', type=int, default=BITS_POR_ENTRADA, help='Bits por entrada (por defecto: 10)')
+    parser.add_argument('--completo', action='store_true', help='Reconstruir desde cero en lugar de actualizar')
+    args = parser.parse_args()
+
+    destino = args.salida or ruta_filtro(args.lista)
+    if args.completo:
+        total = construir_filtro(args.lista, destino, args.bits)
+    else:
+        total = actualizar_filtro(args.lista, destino, args.bits)
+    print(f"Filtro escrito en {destino}: {total} entradas añadidas")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,54 @@
 #codidgo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
 
-import secrets
 import string
 import argparse
-import pyperclip
+import math
 import sys
 import time
-from typing import List
+import os
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, List, Optional, TextIO, Tuple
 from ascii import mostrar_banner, mostrar_llave, mostrar_estadisticas, mostrar_exito, mostrar_error
 
+# numpy es opcional: estadisticas.py solo se importa con --estadisticas
+if TYPE_CHECKING:
+    from estadisticas import Acumulador
+
+MINUSCULAS = string.ascii_lowercase
+MAYUSCULAS = string.ascii_uppercase
+NUMEROS = string.digits
+ESPECIALES = '!@#$%^&*()_+-=[]{}|;:,.<>?'
+AMBIGUOS = 'l1I0O'
+
+@lru_cache(maxsize=None)
+def _conjuntos(
+    usar_mayusculas: bool,
+    usar_minusculas: bool,
+    usar_numeros: bool,
+    usar_especiales: bool,
+    excluir_ambiguos: bool
+) -> Tuple[Tuple[str, ...], str]:
+    """Calcula una sola vez los conjuntos de caracteres de cada combinación de opciones"""
+    if not any([usar_mayusculas, usar_minusculas, usar_numeros, usar_especiales]):
+        raise ValueError("Debe habilitar al menos un tipo de caracteres")
+
+    clases = []
+    if usar_minusculas:
+        clases.append(MINUSCULAS)
+    if usar_mayusculas:
+        clases.append(MAYUSCULAS)
+    if usar_numeros:
+        clases.append(NUMEROS)
+    if usar_especiales:
+        clases.append(ESPECIALES)
+
+    if excluir_ambiguos:
+        clases = [''.join(c for c in clase if c not in AMBIGUOS) for clase in clases]
+
+    return tuple(clases), ''.join(clases)
+
 def generar_contraseña(
     longitud: int = 16,
     usar_mayusculas: bool = True,
@@ -17,42 +57,16 @@ def generar_contraseña(
     usar_especiales: bool = True,
     excluir_ambiguos: bool = True
 ) -> str:
+    import secrets
+
     if longitud < 12:
         raise ValueError("La longitud mínima debe ser 12 caracteres")
     
-    if not any([usar_mayusculas, usar_minusculas, usar_numeros, usar_especiales]):
-        raise ValueError("Debe habilitar al menos un tipo de caracteres")
-    
-    minusculas = string.ascii_lowercase
-    mayusculas = string.ascii_uppercase
-    numeros = string.digits
-    especiales_chars = '!@#$%^&*()_+-=[]{}|;:,.<>?'
-    
-    ambiguos = 'l1I0O'
-    
-    caracteres = ''
-    if usar_minusculas:
-        caracteres += minusculas
-    if usar_mayusculas:
-        caracteres += mayusculas
-    if usar_numeros:
-        caracteres += numeros
-    if usar_especiales:
-        caracteres += especiales_chars
-    
-    if excluir_ambiguos:
-        caracteres = ''.join(c for c in caracteres if c not in ambiguos)
-    
-    password = []
+    clases, caracteres = _conjuntos(
+        usar_mayusculas, usar_minusculas, usar_numeros, usar_especiales, excluir_ambiguos
+    )
     
-    if usar_minusculas:
-        password.append(secrets.choice([c for c in minusculas if c not in ambiguos or not excluir_ambiguos]))
-    if usar_mayusculas:
-        password.append(secrets.choice([c for c in mayusculas if c not in ambiguos or not excluir_ambiguos]))
-    if usar_numeros:
-        password.append(secrets.choice([c for c in numeros if c not in ambiguos or not excluir_ambiguos]))
-    if usar_especiales:
-        password.append(secrets.choice(especiales_chars))
+    password = [secrets.choice(clase) for clase in clases]
     
     while len(password) < longitud:
         password.append(secrets.choice(caracteres))
@@ -61,10 +75,99 @@ def generar_contraseña(
     
     return ''.join(password)
 
+class GeneradorLotes:
+    """Genera contraseñas en bloque a partir de grandes lecturas de os.urandom.
+
+    Cada byte aleatorio se traduce a un carácter con una tabla precalculada; los bytes
+    que caerían fuera del último múltiplo completo del alfabeto se descartan (muestreo
+    por rechazo), así que cada carácter es uniforme. Las contraseñas a las que les falta
+    alguna clase habilitada también se descartan enteras, en lugar de forzar un carácter
+    de cada clase y barajar.
+    """
+
+    def __init__(
+        self,
+        longitud: int = 16,
+        usar_mayusculas: bool = True,
+        usar_minusculas: bool = True,
+        usar_numeros: bool = True,
+        usar_especiales: bool = True,
+        excluir_ambiguos: bool = True
+    ):
+        if longitud < 12:
+            raise ValueError("La longitud mínima debe ser 12 caracteres")
+
+        clases, caracteres = _conjuntos(
+            usar_mayusculas, usar_minusculas, usar_numeros, usar_especiales, excluir_ambiguos
+        )
+        self.longitud = longitud
+        limite = 256 - 256 % len(caracteres)
+        self._tabla = bytes(ord(caracteres[b % len(caracteres)]) if b < limite else 0 for b in range(256))
+        self._descartar = bytes(range(limite, 256))
+        self._aceptados = limite / 256
+        self._trocear = re.compile('.{%d}' % longitud, re.DOTALL).findall
+        if len(clases) > 1:
+            self._completa = re.compile(''.join(
+                '(?=[^{0}]*[{0}])'.format(re.escape(clase)) for clase in clases
+            )).match
+        else:
+            self._completa = None
+
+    def lotes(self, cantidad: int, tamaño_lote: int = 65536) -> Iterator[List[str]]:
+        """Produce las contraseñas en listas de como mucho tamaño_lote elementos"""
+        restantes = cantidad
+        while restantes > 0:
+            objetivo = min(restantes, tamaño_lote)
+            # Se pide un 30% de más para cubrir los bytes y contraseñas descartados
+            n_bytes = int(objetivo * self.longitud / self._aceptados * 1.3) + self.longitud
+            bloque = os.urandom(n_bytes).translate(self._tabla, self._descartar).decode('ascii')
+            candidatas = self._trocear(bloque)
+            if self._completa is not None:
+                candidatas = list(filter(self._completa, candidatas))
+            if len(candidatas) > objetivo:
+                del candidatas[objetivo:]
+            restantes -= len(candidatas)
+            if candidatas:
+                yield candidatas
+
+    def generar(self, cantidad: int) -> List[str]:
+        contraseñas = []
+        for lote in self.lotes(cantidad):
+            contraseñas.extend(lote)
+        return contraseñas
+
+def generar_lote(cantidad: int, longitud: int = 16, **opciones) -> List[str]:
+    """Versión en bloque de generar_contraseña; acepta las mismas opciones de caracteres"""
+    return GeneradorLotes(longitud, **opciones).generar(cantidad)
+
+def escribir_lotes(generador: GeneradorLotes, cantidad: int, salida: TextIO, formato: str = 'jsonl',
+                   acumulador: Optional['Acumulador'] = None) -> int:
+    """Escribe las contraseñas a medida que se generan, sin acumularlas en memoria.
+
+    Con un estadisticas.Acumulador, cada lote se añade también a su informe agregado.
+    """
+    # Ningún alfabeto contiene comillas ni barras invertidas, así que no hace falta escapar
+    if formato == 'csv':
+        salida.write('contraseña\n')
+        plantilla = '"{}"'
+    elif formato == 'jsonl':
+        plantilla = '{{"contraseña": "{}"}}'
+    else:
+        plantilla = '{}'
+    escritas = 0
+    for lote in generador.lotes(cantidad):
+        if acumulador is not None:
+            acumulador.agregar(lote)
+        if plantilla != '{}':
+            lote = [plantilla.format(p) for p in lote]
+        salida.write('\n'.join(lote))
+        salida.write('\n')
+        escritas += len(lote)
+    salida.flush()
+    return escritas
+
 def calcular_entropia(contraseña: str) -> float:
-    import math
-    from collections import Counter
-    
+    """Entropía de Shannon de los caracteres por la longitud; para lotes grandes, estadisticas.py"""
     frecuencias = Counter(contraseña)
     longitud = len(contraseña)
     
@@ -98,17 +201,102 @@ Opciones de caracteres:
 
 Opciones de salida:
   --no-copiar           No copiar automáticamente la contraseña al portapapeles
+  -q, --quiet           Solo imprimir las contraseñas, sin banner, animación ni pausas
+                        (es lo que se hace siempre que la salida no es una terminal)
+
+Generación en bloque:
+  --bulk                Generar sin animaciones ni pausas, escribiendo según se genera
+  --formato FORMATO     Formato de salida en bloque: jsonl, csv o txt (por defecto: jsonl)
+  -o, --salida ARCHIVO  Escribir en un archivo en lugar de la salida estándar
+  --estadisticas        Al terminar, escribir en stderr un informe agregado de entropía,
+                        longitudes y clases de caracteres (necesita numpy)
 
 Ejemplos:
   python generador.py -l 20 --sin-especiales
   python generador.py --longitud 12 --cantidad 3 --no-copiar
   python generador.py --sin-numeros --incluir-ambiguos
+  python generador.py --bulk -n 100000 --formato csv -o cuentas.csv
 """)
     exit(0)
 
+def generar_silencioso(args) -> int:
+    """Una contraseña por línea y nada más, para scripts"""
+    try:
+        for _ in range(args.cantidad):
+            print(generar_contraseña(
+                longitud=args.longitud,
+                usar_mayusculas=args.mayusculas,
+                usar_minusculas=args.minusculas,
+                usar_numeros=args.numeros,
+                usar_especiales=args.especiales,
+                excluir_ambiguos=args.excluir_ambiguos
+            ))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        return 0
+    return 0
+
+def generar_en_bloque(args) -> int:
+    """Modo --bulk: sin animaciones, pausas ni portapapeles, escribiendo según se genera"""
+    try:
+        generador = GeneradorLotes(
+            longitud=args.longitud,
+            usar_mayusculas=args.mayusculas,
+            usar_minusculas=args.minusculas,
+            usar_numeros=args.numeros,
+            usar_especiales=args.especiales,
+            excluir_ambiguos=args.excluir_ambiguos
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    acumulador = None
+    if args.estadisticas:
+        try:
+            from estadisticas import Acumulador
+            acumulador = Acumulador(peores=0)
+        except ImportError as e:
+            print(f"Advertencia: No se pueden calcular las estadísticas: {e}", file=sys.stderr)
+
+    salida = open(args.salida, 'w', encoding='utf-8') if args.salida else sys.stdout
+    try:
+        escribir_lotes(generador, args.cantidad, salida, args.formato, acumulador)
+    except KeyboardInterrupt:
+        print("\n[!] Operación cancelada por el usuario", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        return 0
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    if acumulador is not None:
+        import json
+        print(json.dumps(acumulador.informe(), ensure_ascii=False), file=sys.stderr)
+    return 0
+
+def copiar_portapapeles(password: str):
+    try:
+        import pyperclip
+    except ImportError:
+        print("\n¡Atención! El módulo 'pyperclip' no está instalado.")
+        print("La funcionalidad de copiar al portapapeles no estará disponible.")
+        print("Puedes instalarlo con: pip install pyperclip")
+        return
+    try:
+        pyperclip.copy(password)
+        print("\n\033[1;32m✓ Contraseña copiada al portapapeles\033[0m")
+    except Exception as e:
+        print(f"\n\033[1;31m✗ No se pudo copiar al portapapeles: {e}\033[0m")
+
 def main():
     
-    if len(sys.argv) == 1 or '--help' in sys.argv or '-h' in sys.argv:
+    # Sin terminal (scripts, tuberías) o con --quiet no hay banner, animación ni pausas
+    silencioso = '-q' in sys.argv or '--quiet' in sys.argv or not sys.stdout.isatty()
+    
+    if not silencioso and (len(sys.argv) == 1 or '--help' in sys.argv or '-h' in sys.argv):
         mostrar_banner()
     
     parser = argparse.ArgumentParser(
@@ -171,6 +359,32 @@ def main():
         dest='copiar', 
         help=argparse.SUPPRESS
     )
+    parser.add_argument(
+        '-q', '--quiet', 
+        action='store_true', 
+        help=argparse.SUPPRESS
+    )
+    parser.add_argument(
+        '--bulk', 
+        action='store_true', 
+        help=argparse.SUPPRESS
+    )
+    parser.add_argument(
+        '--formato', 
+        choices=['jsonl', 'csv', 'txt'], 
+        default='jsonl', 
+        help=argparse.SUPPRESS
+    )
+    parser.add_argument(
+        '-o', '--salida', 
+        default=None, 
+        help=argparse.SUPPRESS
+    )
+    parser.add_argument(
+        '--estadisticas', 
+        action='store_true', 
+        help=argparse.SUPPRESS
+    )
     
     
     args = parser.parse_args()
@@ -187,6 +401,12 @@ def main():
     
     args = parser.parse_args()
     
+    if args.bulk:
+        return generar_en_bloque(args)
+    
+    if silencioso:
+        return generar_silencioso(args)
+    
     try:
         print("\n" + "="*60)
         print("\033[1mGENERANDO CONTRASEÑA SEGURA...\033[0m")
@@ -221,16 +441,11 @@ def main():
             print("-"*60)
             
         
-            entropia = calcular_entropia(password)
-            mostrar_estadisticas(entropia, len(password))
+            mostrar_estadisticas(calcular_entropia(password), len(password))
             
         
             if args.copiar and args.cantidad == 1:
-                try:
-                    pyperclip.copy(password)
-                    print("\n\033[1;32m✓ Contraseña copiada al portapapeles\033[0m")
-                except Exception as e:
-                    print(f"\n\033[1;31m✗ No se pudo copiar al portapapeles: {e}\033[0m")
+                copiar_portapapeles(password)
             
             if _ < args.cantidad - 1:
                 print("\n" + "-"*60)
@@ -248,16 +463,4 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    try:
-        import pyperclip
-    except ImportError:
-        print("¡Atención! El módulo 'pyperclip' no está instalado.")
-        print("La funcionalidad de copiar al portapapeles no estará disponible.")
-        print("Puedes instalarlo con: pip install pyperclip")
-        
-        import types
-        sys.modules['pyperclip'] = types.SimpleNamespace(copy=lambda x: None)
-        pyperclip = sys.modules['pyperclip']
-    
-    import sys
     sys.exit(main())
@@ -0,0 +1,201 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import os
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional
+
+import metricas
+
+# bcrypt y concurrent.futures se importan al usarse para que importar este módulo sea barato
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# El coste se configura con PASSCOR_BCRYPT_ROUNDS (12 por defecto); con PASSCOR_BCRYPT_ROUNDS=auto
+# se calibra al arrancar para que cada hash tarde como mucho PASSCOR_BCRYPT_MS
+PRESUPUESTO_MS = float(os.environ.get('PASSCOR_BCRYPT_MS', 250))
+COSTO_POR_DEFECTO = 12
+COSTO_MINIMO = 10
+COSTO_MAXIMO = 20
+COSTO_REFERENCIA = 8
+# bcrypt solo usa los primeros 72 bytes; desde bcrypt 5 las contraseñas más largas dan ValueError
+MAX_BYTES_BCRYPT = 72
+
+_costo_objetivo: Optional[int] = None
+_lock_costo = threading.Lock()
+
+def calibrar_costo(presupuesto_ms: float = PRESUPUESTO_MS, repeticiones: int = 3) -> int:
+    """Elige el mayor coste de bcrypt cuyo hash cabe en el presupuesto en esta máquina.
+
+    Se mide un coste bajo y se extrapola: cada punto de coste duplica el trabajo.
+    """
+    import bcrypt
+
+    sal = bcrypt.gensalt(rounds=COSTO_REFERENCIA)
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        bcrypt.hashpw(b'calibracion', sal)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    costo = COSTO_REFERENCIA
+    while costo < COSTO_MAXIMO and mejor * 1000 * 2 ** (costo + 1 - COSTO_REFERENCIA) <= presupuesto_ms:
+        costo += 1
+    return max(COSTO_MINIMO, costo)
+
+def costo_objetivo() -> int:
+    """Coste que se usa para los hashes nuevos; nunca se calibra a mitad de un inicio de sesión"""
+    global _costo_objetivo
+    if _costo_objetivo is None:
+        with _lock_costo:
+            if _costo_objetivo is None:
+                fijo = os.environ.get('PASSCOR_BCRYPT_ROUNDS')
+                _costo_objetivo = int(fijo) if fijo and fijo != 'auto' else COSTO_POR_DEFECTO
+    return _costo_objetivo
+
+def calibrar_al_arrancar() -> int:
+    """Con PASSCOR_BCRYPT_ROUNDS=auto calibra el coste una vez; se llama al arrancar cada programa.
+
+    Así la medida se toma antes de atender a nadie (y antes de crear procesos hijos, que
+    heredan el resultado) en lugar de en el primer inicio de sesión con la CPU ocupada.
+    """
+    global _costo_objetivo
+    if os.environ.get('PASSCOR_BCRYPT_ROUNDS') == 'auto':
+        with _lock_costo:
+            _costo_objetivo = calibrar_costo()
+    return costo_objetivo()
+
+def es_hash_bcrypt(valor: str) -> bool:
+    """Si valor tiene la forma de un hash bcrypt ($2a$, $2b$ o $2y$, 60 caracteres)"""
+    return len(valor) == 60 and valor[:4] in ('$2a$', '$2b$', '$2y$')
+
+def costo_de_hash(hashed: bytes) -> int:
+    """Lee el coste de un hash con formato $2b$12$..."""
+    return int(hashed.split(b'$')[2])
+
+def necesita_rehash(hashed: bytes) -> bool:
+    """Solo se sube el coste: un hash guardado nunca se rehashea a un coste menor"""
+    return costo_de_hash(hashed) < costo_objetivo()
+
+_T_HASH = metricas.histograma('passcor_bcrypt_segundos', 'Duración de cada operación bcrypt', operacion='hash')
+_T_VERIFICAR = metricas.histograma('passcor_bcrypt_segundos', 'Duración de cada operación bcrypt', operacion='verificar')
+
+@metricas.cronometrado(_T_HASH)
+def hash_contraseña(contraseña: str, rounds: Optional[int] = None) -> bytes:
+    import bcrypt
+
+    rounds = rounds or costo_objetivo()
+    return bcrypt.hashpw(contraseña.encode('utf-8'), bcrypt.gensalt(rounds=rounds))
+
+@metricas.cronometrado(_T_VERIFICAR)
+def comprobar_contraseña(contraseña: str, hashed: bytes) -> bool:
+    import bcrypt
+
+    datos = contraseña.encode('utf-8')
+    # Ninguna contraseña guardada pasa de MAX_BYTES_BCRYPT (el alta lo impide) y bcrypt 5
+    # lanzaría ValueError: una más larga simplemente no coincide
+    if len(datos) > MAX_BYTES_BCRYPT:
+        return False
+    return bcrypt.checkpw(datos, hashed)
+
+def percentiles(muestras: Iterable[float]) -> Dict[str, float]:
+    """p50/p90/p99/máximo en milisegundos de una serie de latencias en segundos"""
+    ordenadas = sorted(muestras)
+    if not ordenadas:
+        return {"n": 0}
+    def p(q: float) -> float:
+        return round(ordenadas[min(len(ordenadas) - 1, int(q * len(ordenadas)))] * 1000, 2)
+    return {"n": len(ordenadas), "p50_ms": p(0.50), "p90_ms": p(0.90), "p99_ms": p(0.99), "max_ms": p(1.0)}
+
+class ServicioHash:
+    """Pool acotado de hilos para bcrypt, que libera el GIL mientras calcula.
+
+    enviar_* bloquea cuando ya hay max_pendientes trabajos en cola o en curso, así que
+    quien produce contraseñas más rápido de lo que se hashean se frena solo en lugar de
+    llenar la memoria. Se guardan las últimas latencias de cada hash para los percentiles.
+    """
+
+    def __init__(self, trabajadores: Optional[int] = None, max_pendientes: Optional[int] = None,
+                 rounds: Optional[int] = None, muestras: int = 10000):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.rounds = rounds or costo_objetivo()
+        self._pool = ThreadPoolExecutor(max_workers=self.trabajadores, thread_name_prefix='bcrypt')
+        self._cupo = threading.BoundedSemaphore(max_pendientes or self.trabajadores * 4)
+        self._latencias = deque(maxlen=muestras)
+        self._lock = threading.Lock()
+
+    def _medir(self, funcion, *args):
+        inicio = time.perf_counter()
+        try:
+            return funcion(*args)
+        finally:
+            duracion = time.perf_counter() - inicio
+            with self._lock:
+                self._latencias.append(duracion)
+
+    def _enviar(self, funcion, *args) -> 'Future':
+        self._cupo.acquire()
+        try:
+            futuro = self._pool.submit(self._medir, funcion, *args)
+        except Exception:
+            self._cupo.release()
+            raise
+        futuro.add_done_callback(lambda _: self._cupo.release())
+        return futuro
+
+    def enviar_hash(self, contraseña: str) -> 'Future':
+        return self._enviar(hash_contraseña, contraseña, self.rounds)
+
+    def enviar_verificacion(self, contraseña: str, hashed: bytes) -> 'Future':
+        return self._enviar(comprobar_contraseña, contraseña, hashed)
+
+    def hash(self, contraseña: str) -> bytes:
+        return self.enviar_hash(contraseña).result()
+
+    def verificar(self, contraseña: str, hashed: bytes) -> bool:
+        return self.enviar_verificacion(contraseña, hashed).result()
+
+    def hash_lote(self, contraseñas: Iterable[str]) -> Iterator[bytes]:
+        """Hashea en paralelo y devuelve los resultados en el mismo orden de entrada"""
+        pendientes = deque()
+        for contraseña in contraseñas:
+            # Al enviar se bloquea si el pool está lleno; mientras, se van entregando los listos
+            while pendientes and pendientes[0].done():
+                yield pendientes.popleft().result()
+            pendientes.append(self.enviar_hash(contraseña))
+        while pendientes:
+            yield pendientes.popleft().result()
+
+    def latencias(self) -> Dict[str, float]:
+        with self._lock:
+            muestras = list(self._latencias)
+        return percentiles(muestras)
+
+    def cerrar(self):
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Calibra el coste de bcrypt para esta máquina')
+    parser.add_argument('--presupuesto', type=float, default=PRESUPUESTO_MS, help='Latencia máxima por hash en ms')
+    args = parser.parse_args()
+
+    costo = calibrar_costo(args.presupuesto)
+    inicio = time.perf_counter()
+    hash_contraseña('calibracion', costo)
+    print(f"Coste elegido: {costo} ({(time.perf_counter() - inicio) * 1000:.0f} ms por hash)")
+    print(f"Para fijarlo: export PASSCOR_BCRYPT_ROUNDS={costo}")
+    return 0
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,297 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+import persistencia
+from hashing import ServicioHash, calibrar_al_arrancar, es_hash_bcrypt
+from rangos import AlmacenRangos
+from validador import motivo_rechazo, cargar_indice, cargar_automata, cargar_rangos, preparar_lista
+
+TAMAÑO_LOTE = 1000
+INTERVALO_PROGRESO = 2.0
+# Columnas aceptadas: contraseña en claro, o un hash bcrypt ya calculado (el formato de export)
+COLUMNA_USUARIO = 'usuario'
+COLUMNA_CONTRASEÑA = 'contraseña'
+COLUMNA_HASH = 'hash_contraseña'
+
+# Una fila leída: (línea del CSV, usuario, contraseña o hash, si es un hash)
+Fila = Tuple[int, str, str, bool]
+
+_lista_comunes = None
+_automata = None
+_rangos: Optional[AlmacenRangos] = None
+
+def _iniciar_trabajador(ruta_lista: str, ruta_rangos: Optional[str] = None):
+    """Cada proceso abre sus propios mapas del índice y del autómata; las páginas se comparten"""
+    global _lista_comunes, _automata, _rangos
+    _lista_comunes = cargar_indice(ruta_lista)
+    _automata = cargar_automata(ruta_lista)
+    _rangos = cargar_rangos(ruta_rangos) if ruta_rangos else None
+
+def validar_lote(filas: List[Fila]) -> List[Optional[str]]:
+    """Motivo de rechazo de cada fila del lote (None si se acepta)"""
+    motivos = []
+    for _, usuario, valor, es_hash in filas:
+        if not usuario:
+            motivos.append("Falta el nombre de usuario")
+        elif es_hash:
+            motivos.append(None if es_hash_bcrypt(valor) else "El hash no tiene formato bcrypt")
+        else:
+            # Las mismas reglas que al crear un usuario desde el menú
+            motivos.append(motivo_rechazo(valor, _lista_comunes, _automata, _rangos))
+    return motivos
+
+def leer_filas(entrada: TextIO, tamaño_lote: int) -> Iterator[List[Fila]]:
+    """Lotes de filas de un CSV con cabecera usuario y contraseña (o hash_contraseña)"""
+    lector = csv.DictReader(entrada)
+    columnas = lector.fieldnames or []
+    if COLUMNA_USUARIO not in columnas or not (COLUMNA_CONTRASEÑA in columnas or COLUMNA_HASH in columnas):
+        raise ValueError(f"El CSV debe tener las columnas '{COLUMNA_USUARIO}' y "
+                         f"'{COLUMNA_CONTRASEÑA}' o '{COLUMNA_HASH}'")
+    lote: List[Fila] = []
+    for fila in lector:
+        contraseña = fila.get(COLUMNA_CONTRASEÑA)
+        if contraseña:
+            lote.append((lector.line_num, (fila[COLUMNA_USUARIO] or '').strip(), contraseña, False))
+        else:
+            lote.append((lector.line_num, (fila[COLUMNA_USUARIO] or '').strip(), fila.get(COLUMNA_HASH) or '', True))
+        if len(lote) >= tamaño_lote:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+class _Informe:
+    """Escribe el JSONL de resultados, lleva los contadores y muestra el progreso en stderr"""
+
+    def __init__(self, salida: TextIO, progreso: bool):
+        self.salida = salida
+        self.progreso = progreso
+        self.contadores = {"leidas": 0, "creados": 0, "rechazados": 0, "existentes": 0, "duplicados": 0}
+        self.hashes = 0
+        self.inicio = time.perf_counter()
+        self._ultimo = self.inicio
+
+    def escribir(self, linea: int, usuario: str, estado: str, mensaje: Optional[str] = None):
+        registro = {"linea": linea, "usuario": usuario, "estado": estado}
+        if mensaje:
+            registro["mensaje"] = mensaje
+        self.salida.write(json.dumps(registro, ensure_ascii=False))
+        self.salida.write('\n')
+        self.contadores[estado + 's'] += 1
+
+    def mostrar(self, final: bool = False):
+        ahora = time.perf_counter()
+        if not self.progreso or (not final and ahora - self._ultimo < INTERVALO_PROGRESO):
+            return
+        self._ultimo = ahora
+        segundos = ahora - self.inicio
+        print(f"\r[+] {self.contadores['leidas']} filas, {self.contadores['creados']} creados, "
+              f"{self.contadores['rechazados']} rechazados, "
+              f"{self.hashes / segundos if segundos else 0:.1f} hashes/s", end='\n' if final else '',
+              file=sys.stderr, flush=True)
+
+def _validar_en_paralelo(validadores, lotes: Iterator[List[Fila]],
+                        procesos: int) -> Iterator[Tuple[List[Fila], List[Optional[str]]]]:
+    """Valida en el pool con como mucho procesos * 2 lotes en vuelo, conservando el orden"""
+    en_vuelo = deque()
+    for filas in lotes:
+        if len(en_vuelo) >= procesos * 2:
+            anteriores, resultado = en_vuelo.popleft()
+            yield anteriores, resultado.get()
+        en_vuelo.append((filas, validadores.apply_async(validar_lote, (filas,))))
+    while en_vuelo:
+        anteriores, resultado = en_vuelo.popleft()
+        yield anteriores, resultado.get()
+
+def importar(entrada: TextIO, salida: TextIO, ruta_lista: str = 'TXT/contras.txt',
+             ruta_rangos: Optional[str] = None, procesos: Optional[int] = None,
+             hilos_hash: Optional[int] = None, tamaño_lote: int = TAMAÑO_LOTE,
+             pool: Optional[persistencia.PoolConexiones] = None, progreso: bool = False) -> Dict[str, object]:
+    """Importa usuarios de un CSV y escribe un resultado JSONL por fila.
+
+    Las contraseñas se validan por lotes en un pool de procesos (las mismas reglas que el
+    menú), los usuarios que ya existen o se repiten en el archivo se descartan antes de
+    hashear, los hashes se calculan en un ServicioHash que ocupa todos los núcleos y los
+    creados se insertan con executemany en una transacción por lote. El coste lo marca
+    bcrypt: el resto del trabajo se solapa con él.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    pool = pool or persistencia.obtener_pool()
+    persistencia.inicializar(pool)
+    informe = _Informe(salida, progreso)
+    vistos: Set[str] = set()
+
+    def candidatos(lotes_validados) -> Iterator[Fila]:
+        """Filas aceptadas y nuevas, en orden; las demás ya quedan en el informe"""
+        for filas, motivos in lotes_validados:
+            informe.contadores["leidas"] += len(filas)
+            existentes = persistencia.obtener_hashes(pool, {f[1] for f, m in zip(filas, motivos) if m is None})
+            for fila, motivo in zip(filas, motivos):
+                linea, usuario = fila[0], fila[1]
+                if motivo is not None:
+                    informe.escribir(linea, usuario, 'rechazado', motivo)
+                elif usuario in existentes:
+                    informe.escribir(linea, usuario, 'existente', "El nombre de usuario ya existe")
+                elif usuario in vistos:
+                    informe.escribir(linea, usuario, 'duplicado', "El usuario se repite en el archivo")
+                else:
+                    vistos.add(usuario)
+                    yield fila
+            informe.mostrar()
+
+    def guardar(filas: List[Fila], hashes: List[str]):
+        insertados = persistencia.insertar_usuarios(pool, [(f[1], h) for f, h in zip(filas, hashes)])
+        guardados = None
+        if insertados != len(filas):
+            # Alguien creó alguno de estos usuarios mientras se hasheaba; se averigua cuáles
+            guardados = persistencia.obtener_hashes(pool, [f[1] for f in filas])
+        for fila, hashed in zip(filas, hashes):
+            if guardados is None or guardados.get(fila[1]) == hashed:
+                informe.escribir(fila[0], fila[1], 'creado')
+            else:
+                informe.escribir(fila[0], fila[1], 'existente', "El nombre de usuario ya existe")
+
+    def procesar(lotes_validados: Iterator[Tuple[List[Fila], List[Optional[str]]]], servicio: ServicioHash):
+        # Como en ServicioHash.hash_lote: se envía sin esperar y se entregan los hashes en orden.
+        # Los que ya vienen hasheados en el CSV no pasan por bcrypt.
+        en_vuelo = deque()
+        pendientes: List[Fila] = []
+        calculados: List[str] = []
+
+        def entregar():
+            fila, hashed = en_vuelo.popleft()
+            if not isinstance(hashed, str):
+                try:
+                    hashed = hashed.result().decode('utf-8')
+                except ValueError as e:
+                    # Un fallo de bcrypt descarta solo esta fila, no la importación entera
+                    informe.escribir(fila[0], fila[1], 'rechazado', f"No se pudo hashear la contraseña: {e}")
+                    return
+                informe.hashes += 1
+            pendientes.append(fila)
+            calculados.append(hashed)
+            if len(pendientes) >= tamaño_lote:
+                guardar(pendientes, calculados)
+                pendientes.clear()
+                calculados.clear()
+                informe.mostrar()
+
+        for fila in candidatos(lotes_validados):
+            while en_vuelo and (isinstance(en_vuelo[0][1], str) or en_vuelo[0][1].done()):
+                entregar()
+            en_vuelo.append((fila, fila[2] if fila[3] else servicio.enviar_hash(fila[2])))
+        while en_vuelo:
+            entregar()
+        if pendientes:
+            guardar(pendientes, calculados)
+
+    with ServicioHash(trabajadores=hilos_hash) as servicio:
+        if procesos == 1:
+            _iniciar_trabajador(ruta_lista, ruta_rangos)
+            procesar(((filas, validar_lote(filas)) for filas in leer_filas(entrada, tamaño_lote)), servicio)
+        else:
+            preparar_lista(ruta_lista)
+            with multiprocessing.Pool(procesos, initializer=_iniciar_trabajador,
+                                      initargs=(ruta_lista, ruta_rangos)) as validadores:
+                procesar(_validar_en_paralelo(validadores, leer_filas(entrada, tamaño_lote), procesos), servicio)
+        latencias = servicio.latencias()
+
+    informe.mostrar(final=True)
+    salida.flush()
+    resumen: Dict[str, object] = dict(informe.contadores)
+    segundos = time.perf_counter() - informe.inicio
+    resumen["segundos"] = round(segundos, 3)
+    resumen["por_segundo"] = round(informe.contadores["leidas"] / segundos, 1) if segundos else 0
+    resumen["hashes_por_segundo"] = round(informe.hashes / segundos, 1) if segundos else 0
+    resumen["latencia_hash"] = latencias
+    return resumen
+
+def exportar(salida: TextIO, pool: Optional[persistencia.PoolConexiones] = None,
+             formato: str = 'csv') -> int:
+    """Vuelca usuario y hash de todos los usuarios, por páginas; importar acepta el CSV tal cual"""
+    pool = pool or persistencia.obtener_pool()
+    persistencia.inicializar(pool)
+    total = 0
+    escritor = csv.writer(salida, lineterminator='\n') if formato == 'csv' else None
+    if escritor is not None:
+        escritor.writerow([COLUMNA_USUARIO, COLUMNA_HASH])
+    for pagina in persistencia.iterar_usuarios(pool):
+        if escritor is not None:
+            escritor.writerows(pagina)
+        else:
+            for usuario, hashed in pagina:
+                salida.write(json.dumps({COLUMNA_USUARIO: usuario, COLUMNA_HASH: hashed}, ensure_ascii=False))
+                salida.write('\n')
+        total += len(pagina)
+    salida.flush()
+    return total
+
+def main_importar(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='validador.py import',
+        description='Crea usuarios en bloque desde un CSV (usuario,contraseña o usuario,hash_contraseña) '
+                    'y emite un resultado JSONL por fila'
+    )
+    parser.add_argument('archivo', help="CSV con cabecera ('-' para stdin)")
+    parser.add_argument('-o', '--salida', help='Archivo JSONL de resultados (por defecto: stdout)')
+    parser.add_argument('-p', '--procesos', type=int, default=None,
+                        help='Procesos que validan las contraseñas (por defecto: todos los núcleos)')
+    parser.add_argument('--hilos', type=int, default=None, help='Hilos de bcrypt (por defecto: todos los núcleos)')
+    parser.add_argument('--lote', type=int, default=TAMAÑO_LOTE,
+                        help=f'Filas por lote y por transacción (por defecto: {TAMAÑO_LOTE})')
+    parser.add_argument('--lista', default='TXT/contras.txt', help='Lista de contraseñas comunes')
+    parser.add_argument('--rangos', default=None, help='Directorio de rangos SHA-1 (formato HIBP) a consultar además de la lista')
+    parser.add_argument('--bd', default=persistencia.RUTA_BD, help=f'Base de datos (por defecto: {persistencia.RUTA_BD})')
+    args = parser.parse_args(argv)
+
+    calibrar_al_arrancar()
+    entrada = sys.stdin if args.archivo == '-' else open(args.archivo, 'r', encoding='utf-8', newline='')
+    salida = sys.stdout if not args.salida else open(args.salida, 'w', encoding='utf-8')
+    try:
+        resumen = importar(entrada, salida, args.lista, args.rangos, args.procesos, args.hilos, args.lote,
+                           persistencia.obtener_pool(args.bd), progreso=sys.stderr.isatty())
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print("\n[!] Importación cancelada por el usuario; los lotes ya guardados se conservan", file=sys.stderr)
+        return 1
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+
+    print(json.dumps(resumen, ensure_ascii=False), file=sys.stderr)
+    return 0
+
+def main_exportar(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='validador.py export',
+        description='Exporta usuario y hash de todos los usuarios (nunca hay contraseñas en claro)'
+    )
+    parser.add_argument('-o', '--salida', help='Archivo de salida (por defecto: stdout)')
+    parser.add_argument('--formato', choices=['csv', 'jsonl'], default='csv', help='Formato de salida (por defecto: csv)')
+    parser.add_argument('--bd', default=persistencia.RUTA_BD, help=f'Base de datos (por defecto: {persistencia.RUTA_BD})')
+    args = parser.parse_args(argv)
+
+    salida = sys.stdout if not args.salida else open(args.salida, 'w', encoding='utf-8', newline='')
+    try:
+        total = exportar(salida, persistencia.obtener_pool(args.bd), args.formato)
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    print(json.dumps({"exportados": total}), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main_importar())
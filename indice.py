@@ -0,0 +1,245 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+
+MAGIA = b'PASSCOR1'
+CABECERA = struct.Struct('<8sQ')
+ANCHO_CLAVE = 8
+# Claves que se ordenan a la vez en memoria al compilar (unos 40 MB en el pico)
+CLAVES_POR_TRAMO = 1 << 20
+
+def clave_contraseña(contraseña: str) -> int:
+    """Prefijo de 64 bits del hash de la contraseña, usado como clave del índice"""
+    digest = hashlib.blake2b(contraseña.encode('utf-8'), digest_size=ANCHO_CLAVE).digest()
+    return int.from_bytes(digest, 'little')
+
+def ruta_indice(ruta_lista: str) -> str:
+    return os.path.splitext(ruta_lista)[0] + '.idx'
+
+def leer_lista(ruta_lista: str) -> Iterable[str]:
+    with open(ruta_lista, 'r', encoding='utf-8', errors='replace') as f:
+        for linea in f:
+            linea = linea.strip()
+            if linea:
+                yield linea
+
+@contextmanager
+def escritura_atomica(destino: str) -> Iterator[BinaryIO]:
+    """Archivo temporal con nombre único junto a destino, que lo sustituye al cerrarse sin errores.
+
+    Varios procesos pueden compilar el mismo archivo a la vez: cada uno escribe su propio
+    temporal y el último os.replace gana, sin que ninguno pise el archivo de otro.
+    """
+    directorio = os.path.dirname(os.path.abspath(destino))
+    descriptor, temporal = tempfile.mkstemp(prefix=os.path.basename(destino) + '.', suffix='.tmp', dir=directorio)
+    try:
+        with os.fdopen(descriptor, 'wb') as f:
+            yield f
+        # mkstemp crea el archivo con permisos 0600; el resultado se lee como cualquier otro
+        os.chmod(temporal, 0o644)
+        os.replace(temporal, destino)
+    except BaseException:
+        try:
+            os.unlink(temporal)
+        except OSError:
+            pass
+        raise
+
+def escribir_indice(claves: Iterable[int], destino: str) -> int:
+    """Escribe claves ya ordenadas y sin duplicados en formato de índice"""
+    total = 0
+    with escritura_atomica(destino) as f:
+        f.write(CABECERA.pack(MAGIA, 0))
+        bloque = array('Q')
+        for clave in claves:
+            bloque.append(clave)
+            if len(bloque) >= 65536:
+                _escribir_bloque(f, bloque)
+                total += len(bloque)
+                bloque = array('Q')
+        _escribir_bloque(f, bloque)
+        total += len(bloque)
+        f.seek(0)
+        f.write(CABECERA.pack(MAGIA, total))
+    return total
+
+def _escribir_bloque(f, bloque: array):
+    if sys.byteorder != 'little':
+        bloque.byteswap()
+    bloque.tofile(f)
+
+def _sin_duplicados(claves: Iterable[int]) -> Iterable[int]:
+    anterior = None
+    for clave in claves:
+        if clave != anterior:
+            yield clave
+            anterior = clave
+
+def _leer_tramo(ruta: str) -> Iterator[int]:
+    with open(ruta, 'rb') as f:
+        while True:
+            bloque = array('Q')
+            try:
+                bloque.fromfile(f, 65536)
+            except EOFError:
+                pass
+            if not bloque:
+                return
+            yield from bloque
+
+def ordenar_claves(claves: Iterable[int], directorio: str, por_tramo: int = CLAVES_POR_TRAMO) -> Iterator[int]:
+    """Ordena claves de 64 bits con memoria acotada: tramos ordenados en disco y mezcla final.
+
+    Si todas caben en un tramo no se escribe nada en disco.
+    """
+    tramos: List[str] = []
+    try:
+        bloque = array('Q')
+        for clave in claves:
+            bloque.append(clave)
+            if len(bloque) >= por_tramo:
+                tramos.append(_volcar_tramo(bloque, directorio))
+                bloque = array('Q')
+        bloque = array('Q', sorted(bloque))
+        if not tramos:
+            yield from bloque
+            return
+        if bloque:
+            tramos.append(_volcar_tramo(bloque, directorio, ordenado=True))
+        del bloque
+        yield from heapq.merge(*(_leer_tramo(t) for t in tramos))
+    finally:
+        for tramo in tramos:
+            os.unlink(tramo)
+
+def _volcar_tramo(bloque: array, directorio: str, ordenado: bool = False) -> str:
+    descriptor, ruta = tempfile.mkstemp(suffix='.tramo', dir=directorio)
+    with os.fdopen(descriptor, 'wb') as f:
+        (bloque if ordenado else array('Q', sorted(bloque))).tofile(f)
+    return ruta
+
+def compilar_indice(ruta_lista: str, destino: Optional[str] = None, por_tramo: int = CLAVES_POR_TRAMO) -> int:
+    """Convierte una lista de contraseñas en un índice ordenado de hashes de 64 bits.
+
+    La memoria no depende del tamaño de la lista: como mucho se ordenan por_tramo claves
+    a la vez, junto al índice de destino.
+    """
+    destino = destino or ruta_indice(ruta_lista)
+    claves = (clave_contraseña(c) for c in leer_lista(ruta_lista))
+    directorio = os.path.dirname(os.path.abspath(destino))
+    return escribir_indice(_sin_duplicados(ordenar_claves(claves, directorio, por_tramo)), destino)
+
+class IndiceComunes:
+    """Índice de contraseñas comunes en disco, mapeado en memoria y consultado por búsqueda binaria.
+
+    Las páginas del archivo las comparte el sistema operativo entre todos los procesos
+    que abren el mismo índice, y abrirlo no lee nada más allá de la cabecera.
+    """
+
+    def __init__(self, ruta: str, filtro=None):
+        self.ruta = ruta
+        self.filtro = filtro
+        self._archivo = open(ruta, 'rb')
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._archivo.close()
+            raise
+        magia, total = CABECERA.unpack_from(self._mapa, 0)
+        if magia != MAGIA or len(self._mapa) != CABECERA.size + total * ANCHO_CLAVE:
+            self.cerrar()
+            raise ValueError(f"El archivo {ruta} no es un índice de Passcor válido")
+        self.total = total
+        self._vista = memoryview(self._mapa)[CABECERA.size:]
+        if sys.byteorder == 'little':
+            self._claves = self._vista.cast('Q')
+        else:
+            # En máquinas big-endian no se puede reinterpretar el mapa directamente
+            self._claves = array('Q', self._vista.tobytes())
+            self._claves.byteswap()
+
+    def __len__(self) -> int:
+        return self.total
+
+    def contiene_clave(self, clave: int) -> bool:
+        pos = bisect_left(self._claves, clave)
+        return pos < self.total and self._claves[pos] == clave
+
+    def __contains__(self, contraseña: str) -> bool:
+        clave = clave_contraseña(contraseña)
+        if self.filtro is not None and not self.filtro.contiene_clave(clave):
+            return False
+        return self.contiene_clave(clave)
+
+    def cerrar(self):
+        if self.filtro is not None:
+            self.filtro.cerrar()
+            self.filtro = None
+        for vista in (getattr(self, '_claves', None), getattr(self, '_vista', None)):
+            if isinstance(vista, memoryview):
+                vista.release()
+        self._claves = array('Q')
+        self._mapa.close()
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+def indice_actualizado(ruta_lista: str, ruta_idx: str) -> bool:
+    try:
+        return os.path.getmtime(ruta_idx) >= os.path.getmtime(ruta_lista)
+    except OSError:
+        return False
+
+def preparar_indice(ruta_lista: str, ruta_idx: Optional[str] = None) -> str:
+    """Compila el índice si no existe o está desactualizado y devuelve su ruta.
+
+    Quien vaya a arrancar varios procesos que abren el índice debe llamarlo antes, para
+    compilar una sola vez en lugar de una por proceso.
+    """
+    ruta_idx = ruta_idx or ruta_indice(ruta_lista)
+    if os.path.exists(ruta_lista) and not indice_actualizado(ruta_lista, ruta_idx):
+        compilar_indice(ruta_lista, ruta_idx)
+    return ruta_idx
+
+def abrir_indice(ruta_lista: str, ruta_idx: Optional[str] = None, usar_filtro: bool = False) -> IndiceComunes:
+    """Abre el índice de una lista, compilándolo antes si no existe o está desactualizado.
+
+    Con usar_filtro se antepone un filtro de Bloom (ver filtro.py) que evita tocar el
+    índice para casi todas las contraseñas que no están en la lista.
+    """
+    ruta_idx = preparar_indice(ruta_lista, ruta_idx)
+    filtro = None
+    if usar_filtro:
+        from filtro import abrir_filtro
+        filtro = abrir_filtro(ruta_lista)
+    return IndiceComunes(ruta_idx, filtro)
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compila una lista de contraseñas comunes en un índice')
+    parser.add_argument('lista', nargs='?', default='TXT/contras.txt', help='Archivo de texto con una contraseña por línea')
+    parser.add_argument('-o', '--salida', help='Ruta del índice (por defecto junto a la lista, con extensión .idx)')
+    args = parser.parse_args()
+
+    destino = args.salida or ruta_indice(args.lista)
+    total = compilar_indice(args.lista, destino)
+    print(f"Índice escrito en {destino}: {total} contraseñas únicas")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
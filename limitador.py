@@ -0,0 +1,273 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import math
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+import metricas
+
+def metricas_limitador(nombre: str) -> Tuple[metricas.Contador, metricas.Contador, metricas.Contador]:
+    """Contadores (denegados, permitidos, bloqueos) de un limitador; se indexan con la decisión"""
+    def decisiones(resultado: str) -> metricas.Contador:
+        return metricas.contador('passcor_limitador_decisiones_total', 'Intentos según la decisión del limitador',
+                                 limitador=nombre, resultado=resultado)
+    return (decisiones('denegado'), decisiones('permitido'),
+            metricas.contador('passcor_limitador_bloqueos_total', 'Claves bloqueadas por demasiados fallos',
+                              limitador=nombre))
+
+_M_GCRA = metricas_limitador('gcra')
+_M_SQLITE = metricas_limitador('sqlite')
+
+def clave_usuario(usuario: str) -> str:
+    return f"u:{usuario}"
+
+def clave_ip(ip: str) -> str:
+    return f"ip:{ip}"
+
+def clave_usuario_ip(usuario: str, ip: str) -> str:
+    return f"ui:{usuario}@{ip}"
+
+class EstadoClave:
+    __slots__ = ('tat', 'bloqueado_hasta')
+
+    def __init__(self, tat: float, bloqueado_hasta: float = 0.0):
+        self.tat = tat
+        self.bloqueado_hasta = bloqueado_hasta
+
+    def caduca(self) -> float:
+        """Momento a partir del cual el estado equivale a no tener ningún fallo"""
+        return max(self.tat, self.bloqueado_hasta)
+
+class LimitadorGCRA:
+    """Limitador de fallos por clave con GCRA (cubo de fichas expresado como un solo instante).
+
+    Cada clave guarda su TAT (tiempo teórico de llegada): cada fallo lo adelanta
+    ventana / max_intentos segundos y, cuando quedaría a una ventana entera por delante
+    de ahora, la clave se bloquea. Es una ventana deslizante sin guardar cada intento.
+    Las claves caducadas se retiran con una rueda de tiempos (casillas de granularidad
+    segundos), de modo que cada intento cuesta O(1) y la memoria se limita a max_claves.
+    """
+
+    def __init__(self, max_intentos: int = 5, ventana_segundos: float = 900, bloqueo_segundos: float = 3600,
+                 max_claves: int = 1_000_000, granularidad: float = 1.0):
+        self.max_intentos = max_intentos
+        self.ventana = ventana_segundos
+        self.bloqueo = bloqueo_segundos
+        self.intervalo = ventana_segundos / max_intentos
+        self.max_claves = max_claves
+        self.granularidad = granularidad
+        self._estados: Dict[str, EstadoClave] = {}
+        self._rueda: Dict[int, List[str]] = {}
+        self._casilla_actual: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._estados)
+
+    def _programar(self, clave: str, estado: EstadoClave):
+        casilla = math.ceil(estado.caduca() / self.granularidad)
+        self._rueda.setdefault(casilla, []).append(clave)
+
+    def _limpiar(self, ahora: float):
+        casilla = int(ahora // self.granularidad)
+        if self._casilla_actual is None:
+            self._casilla_actual = casilla
+        # Si ha pasado mucho tiempo es más barato recorrer las casillas ocupadas que las vacías
+        if casilla - self._casilla_actual > len(self._rueda):
+            pendientes = sorted(c for c in self._rueda if c <= casilla)
+        else:
+            pendientes = range(self._casilla_actual, casilla + 1)
+        for c in pendientes:
+            for clave in self._rueda.pop(c, ()):
+                estado = self._estados.get(clave)
+                # Las claves se reprograman al cambiar; solo se borra si ya no tiene nada pendiente
+                if estado is not None and estado.caduca() <= ahora:
+                    del self._estados[clave]
+        self._casilla_actual = casilla
+
+    def _desalojar(self):
+        """Con la tabla llena se olvidan primero las claves a las que menos penalización les queda"""
+        while len(self._estados) >= self.max_claves and self._rueda:
+            casilla = min(self._rueda)
+            for clave in self._rueda.pop(casilla):
+                estado = self._estados.get(clave)
+                if estado is not None and math.ceil(estado.caduca() / self.granularidad) <= casilla:
+                    del self._estados[clave]
+
+    def permitido(self, clave: str, ahora: Optional[float] = None) -> bool:
+        ahora = time.time() if ahora is None else ahora
+        estado = self._estados.get(clave)
+        return estado is None or estado.bloqueado_hasta <= ahora
+
+    def intentos_restantes(self, clave: str, ahora: Optional[float] = None) -> int:
+        ahora = time.time() if ahora is None else ahora
+        estado = self._estados.get(clave)
+        if estado is None:
+            return self.max_intentos
+        if estado.bloqueado_hasta > ahora:
+            return 0
+        margen = self.ventana - (max(estado.tat, ahora) - ahora)
+        return max(0, int(margen / self.intervalo + 1e-9))
+
+    def registrar_intento(self, clave: str, exito: bool, ahora: Optional[float] = None) -> bool:
+        """Registra un intento y devuelve si la clave puede seguir intentándolo"""
+        ahora = time.time() if ahora is None else ahora
+        self._limpiar(ahora)
+        estado = self._estados.get(clave)
+
+        if estado is not None and estado.bloqueado_hasta > ahora:
+            _M_GCRA[0].incrementar()
+            return False
+        if exito:
+            if estado is not None:
+                del self._estados[clave]
+            _M_GCRA[1].incrementar()
+            return True
+
+        tat = max(estado.tat if estado is not None else ahora, ahora) + self.intervalo
+        if estado is None:
+            if len(self._estados) >= self.max_claves:
+                self._desalojar()
+            estado = self._estados[clave] = EstadoClave(tat)
+        else:
+            estado.tat = tat
+        permitido = tat - ahora < self.ventana - 1e-9
+        if not permitido:
+            estado.bloqueado_hasta = ahora + self.bloqueo
+            _M_GCRA[2].incrementar()
+        self._programar(clave, estado)
+        _M_GCRA[permitido].incrementar()
+        return permitido
+
+class LimitadorSQLite:
+    """El mismo GCRA que LimitadorGCRA, pero con el estado en una tabla SQLite en modo WAL.
+
+    Así varios procesos de la misma máquina comparten los contadores: cada fallo es un
+    único UPSERT que calcula el nuevo TAT dentro de SQLite, de modo que dos procesos que
+    registran a la vez nunca pisan el intento del otro. Las claves caducadas se borran
+    cada limpieza_cada operaciones usando un índice por instante de caducidad.
+    """
+
+    ESQUEMA = (
+        '''CREATE TABLE IF NOT EXISTS limites (
+            clave TEXT PRIMARY KEY,
+            tat REAL NOT NULL,
+            bloqueado_hasta REAL NOT NULL DEFAULT 0
+        ) WITHOUT ROWID''',
+        "CREATE INDEX IF NOT EXISTS limites_caducidad ON limites(max(tat, bloqueado_hasta))",
+    )
+
+    FALLO = '''
+        INSERT INTO limites (clave, tat, bloqueado_hasta)
+        VALUES (:clave, :ahora + :intervalo,
+                CASE WHEN :intervalo >= :ventana THEN :ahora + :bloqueo ELSE 0 END)
+        ON CONFLICT(clave) DO UPDATE SET
+            tat = CASE WHEN bloqueado_hasta > :ahora THEN tat
+                       ELSE max(tat, :ahora) + :intervalo END,
+            bloqueado_hasta = CASE WHEN bloqueado_hasta > :ahora THEN bloqueado_hasta
+                                   WHEN max(tat, :ahora) + :intervalo - :ahora >= :ventana THEN :ahora + :bloqueo
+                                   ELSE bloqueado_hasta END
+    '''
+
+    def __init__(self, ruta: str = 'limites.db', max_intentos: int = 5, ventana_segundos: float = 900,
+                 bloqueo_segundos: float = 3600, limpieza_cada: int = 10000):
+        self.ruta = ruta
+        self.max_intentos = max_intentos
+        self.ventana = ventana_segundos
+        self.bloqueo = bloqueo_segundos
+        self.intervalo = ventana_segundos / max_intentos
+        self.limpieza_cada = limpieza_cada
+        self._operaciones = 0
+        self._conn = None
+        self._pid = None
+        # RETURNING (SQLite 3.35+) evita una segunda consulta por fallo
+        self._returning = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+    def _conexion(self) -> sqlite3.Connection:
+        # Las conexiones SQLite no sobreviven a un fork: cada proceso abre la suya
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.ruta, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            for sentencia in self.ESQUEMA:
+                conn.execute(sentencia)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def _parametros(self, clave: str, ahora: float) -> dict:
+        return {"clave": clave, "ahora": ahora, "intervalo": self.intervalo,
+                # Margen para que el último intento permitido no se pase por redondeo
+                "ventana": self.ventana - 1e-9, "bloqueo": self.bloqueo}
+
+    def _leer(self, clave: str) -> Optional[Tuple[float, float]]:
+        return self._conexion().execute(
+            "SELECT tat, bloqueado_hasta FROM limites WHERE clave = ?", (clave,)
+        ).fetchone()
+
+    def limpiar(self, ahora: Optional[float] = None) -> int:
+        ahora = time.time() if ahora is None else ahora
+        return self._conexion().execute(
+            "DELETE FROM limites WHERE max(tat, bloqueado_hasta) <= ?", (ahora,)
+        ).rowcount
+
+    def permitido(self, clave: str, ahora: Optional[float] = None) -> bool:
+        ahora = time.time() if ahora is None else ahora
+        fila = self._leer(clave)
+        return fila is None or fila[1] <= ahora
+
+    def intentos_restantes(self, clave: str, ahora: Optional[float] = None) -> int:
+        ahora = time.time() if ahora is None else ahora
+        fila = self._leer(clave)
+        if fila is None:
+            return self.max_intentos
+        tat, bloqueado_hasta = fila
+        if bloqueado_hasta > ahora:
+            return 0
+        margen = self.ventana - (max(tat, ahora) - ahora)
+        return max(0, int(margen / self.intervalo + 1e-9))
+
+    def registrar_intento(self, clave: str, exito: bool, ahora: Optional[float] = None) -> bool:
+        """Registra un intento y devuelve si la clave puede seguir intentándolo"""
+        ahora = time.time() if ahora is None else ahora
+        conn = self._conexion()
+        self._operaciones += 1
+        if self._operaciones % self.limpieza_cada == 0:
+            self.limpiar(ahora)
+
+        if exito:
+            borrado = conn.execute(
+                "DELETE FROM limites WHERE clave = ? AND bloqueado_hasta <= ?", (clave, ahora)
+            ).rowcount
+            permitido = bool(borrado) or self.permitido(clave, ahora)
+            _M_SQLITE[permitido].incrementar()
+            return permitido
+
+        parametros = self._parametros(clave, ahora)
+        if self._returning:
+            bloqueado_hasta = conn.execute(self.FALLO + " RETURNING bloqueado_hasta", parametros).fetchone()[0]
+        else:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(self.FALLO, parametros)
+                bloqueado_hasta = self._leer(clave)[1]
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        if bloqueado_hasta == ahora + self.bloqueo:
+            _M_SQLITE[2].incrementar()
+        permitido = bloqueado_hasta <= ahora
+        _M_SQLITE[permitido].incrementar()
+        return permitido
+
+    def cerrar(self):
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+def limitador_compartido(ruta: Optional[str] = None) -> Optional[LimitadorSQLite]:
+    """LimitadorSQLite en ruta o en PASSCOR_LIMITES; None si no se pidió un limitador compartido"""
+    ruta = ruta or os.environ.get('PASSCOR_LIMITES')
+    return LimitadorSQLite(ruta) if ruta else None
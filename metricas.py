@@ -0,0 +1,244 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import functools
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from threading import get_ident
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+# PASSCOR_METRICAS=0 las desactiva por completo: cada punto de medida se queda en un if
+_activas = os.environ.get('PASSCOR_METRICAS', '1') != '0'
+
+# Límites de las cubetas en segundos: de 50 µs (consultas a SQLite) a 5 s (bcrypt con coste alto)
+LATENCIAS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+             0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+F = TypeVar('F', bound=Callable)
+Etiquetas = Tuple[Tuple[str, str], ...]
+
+def activas() -> bool:
+    return _activas
+
+def activar(valor: bool = True):
+    """Enciende o apaga todas las métricas del proceso; apagadas no cuestan casi nada"""
+    global _activas
+    _activas = valor
+
+class Contador:
+    """Contador monótono; seguro entre hilos.
+
+    Cada hilo suma en su propia celda (sin lock: solo ese hilo la escribe) y la lectura
+    suma todas las celdas, así incrementar no compite con los demás hilos.
+    """
+
+    tipo = 'counter'
+
+    def __init__(self):
+        self._celdas: Dict[int, int] = {}
+
+    @property
+    def valor(self) -> int:
+        return sum(list(self._celdas.values()))
+
+    def incrementar(self, cantidad: int = 1):
+        if not _activas:
+            return
+        celdas = self._celdas
+        hilo = get_ident()
+        # Un identificador reutilizado por un hilo nuevo sigue sumando sobre la misma celda
+        celdas[hilo] = celdas.get(hilo, 0) + cantidad
+
+    def _exportar(self, nombre: str, etiquetas: str) -> List[str]:
+        return [f"{nombre}{etiquetas} {self.valor}"]
+
+    def _instantanea(self) -> object:
+        return self.valor
+
+class Histograma:
+    """Histograma de cubetas fijas (al estilo de Prometheus) con suma y número de observaciones.
+
+    Como en Contador, cada hilo tiene su celda (las cuentas de cada cubeta y, al final, la
+    suma) y las lecturas las combinan.
+    """
+
+    tipo = 'histogram'
+
+    def __init__(self, limites: Tuple[float, ...] = LATENCIAS):
+        self.limites = tuple(sorted(limites))
+        self._celdas: Dict[int, list] = {}
+
+    def _celda(self) -> list:
+        return self._celdas.setdefault(get_ident(), [0] * (len(self.limites) + 1) + [0.0])
+
+    def _combinar(self) -> Tuple[List[int], float]:
+        cuentas = [0] * (len(self.limites) + 1)
+        suma = 0.0
+        for celda in list(self._celdas.values()):
+            celda = celda[:]
+            for i in range(len(cuentas)):
+                cuentas[i] += celda[i]
+            suma += celda[-1]
+        return cuentas, suma
+
+    @property
+    def cuentas(self) -> List[int]:
+        return self._combinar()[0]
+
+    @property
+    def suma(self) -> float:
+        return self._combinar()[1]
+
+    @property
+    def total(self) -> int:
+        return sum(self.cuentas)
+
+    def observar(self, valor: float):
+        if not _activas:
+            return
+        celda = self._celdas.get(get_ident()) or self._celda()
+        celda[bisect_left(self.limites, valor)] += 1
+        celda[-1] += valor
+
+    def percentil(self, q: float) -> Optional[float]:
+        """Límite superior de la cubeta donde cae el percentil q (None si no hay datos)"""
+        return self._percentil(q, self.cuentas)
+
+    def _percentil(self, q: float, cuentas: List[int]) -> Optional[float]:
+        total = sum(cuentas)
+        if not total:
+            return None
+        objetivo = q * total
+        acumulado = 0
+        for limite, cuenta in zip(self.limites, cuentas):
+            acumulado += cuenta
+            if acumulado >= objetivo:
+                return limite
+        return float('inf')
+
+    def _exportar(self, nombre: str, etiquetas: str) -> List[str]:
+        previas = etiquetas[1:-1] + ',' if etiquetas else ''
+        cuentas, suma = self._combinar()
+        lineas = []
+        acumulado = 0
+        for limite, cuenta in zip(self.limites, cuentas):
+            acumulado += cuenta
+            lineas.append(f'{nombre}_bucket{{{previas}le="{limite:g}"}} {acumulado}')
+        acumulado += cuentas[-1]
+        lineas.append(f'{nombre}_bucket{{{previas}le="+Inf"}} {acumulado}')
+        lineas.append(f"{nombre}_sum{etiquetas} {suma:.6f}")
+        lineas.append(f"{nombre}_count{etiquetas} {acumulado}")
+        return lineas
+
+    def _instantanea(self) -> object:
+        cuentas, suma = self._combinar()
+        cubetas = {f"{limite:g}": cuenta for limite, cuenta in zip(self.limites, cuentas) if cuenta}
+        if cuentas[-1]:
+            cubetas["+Inf"] = cuentas[-1]
+        return {"total": sum(cuentas), "suma": round(suma, 6),
+                "p50": self._percentil(0.50, cuentas), "p99": self._percentil(0.99, cuentas), "cubetas": cubetas}
+
+class Registro:
+    """Conjunto de métricas con nombre y etiquetas, exportable a Prometheus o a JSON"""
+
+    def __init__(self):
+        self._familias: Dict[str, Tuple[str, str, Dict[Etiquetas, object]]] = {}
+        self._lock = threading.Lock()
+
+    def _obtener(self, clase, nombre: str, ayuda: str, etiquetas: Dict[str, str], *args):
+        clave = tuple(sorted(etiquetas.items()))
+        with self._lock:
+            tipo, _, metricas = self._familias.setdefault(nombre, (clase.tipo, ayuda, {}))
+            if tipo != clase.tipo:
+                raise ValueError(f"La métrica {nombre} ya existe con otro tipo ({tipo})")
+            metrica = metricas.get(clave)
+            if metrica is None:
+                metrica = metricas[clave] = clase(*args)
+            return metrica
+
+    def contador(self, nombre: str, ayuda: str, **etiquetas: str) -> Contador:
+        return self._obtener(Contador, nombre, ayuda, etiquetas)
+
+    def histograma(self, nombre: str, ayuda: str, limites: Tuple[float, ...] = LATENCIAS,
+                   **etiquetas: str) -> Histograma:
+        return self._obtener(Histograma, nombre, ayuda, etiquetas, limites)
+
+    def prometheus(self) -> str:
+        """Formato de texto de exposición de Prometheus (versión 0.0.4)"""
+        lineas = []
+        with self._lock:
+            familias = sorted((n, t, a, dict(m)) for n, (t, a, m) in self._familias.items())
+        for nombre, tipo, ayuda, metricas in familias:
+            lineas.append(f"# HELP {nombre} {ayuda}")
+            lineas.append(f"# TYPE {nombre} {tipo}")
+            for etiquetas, metrica in sorted(metricas.items()):
+                texto = ','.join(f'{k}="{v}"' for k, v in etiquetas)
+                lineas.extend(metrica._exportar(nombre, f"{{{texto}}}" if texto else ''))
+        return '\n'.join(lineas) + '\n'
+
+    def instantanea(self) -> Dict[str, List[dict]]:
+        """Valores actuales como diccionario serializable a JSON"""
+        with self._lock:
+            familias = sorted((n, dict(m)) for n, (_, _, m) in self._familias.items())
+        return {nombre: [{"etiquetas": dict(etiquetas), "valor": metrica._instantanea()}
+                         for etiquetas, metrica in sorted(metricas.items())]
+                for nombre, metricas in familias}
+
+    def volcar(self, ruta: str):
+        """Escribe las métricas en ruta, en JSON si termina en .json y si no en formato Prometheus"""
+        if ruta.endswith('.json'):
+            import json
+            texto = json.dumps({"marca_tiempo": time.time(), "metricas": self.instantanea()},
+                               ensure_ascii=False, indent=2) + '\n'
+        else:
+            texto = self.prometheus()
+        from indice import escritura_atomica
+
+        # Varios procesos pueden volcar al mismo archivo al salir: cada uno usa su propio temporal
+        with escritura_atomica(ruta) as f:
+            f.write(texto.encode('utf-8'))
+
+REGISTRO = Registro()
+
+def contador(nombre: str, ayuda: str, **etiquetas: str) -> Contador:
+    return REGISTRO.contador(nombre, ayuda, **etiquetas)
+
+def histograma(nombre: str, ayuda: str, limites: Tuple[float, ...] = LATENCIAS, **etiquetas: str) -> Histograma:
+    return REGISTRO.histograma(nombre, ayuda, limites, **etiquetas)
+
+def cronometrado(hist: Histograma) -> Callable[[F], F]:
+    """Decorador que observa en hist la duración de cada llamada (también si lanza una excepción)"""
+    def decorador(funcion: F) -> F:
+        limites = hist.limites
+        celdas = hist._celdas
+
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not _activas:
+                return funcion(*args, **kwargs)
+            inicio = perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                # Histograma.observar en línea: esta envoltura está en el camino de cada llamada
+                duracion = perf_counter() - inicio
+                celda = celdas.get(get_ident()) or hist._celda()
+                celda[bisect_left(limites, duracion)] += 1
+                celda[-1] += duracion
+        return envoltura
+    return decorador
+
+# Con PASSCOR_METRICAS_ARCHIVO se vuelcan al terminar el proceso (por ejemplo al directorio
+# del textfile collector de node_exporter, o a un .json)
+def _volcar_al_salir(ruta: str):
+    try:
+        REGISTRO.volcar(ruta)
+    except OSError as e:
+        print(f"Advertencia: No se pudieron guardar las métricas en {ruta}: {e}", file=sys.stderr)
+
+if os.environ.get('PASSCOR_METRICAS_ARCHIVO'):
+    import atexit
+    atexit.register(_volcar_al_salir, os.environ['PASSCOR_METRICAS_ARCHIVO'])
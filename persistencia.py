@@ -0,0 +1,184 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import metricas
+
+RUTA_BD = 'usuarios.db'
+# Límite de parámetros por consulta en versiones antiguas de SQLite
+MAX_PARAMETROS = 900
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16384",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+ESQUEMA = '''
+    CREATE TABLE IF NOT EXISTS usuarios (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        usuario TEXT UNIQUE NOT NULL,
+        hash_contraseña TEXT NOT NULL
+    )
+'''
+
+class PoolConexiones:
+    """Pool de conexiones SQLite reutilizables en modo WAL.
+
+    Con WAL los lectores no se bloquean entre sí ni con el escritor, y cada conexión
+    guarda en caché sus sentencias preparadas, así que repetir la misma consulta no
+    vuelve a compilarla. Las conexiones se crean bajo demanda hasta llegar a tamaño.
+    """
+
+    def __init__(self, ruta: str = RUTA_BD, tamaño: int = 8):
+        self.ruta = ruta
+        self.tamaño = tamaño
+        self._libres: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._creadas = 0
+        self._lock = threading.Lock()
+        self._cerrado = False
+
+    def _crear(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.ruta, timeout=30, check_same_thread=False, cached_statements=256)
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _obtener(self) -> sqlite3.Connection:
+        try:
+            return self._libres.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._creadas < self.tamaño:
+                self._creadas += 1
+                crear = True
+            else:
+                crear = False
+        if crear:
+            try:
+                return self._crear()
+            except Exception:
+                with self._lock:
+                    self._creadas -= 1
+                raise
+        return self._libres.get()
+
+    @contextmanager
+    def conexion(self) -> Iterator[sqlite3.Connection]:
+        """Presta una conexión; si hay una excepción se deshace la transacción abierta"""
+        if self._cerrado:
+            raise RuntimeError("El pool de conexiones está cerrado")
+        conn = self._obtener()
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._libres.put(conn)
+
+    def cerrar(self):
+        self._cerrado = True
+        while True:
+            try:
+                self._libres.get_nowait().close()
+            except queue.Empty:
+                break
+
+def _cronometrar_bd(operacion: str):
+    return metricas.cronometrado(metricas.histograma(
+        'passcor_bd_segundos', 'Duración de cada operación sobre usuarios.db', operacion=operacion))
+
+_pools: Dict[str, PoolConexiones] = {}
+_lock_pools = threading.Lock()
+
+def obtener_pool(ruta: str = RUTA_BD) -> PoolConexiones:
+    """Pool compartido por proceso para cada archivo de base de datos"""
+    with _lock_pools:
+        pool = _pools.get(ruta)
+        if pool is None or pool._cerrado:
+            pool = _pools[ruta] = PoolConexiones(ruta)
+        return pool
+
+def inicializar(pool: PoolConexiones):
+    with pool.conexion() as conn, conn:
+        conn.execute(ESQUEMA)
+
+@_cronometrar_bd('insertar_usuario')
+def insertar_usuario(pool: PoolConexiones, usuario: str, hashed: str) -> bool:
+    try:
+        with pool.conexion() as conn, conn:
+            conn.execute(
+                "INSERT INTO usuarios (usuario, hash_contraseña) VALUES (?, ?)",
+                (usuario, hashed)
+            )
+        return True
+    except sqlite3.IntegrityError:
+        return False
+
+@_cronometrar_bd('insertar_usuarios')
+def insertar_usuarios(pool: PoolConexiones, filas: Iterable[Tuple[str, str]]) -> int:
+    """Inserta (usuario, hash) en una sola transacción; omite los que ya existen y devuelve cuántos entraron"""
+    with pool.conexion() as conn, conn:
+        antes = conn.total_changes
+        conn.executemany(
+            "INSERT OR IGNORE INTO usuarios (usuario, hash_contraseña) VALUES (?, ?)",
+            filas
+        )
+        return conn.total_changes - antes
+
+@_cronometrar_bd('obtener_hash')
+def obtener_hash(pool: PoolConexiones, usuario: str) -> Optional[str]:
+    with pool.conexion() as conn:
+        fila = conn.execute(
+            "SELECT hash_contraseña FROM usuarios WHERE usuario = ?",
+            (usuario,)
+        ).fetchone()
+    return fila[0] if fila else None
+
+@_cronometrar_bd('obtener_hashes')
+def obtener_hashes(pool: PoolConexiones, usuarios: Iterable[str]) -> Dict[str, str]:
+    """Busca muchos usuarios a la vez, en consultas IN de hasta MAX_PARAMETROS nombres"""
+    usuarios = list(usuarios)
+    encontrados = {}
+    with pool.conexion() as conn:
+        for i in range(0, len(usuarios), MAX_PARAMETROS):
+            tramo = usuarios[i:i + MAX_PARAMETROS]
+            marcas = ','.join('?' * len(tramo))
+            encontrados.update(conn.execute(
+                f"SELECT usuario, hash_contraseña FROM usuarios WHERE usuario IN ({marcas})",
+                tramo
+            ))
+    return encontrados
+
+def iterar_usuarios(pool: PoolConexiones, tamaño_lote: int = 10000) -> Iterator[List[Tuple[str, str]]]:
+    """Recorre todos los usuarios por páginas de id, sin cargar la tabla entera"""
+    ultimo = 0
+    while True:
+        with pool.conexion() as conn:
+            filas = conn.execute(
+                "SELECT id, usuario, hash_contraseña FROM usuarios WHERE id > ? ORDER BY id LIMIT ?",
+                (ultimo, tamaño_lote)
+            ).fetchall()
+        if not filas:
+            return
+        ultimo = filas[-1][0]
+        yield [(usuario, hashed) for _, usuario, hashed in filas]
+
+@_cronometrar_bd('actualizar_hash')
+def actualizar_hash(pool: PoolConexiones, usuario: str, nuevo: str, anterior: str) -> bool:
+    """Sustituye el hash solo si nadie lo cambió desde que se leyó"""
+    with pool.conexion() as conn, conn:
+        cursor = conn.execute(
+            "UPDATE usuarios SET hash_contraseña = ? WHERE usuario = ? AND hash_contraseña = ?",
+            (nuevo, usuario, anterior)
+        )
+        return cursor.rowcount == 1
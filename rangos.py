@@ -0,0 +1,198 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from indice import leer_lista, escritura_atomica
+
+LONGITUD_PREFIJO = 5
+LONGITUD_SUFIJO = 40 - LONGITUD_PREFIJO
+EXTENSION = '.txt'
+# Unos 256 cubos de ~32 KB (tamaño típico con el corpus completo de HIBP) son ~8 MB
+CUBOS_EN_CACHE = 256
+
+def sha1_hex(contraseña: str) -> str:
+    return hashlib.sha1(contraseña.encode('utf-8')).hexdigest().upper()
+
+def buscar_en_cubo(datos: bytes, sufijo: bytes) -> int:
+    """Búsqueda binaria de un sufijo en un cubo 'SUFIJO:CUENTA' ordenado; devuelve la cuenta o 0.
+
+    Se trabaja sobre los bytes en bruto: cada paso salta a la mitad del tramo y retrocede
+    al principio de su línea, así que no hace falta partir el cubo en líneas.
+    """
+    lo, hi = 0, len(datos)
+    while lo < hi:
+        medio = (lo + hi) // 2
+        inicio = datos.rfind(b'\n', 0, medio) + 1
+        fin = datos.find(b'\n', inicio)
+        if fin < 0:
+            fin = len(datos)
+        clave = datos[inicio:inicio + LONGITUD_SUFIJO]
+        if clave < sufijo:
+            lo = fin + 1
+        elif clave > sufijo:
+            hi = inicio
+        else:
+            cuenta = datos[inicio + LONGITUD_SUFIJO + 1:fin].strip()
+            return int(cuenta) if cuenta.isdigit() else 1
+    return 0
+
+class AlmacenRangos:
+    """Almacén local de hashes SHA-1 filtrados repartidos por prefijo, como los rangos de HIBP.
+
+    Cada archivo <directorio>/<5 hex><extension> contiene las líneas 'SUFIJO:CUENTA' (35
+    hex en mayúsculas) de todos los hashes con ese prefijo, ordenadas. Una consulta lee un
+    solo cubo de unos KB, aunque el corpus ocupe decenas de GB, y los cubos leídos se
+    guardan en una caché LRU para no volver a leerlos.
+    """
+
+    def __init__(self, directorio: str, extension: str = EXTENSION, cubos_en_cache: int = CUBOS_EN_CACHE):
+        if not os.path.isdir(directorio):
+            raise FileNotFoundError(f"No existe el directorio de rangos {directorio}")
+        self.directorio = directorio
+        self.extension = extension
+        self.cubos_en_cache = cubos_en_cache
+        self._cubos: "OrderedDict[str, bytes]" = OrderedDict()
+        self.lecturas = 0
+        self.aciertos_cache = 0
+
+    def cubo(self, prefijo: str) -> bytes:
+        datos = self._cubos.get(prefijo)
+        if datos is not None:
+            self._cubos.move_to_end(prefijo)
+            self.aciertos_cache += 1
+            return datos
+        try:
+            with open(os.path.join(self.directorio, prefijo + self.extension), 'rb') as f:
+                datos = f.read()
+        except FileNotFoundError:
+            datos = b''
+        self.lecturas += 1
+        self._cubos[prefijo] = datos
+        if len(self._cubos) > self.cubos_en_cache:
+            self._cubos.popitem(last=False)
+        return datos
+
+    def apariciones_hash(self, hash_hex: str) -> int:
+        hash_hex = hash_hex.upper()
+        return buscar_en_cubo(self.cubo(hash_hex[:LONGITUD_PREFIJO]), hash_hex[LONGITUD_PREFIJO:].encode('ascii'))
+
+    def apariciones(self, contraseña: str) -> int:
+        """Veces que la contraseña aparece en el corpus (0 si no está)"""
+        return self.apariciones_hash(sha1_hex(contraseña))
+
+    def __contains__(self, contraseña: str) -> bool:
+        return self.apariciones(contraseña) > 0
+
+    def consultar_lote(self, contraseñas: List[str]) -> List[int]:
+        """Apariciones de muchas contraseñas, leyendo cada cubo una sola vez.
+
+        Las consultas se agrupan por prefijo, de modo que todas las que caen en el mismo
+        cubo se resuelven con una lectura aunque el cubo no quepa en la caché.
+        """
+        por_prefijo: Dict[str, List[Tuple[int, bytes]]] = {}
+        for i, contraseña in enumerate(contraseñas):
+            h = sha1_hex(contraseña)
+            por_prefijo.setdefault(h[:LONGITUD_PREFIJO], []).append((i, h[LONGITUD_PREFIJO:].encode('ascii')))
+        resultado = [0] * len(contraseñas)
+        for prefijo in sorted(por_prefijo):
+            datos = self.cubo(prefijo)
+            if datos:
+                for i, sufijo in por_prefijo[prefijo]:
+                    resultado[i] = buscar_en_cubo(datos, sufijo)
+        return resultado
+
+def _registros_hash(rutas: Iterable[str], hashes: bool) -> Iterator[str]:
+    """'HASH:CUENTA' de cada línea; las listas de texto se hashean, las de hashes se validan"""
+    for ruta in rutas:
+        for linea in leer_lista(ruta):
+            if not hashes:
+                yield sha1_hex(linea) + ':1'
+                continue
+            h, _, cuenta = linea.partition(':')
+            h = h.strip().upper()
+            if len(h) == 40 and all(c in '0123456789ABCDEF' for c in h):
+                yield f"{h}:{cuenta.strip() if cuenta.strip().isdigit() else 1}"
+
+def construir_rangos(rutas: List[str], directorio: str, hashes: bool = False,
+                     extension: str = EXTENSION, memoria: Optional[int] = None) -> Dict[str, int]:
+    """Reparte una o varias listas en cubos por prefijo, sumando las cuentas de los repetidos.
+
+    Acepta contraseñas en claro o, con hashes, líneas 'SHA1[:CUENTA]' como las del volcado
+    completo de HIBP. Se ordena con la ordenación externa de wordlist.py, así que la
+    memoria no depende del tamaño del corpus, y cada cubo se escribe entero de una vez.
+    """
+    from wordlist import ordenar_externo, MEMORIA_MB
+
+    os.makedirs(directorio, exist_ok=True)
+    memoria = memoria or MEMORIA_MB << 20
+    resumen = {"hashes": 0, "cubos": 0}
+    inicio = time.perf_counter()
+
+    def escribir(prefijo: str, lineas: List[str]):
+        # Temporal único: dos construcciones sobre el mismo directorio no se pisan los cubos
+        with escritura_atomica(os.path.join(directorio, prefijo + extension)) as f:
+            f.write('\r\n'.join(lineas).encode('ascii'))
+            f.write(b'\r\n')
+        resumen["cubos"] += 1
+
+    with tempfile.TemporaryDirectory(prefix='passcor-', dir=directorio) as tmp:
+        prefijo_actual = None
+        lineas: List[str] = []
+        anterior = None
+        cuenta = 0
+        for registro in ordenar_externo(_registros_hash(rutas, hashes), tmp, memoria):
+            h, _, n = registro.partition(':')
+            if h == anterior:
+                cuenta += int(n)
+                continue
+            if anterior is not None:
+                lineas.append(f"{anterior[LONGITUD_PREFIJO:]}:{cuenta}")
+                resumen["hashes"] += 1
+            prefijo = h[:LONGITUD_PREFIJO]
+            if prefijo != prefijo_actual:
+                if lineas:
+                    escribir(prefijo_actual, lineas)
+                    lineas = []
+                prefijo_actual = prefijo
+            anterior, cuenta = h, int(n)
+        if anterior is not None:
+            lineas.append(f"{anterior[LONGITUD_PREFIJO:]}:{cuenta}")
+            resumen["hashes"] += 1
+        if lineas:
+            escribir(prefijo_actual, lineas)
+
+    resumen["segundos"] = round(time.perf_counter() - inicio, 2)
+    return resumen
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import json
+
+    parser = argparse.ArgumentParser(description='Almacén local de rangos SHA-1 de contraseñas filtradas (formato HIBP)')
+    sub = parser.add_subparsers(dest='orden', required=True)
+    construir = sub.add_parser('construir', help='Reparte listas de contraseñas o de hashes en cubos por prefijo')
+    construir.add_argument('entradas', nargs='+', help='Listas de entrada, una por línea')
+    construir.add_argument('-d', '--directorio', default='TXT/rangos', help='Directorio de los cubos (por defecto: TXT/rangos)')
+    construir.add_argument('--hashes', action='store_true', help="Las entradas son líneas 'SHA1[:CUENTA]' en lugar de contraseñas")
+    consultar = sub.add_parser('consultar', help='Cuántas veces aparece cada contraseña leída de stdin')
+    consultar.add_argument('-d', '--directorio', default='TXT/rangos', help='Directorio de los cubos (por defecto: TXT/rangos)')
+    args = parser.parse_args(argv)
+
+    if args.orden == 'construir':
+        print(json.dumps(construir_rangos(args.entradas, args.directorio, args.hashes)), file=sys.stderr)
+        return 0
+
+    almacen = AlmacenRangos(args.directorio)
+    contraseñas = [linea.rstrip('\r\n') for linea in sys.stdin]
+    for n in almacen.consultar_lote(contraseñas):
+        print(n)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
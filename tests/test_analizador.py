@@ -0,0 +1,59 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+"""analizador.analizar frente a la validación original de validador.py (expresiones regulares).
+
+Uso: python3 -m pytest tests/
+"""
+
+import os
+import random
+import re
+import string
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analizador import analizar
+
+def validar_fortaleza_original(contraseña: str):
+    """La validación tal como estaba antes de analizador.py"""
+    if len(contraseña) < 12:
+        return False, "La contraseña debe tener al menos 12 caracteres"
+    if not re.search(r"[A-Z]", contraseña):
+        return False, "Debe contener al menos una letra mayúscula"
+    if not re.search(r"[a-z]", contraseña):
+        return False, "Debe contener al menos una letra minúscula"
+    if not re.search(r"\d", contraseña):
+        return False, "Debe contener al menos un número"
+    if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", contraseña):
+        return False, "Debe contener al menos un carácter especial"
+    return True, "Contraseña segura"
+
+# ASCII imprimible, letras latin-1, dígitos de otras escrituras ('٣', '３', '߀', '𝟗', '০'),
+# superíndices (no son dígitos decimales), espacios y caracteres fuera del BMP
+ALFABETO = (string.ascii_letters + string.digits + string.punctuation + ' \t'
+            + 'éÑßÀÿ²³¹µ' + '٣３߀𝟗০' + '€ñ日🔑 ')
+
+def _nueva(contraseña: str):
+    informe = analizar(contraseña)
+    return informe.segura, informe.fallos[0] if informe.fallos else "Contraseña segura"
+
+def test_igual_que_la_validacion_original_con_entradas_aleatorias():
+    azar = random.Random(2024)
+    for _ in range(50000):
+        contraseña = ''.join(azar.choice(ALFABETO) for _ in range(azar.randint(0, 20)))
+        assert _nueva(contraseña) == validar_fortaleza_original(contraseña), repr(contraseña)
+
+def test_clases_de_cada_caracter():
+    for c in ALFABETO + ''.join(map(chr, range(256))):
+        informe = analizar(c)
+        assert (informe.mayusculas > 0) == bool(re.search(r"[A-Z]", c)), repr(c)
+        assert (informe.minusculas > 0) == bool(re.search(r"[a-z]", c)), repr(c)
+        assert (informe.numeros > 0) == bool(re.search(r"\d", c)), repr(c)
+        assert (informe.especiales > 0) == bool(re.search(r"[!@#$%^&*(),.?\":{}|<>]", c)), repr(c)
+
+def test_digitos_de_otras_escrituras():
+    for digito in '٣３߀𝟗০':
+        contraseña = 'Abcdefghijk!' + digito
+        assert analizar(contraseña).numeros == 1
+        assert _nueva(contraseña) == validar_fortaleza_original(contraseña) == (True, "Contraseña segura")
@@ -1,31 +1,71 @@
 #Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
 
-import bcrypt
-import getpass
 import time
-import re
 import os
 import json
-import hashlib
 import sys
-from datetime import datetime, timedelta
-from typing import List, Tuple, Dict, Optional
-from dataclasses import dataclass, asdict
+from collections import deque
+from typing import Container, Deque, Dict, List, Optional, Tuple
 from ascii import mostrar_banner, mostrar_cerradura, mostrar_estadisticas, mostrar_exito, mostrar_error
+import metricas
+import persistencia
+from analizador import analizar
+from automata import abrir_automata, preparar_automata, AutomataComunes
+from cache_veredictos import CacheVeredictos
+from estimador import es_predecible
+from hashing import (hash_contraseña, comprobar_contraseña, necesita_rehash, calibrar_al_arrancar,
+                     MAX_BYTES_BCRYPT)
+from indice import abrir_indice, preparar_indice
+from limitador import metricas_limitador, limitador_compartido, clave_usuario
+from rangos import AlmacenRangos
+
+_M_LIMITADOR = metricas_limitador('archivo')
+_T_ESCRITURA = metricas.histograma('passcor_limitador_escritura_segundos',
+                                   'Duración de cada escritura del registro de intentos en disco')
+_T_RESOLUCION = metricas.histograma('passcor_resolucion_ip_segundos', 'Duración de la resolución del nombre del equipo')
 
-@dataclass
 class IntentoLogin:
-    timestamp: float
-    intentos: int = 0
-    bloqueado_hasta: Optional[float] = None
+    # Clase con __slots__ en lugar de dataclass: ocupa menos por clave y evita importar dataclasses
+    __slots__ = ('timestamp', 'intentos', 'bloqueado_hasta')
+
+    def __init__(self, timestamp: float, intentos: int = 0, bloqueado_hasta: Optional[float] = None):
+        self.timestamp = timestamp
+        self.intentos = intentos
+        self.bloqueado_hasta = bloqueado_hasta
+
+    def __repr__(self) -> str:
+        return (f"IntentoLogin(timestamp={self.timestamp}, intentos={self.intentos}, "
+                f"bloqueado_hasta={self.bloqueado_hasta})")
+
+    def __eq__(self, otro) -> bool:
+        return isinstance(otro, IntentoLogin) and self.a_dict() == otro.a_dict()
+
+    def a_dict(self) -> dict:
+        return {"timestamp": self.timestamp, "intentos": self.intentos, "bloqueado_hasta": self.bloqueado_hasta}
 
 class RateLimiter:
-    def __init__(self, max_attempts: int = 5, window_minutes: int = 15, ban_minutes: int = 60):
+    """Limitador de intentos con ventana fija por clave.
+
+    Las caducidades se guardan en dos colas FIFO (fin de ventana y fin de bloqueo). Como
+    cada una usa una duración fija, se insertan siempre en orden y limpiar lo caducado
+    cuesta O(1) amortizado por intento en lugar de recorrer todo el diccionario. Los
+    cambios se añaden a un registro de solo anexado (login_attempts.log) que se compacta
+    en login_attempts.json cuando crece demasiado respecto a las claves vivas.
+    """
+
+    def __init__(self, max_attempts: int = 5, window_minutes: int = 15, ban_minutes: int = 60,
+                 lock_file: str = "login_attempts.json"):
         self.max_attempts = max_attempts
         self.window_seconds = window_minutes * 60
         self.ban_seconds = ban_minutes * 60
         self.attempts: Dict[str, IntentoLogin] = {}
-        self.lock_file = "login_attempts.json"
+        self.lock_file = lock_file
+        self.log_file = os.path.splitext(lock_file)[0] + ".log"
+        self._fin_ventana: Deque[Tuple[float, str]] = deque()
+        self._fin_bloqueo: Deque[Tuple[float, str]] = deque()
+        self._entradas_log = 0
+        self._log = None
+        self._ip_local: Optional[str] = None
         self._load_attempts()
 
     def _load_attempts(self):
@@ -35,98 +75,160 @@ class RateLimiter:
                     data = json.load(f)
                     for ip, att in data.items():
                         self.attempts[ip] = IntentoLogin(**att)
+            if os.path.exists(self.log_file):
+                with open(self.log_file, 'r') as f:
+                    for linea in f:
+                        try:
+                            cambio = json.loads(linea)
+                        except ValueError:
+                            # Última línea a medio escribir si el proceso murió
+                            continue
+                        self._aplicar_cambio(cambio)
+                        self._entradas_log += 1
         except Exception as e:
             print(f"Advertencia: No se pudieron cargar los intentos previos: {e}")
 
+        for ip, att in sorted(self.attempts.items(), key=lambda item: item[1].timestamp):
+            self._fin_ventana.append((att.timestamp + self.window_seconds, ip))
+        bloqueados = [(att.bloqueado_hasta, ip) for ip, att in self.attempts.items() if att.bloqueado_hasta]
+        self._fin_bloqueo.extend(sorted(bloqueados))
+
+    def _aplicar_cambio(self, cambio: dict):
+        if "t" in cambio:
+            self.attempts[cambio["k"]] = IntentoLogin(cambio["t"], cambio["i"], cambio["b"])
+        else:
+            self.attempts.pop(cambio["k"], None)
+
     def _save_attempts(self):
+        """Compacta: escribe el estado completo en lock_file y vacía el registro"""
         try:
-            with open(self.lock_file, 'w') as f:
+            temporal = self.lock_file + ".tmp"
+            with open(temporal, 'w') as f:
                 json.dump(
-                    {ip: asdict(att) for ip, att in self.attempts.items()},
+                    {ip: att.a_dict() for ip, att in self.attempts.items()},
                     f,
                     default=str
                 )
+            os.replace(temporal, self.lock_file)
+            if self._log is not None:
+                self._log.close()
+            self._log = open(self.log_file, 'w')
+            self._entradas_log = 0
         except Exception as e:
             print(f"Advertencia: No se pudieron guardar los intentos: {e}")
 
-    def _clean_old_attempts(self):
-        now = time.time()
-        to_remove = []
-        for ip, attempt in self.attempts.items():
-            if attempt.bloqueado_hasta and attempt.bloqueado_hasta < now:
-                to_remove.append(ip)
-        for ip in to_remove:
-            del self.attempts[ip]
-        if to_remove:
+    def _registrar_cambio(self, ip: str):
+        att = self.attempts.get(ip)
+        if att is None:
+            cambio = {"k": ip}
+        else:
+            cambio = {"k": ip, "t": att.timestamp, "i": att.intentos, "b": att.bloqueado_hasta}
+        inicio = time.perf_counter()
+        try:
+            if self._log is None:
+                self._log = open(self.log_file, 'a')
+            self._log.write(json.dumps(cambio) + "\n")
+            self._log.flush()
+            _T_ESCRITURA.observar(time.perf_counter() - inicio)
+        except Exception as e:
+            print(f"Advertencia: No se pudieron guardar los intentos: {e}")
+            return
+        self._entradas_log += 1
+        if self._entradas_log > max(1000, 2 * len(self.attempts)):
             self._save_attempts()
 
-    def register_attempt(self, username: str, success: bool) -> bool:
-        """Registra un intento de inicio de sesión y devuelve si está permitido continuar"""
-        ip = self._get_client_ip()
+    def _clean_old_attempts(self, now: float):
+        """Quita las claves cuya ventana o bloqueo ya terminó, mirando solo la cabeza de cada cola"""
+        while self._fin_ventana and self._fin_ventana[0][0] <= now:
+            fin, ip = self._fin_ventana.popleft()
+            att = self.attempts.get(ip)
+            # La entrada puede haber cambiado desde que se encoló; solo cuenta si sigue igual
+            if att and not att.bloqueado_hasta and att.timestamp + self.window_seconds == fin:
+                del self.attempts[ip]
+                self._registrar_cambio(ip)
+        while self._fin_bloqueo and self._fin_bloqueo[0][0] <= now:
+            fin, ip = self._fin_bloqueo.popleft()
+            att = self.attempts.get(ip)
+            if att and att.bloqueado_hasta == fin:
+                del self.attempts[ip]
+                self._registrar_cambio(ip)
+
+    def register_attempt(self, username: str, success: bool, clave: Optional[str] = None) -> bool:
+        """Registra un intento de inicio de sesión y devuelve si está permitido continuar.
+
+        clave permite agrupar los intentos por usuario, IP o ambos (ver limitador.py);
+        sin ella se usa la IP local, como hasta ahora.
+        """
+        permitido = self._registrar_clave(clave or self._get_client_ip(), success)
+        _M_LIMITADOR[permitido].incrementar()
+        return permitido
+
+    def _registrar_clave(self, ip: str, success: bool) -> bool:
         now = time.time()
         
-        self._clean_old_attempts()
-        
-        if ip not in self.attempts:
-            self.attempts[ip] = IntentoLogin(timestamp=now)
+        self._clean_old_attempts(now)
         
-        attempt = self.attempts[ip]
+        attempt = self.attempts.get(ip)
         
-        if attempt.bloqueado_hasta and now < attempt.bloqueado_hasta:
+        if attempt and attempt.bloqueado_hasta and now < attempt.bloqueado_hasta:
             return False
         
         if not success:
-            if now - attempt.timestamp > self.window_seconds:
+            if attempt is None:
+                attempt = self.attempts[ip] = IntentoLogin(timestamp=now, intentos=1)
+                self._fin_ventana.append((now + self.window_seconds, ip))
+            elif now - attempt.timestamp > self.window_seconds:
                 attempt.timestamp = now
                 attempt.intentos = 1
+                self._fin_ventana.append((now + self.window_seconds, ip))
             else:
                 attempt.intentos += 1
             
             if attempt.intentos >= self.max_attempts:
                 attempt.bloqueado_hasta = now + self.ban_seconds
+                self._fin_bloqueo.append((attempt.bloqueado_hasta, ip))
+                _M_LIMITADOR[2].incrementar()
                 print(f"Demasiados intentos fallidos. Intenta de nuevo en {self.ban_seconds // 60} minutos.")
-                self._save_attempts()
+                self._registrar_cambio(ip)
                 return False
             
-            self._save_attempts()
-        else:
-            if ip in self.attempts:
-                del self.attempts[ip]
-                self._save_attempts()
+            self._registrar_cambio(ip)
+        elif attempt is not None:
+            del self.attempts[ip]
+            self._registrar_cambio(ip)
         
         return True
     
     def _get_client_ip(self) -> str:
-        """Obtiene la IP del cliente de forma segura"""
-
-        import socket
-        return socket.gethostbyname(socket.gethostname())
-
-try:
-    rate_limiter = RateLimiter(
-        max_attempts=5,          
-        window_minutes=15,       
-        ban_minutes=60           
-    )
-except Exception as e:
-    print(f"Error al inicializar el sistema de seguridad: {e}")
-    exit(1)
+        """Obtiene la IP del cliente de forma segura; se resuelve una sola vez por instancia"""
+        if self._ip_local is None:
+            import socket
+            inicio = time.perf_counter()
+            self._ip_local = socket.gethostbyname(socket.gethostname())
+            _T_RESOLUCION.observar(time.perf_counter() - inicio)
+        return self._ip_local
+
+_rate_limiter: Optional[RateLimiter] = None
+
+def obtener_rate_limiter() -> RateLimiter:
+    """Crea el limitador la primera vez que se usa, para que importar el módulo no lea disco"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(
+            max_attempts=5,          
+            window_minutes=15,       
+            ban_minutes=60           
+        )
+    return _rate_limiter
 
-import sqlite3
-from typing import List, Tuple, Optional
+def __getattr__(nombre: str):
+    # Compatibilidad con el antiguo validador.rate_limiter global
+    if nombre == 'rate_limiter':
+        return obtener_rate_limiter()
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
 
 def inicializar_bd():
-    conn = sqlite3.connect('usuarios.db')
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS usuarios (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            usuario TEXT UNIQUE NOT NULL,
-            hash_contraseña TEXT NOT NULL
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    persistencia.inicializar(persistencia.obtener_pool())
 
 def cargar_contraseñas(archivo: str) -> List[str]:
     try:
@@ -136,56 +238,151 @@ def cargar_contraseñas(archivo: str) -> List[str]:
         print(f"Advertencia: No se encontró el archivo {archivo}")
         return []
 
-def es_contraseña_comun(contraseña: str, lista_contraseñas: List[str]) -> bool:
-    return contraseña in lista_contraseñas
+def cargar_indice(archivo: str, usar_filtro: Optional[bool] = None) -> Container[str]:
+    """Abre el índice mapeado en memoria de la lista, compilándolo si hace falta.
+
+    El filtro de Bloom es opcional (usar_filtro o PASSCOR_FILTRO=1): mientras el índice
+    está en la caché de páginas, la búsqueda binaria sola es más rápida que filtro e índice.
+    """
+    if usar_filtro is None:
+        usar_filtro = os.environ.get('PASSCOR_FILTRO') == '1'
+    try:
+        return abrir_indice(archivo, usar_filtro=usar_filtro)
+    except (OSError, ValueError) as e:
+        print(f"Advertencia: No se pudo usar el índice de {archivo}: {e}")
+        return cargar_contraseñas(archivo)
+
+def preparar_lista(archivo: str):
+    """Compila en este proceso el índice y el autómata de la lista si hace falta.
+
+    Los pools de auditoría e importación lo llaman antes de arrancar: así sus trabajadores
+    solo abren archivos ya compilados en lugar de compilarlos todos a la vez.
+    """
+    for preparar in (preparar_indice, preparar_automata):
+        try:
+            preparar(archivo)
+        except (OSError, ValueError) as e:
+            print(f"Advertencia: No se pudo compilar {archivo}: {e}")
+
+def cargar_rangos(directorio: str) -> Optional[AlmacenRangos]:
+    """Almacén local de rangos SHA-1 (formato HIBP) si existe el directorio; es opcional"""
+    if not os.path.isdir(directorio):
+        return None
+    return AlmacenRangos(directorio)
+
+_M_COMUN_LISTA = metricas.contador('passcor_comunes_total', 'Contraseñas encontradas entre las comunes o filtradas',
+                                   fuente='lista')
+_M_COMUN_RANGOS = metricas.contador('passcor_comunes_total', 'Contraseñas encontradas entre las comunes o filtradas',
+                                    fuente='rangos')
+
+def es_contraseña_comun(contraseña: str, lista_contraseñas: Container[str],
+                        rangos: Optional[AlmacenRangos] = None) -> bool:
+    """Si está en la lista o, cuando se da un almacén de rangos, en alguna filtración"""
+    if contraseña in lista_contraseñas:
+        _M_COMUN_LISTA.incrementar()
+        return True
+    if rangos is not None and contraseña in rangos:
+        _M_COMUN_RANGOS.incrementar()
+        return True
+    return False
+
+def cargar_automata(archivo: str) -> Optional[AutomataComunes]:
+    """Autómata de subcadenas de la lista y de data.JSON, compilándolo si hace falta"""
+    try:
+        return abrir_automata(archivo)
+    except (OSError, ValueError) as e:
+        print(f"Advertencia: No se pudo usar el autómata de {archivo}: {e}")
+        return None
+
+def contiene_contraseña_comun(contraseña: str, automata: Optional[AutomataComunes]) -> bool:
+    """Si la contraseña lleva dentro alguna contraseña común de 4 o más caracteres"""
+    return automata is not None and contraseña in automata
 
 def validar_fortaleza(contraseña: str) -> Tuple[bool, str]:
-    if len(contraseña) < 12:
-        return False, "La contraseña debe tener al menos 12 caracteres"
-    if not re.search(r"[A-Z]", contraseña):
-        return False, "Debe contener al menos una letra mayúscula"
-    if not re.search(r"[a-z]", contraseña):
-        return False, "Debe contener al menos una letra minúscula"
-    if not re.search(r"\d", contraseña):
-        return False, "Debe contener al menos un número"
-    if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", contraseña):
-        return False, "Debe contener al menos un carácter especial"
+    """Devuelve (segura, primer fallo); para el informe completo usar analizador.analizar"""
+    informe = analizar(contraseña)
+    if not informe.segura:
+        return False, informe.fallos[0]
     return True, "Contraseña segura"
 
-def hash_contraseña(contraseña: str) -> bytes:
-    return bcrypt.hashpw(contraseña.encode('utf-8'), bcrypt.gensalt(rounds=14))
+def motivo_rechazo(contraseña: str, lista_contraseñas: Optional[Container[str]] = None,
+                   automata: Optional[AutomataComunes] = None, rangos: Optional[AlmacenRangos] = None,
+                   comun: Optional[bool] = None) -> Optional[str]:
+    """Por qué no se acepta una contraseña nueva, o None si se acepta.
+
+    Son las reglas de alta de usuarios, las mismas en el menú, register, import y audit:
+    fortaleza, lista de comunes (y rangos de filtraciones), contraseñas comunes dentro de
+    ella y patrones predecibles. Quien ya sabe si es común lo indica con comun.
+    """
+    if len(contraseña.encode('utf-8')) > MAX_BYTES_BCRYPT:
+        return f"La contraseña no puede ocupar más de {MAX_BYTES_BCRYPT} bytes"
+    es_valida, mensaje = validar_fortaleza(contraseña)
+    if not es_valida:
+        return mensaje
+    if comun is None:
+        comun = lista_contraseñas is not None and es_contraseña_comun(contraseña, lista_contraseñas, rangos)
+    if comun:
+        return "Esta contraseña es muy común o aparece en filtraciones conocidas"
+    if contiene_contraseña_comun(contraseña, automata):
+        return "Esta contraseña contiene una contraseña común"
+    if es_predecible(contraseña):
+        return "Esta contraseña sigue un patrón predecible"
+    return None
+
+def veredicto(contraseña: str, lista_contraseñas: Container[str], cache: Optional[CacheVeredictos] = None,
+              rangos: Optional[AlmacenRangos] = None) -> Tuple[bool, str, bool]:
+    """(segura, mensaje, común) de una contraseña; con caché, las repetidas no se vuelven a evaluar"""
+    def calcular() -> Tuple[bool, str, bool]:
+        segura, mensaje = validar_fortaleza(contraseña)
+        return segura, mensaje, es_contraseña_comun(contraseña, lista_contraseñas, rangos)
+    if cache is None:
+        return calcular()
+    return cache.obtener(contraseña, calcular)
 
 def guardar_usuario(usuario: str, contraseña: str) -> bool:
-    try:
-        conn = sqlite3.connect('usuarios.db')
-        cursor = conn.cursor()
-        hashed = hash_contraseña(contraseña)
-        cursor.execute(
-            "INSERT INTO usuarios (usuario, hash_contraseña) VALUES (?, ?)",
-            (usuario, hashed.decode('utf-8'))
-        )
-        conn.commit()
-        return True
-    except sqlite3.IntegrityError:
-        return False
-    finally:
-        conn.close()
+    hashed = hash_contraseña(contraseña)
+    return persistencia.insertar_usuario(persistencia.obtener_pool(), usuario, hashed.decode('utf-8'))
+
+def importar_usuarios(archivo_csv: str, salida: Optional[str] = None, **opciones) -> Dict[str, object]:
+    """Importa un CSV con columnas usuario,contraseña; delega en importacion.importar.
+
+    Aplica las mismas reglas que el alta. El resultado de cada fila se escribe en JSONL en
+    salida (si no se indica, se descarta) y se devuelve el resumen de la importación.
+    """
+    from importacion import importar
 
+    with open(archivo_csv, 'r', encoding='utf-8', newline='') as entrada, \
+            open(salida or os.devnull, 'w', encoding='utf-8') as informe:
+        return importar(entrada, informe, **opciones)
+
+def contador_logins(resultado: str) -> metricas.Contador:
+    return metricas.contador('passcor_logins_total', 'Comprobaciones de credenciales según el resultado', resultado=resultado)
+
+def contador_rehash() -> metricas.Contador:
+    return metricas.contador('passcor_rehash_total', 'Hashes llevados al coste actual de bcrypt tras un login')
+
+_M_LOGIN_VALIDO = contador_logins('valido')
+_M_LOGIN_INVALIDO = contador_logins('invalido')
+_M_LOGIN_DESCONOCIDO = contador_logins('usuario_desconocido')
+_M_REHASH = contador_rehash()
+
+@metricas.cronometrado(metricas.histograma('passcor_login_segundos', 'Duración total de verificar_contraseña'))
 def verificar_contraseña(usuario: str, contraseña: str) -> bool:
-    try:
-        conn = sqlite3.connect('usuarios.db')
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT hash_contraseña FROM usuarios WHERE usuario = ?",
-            (usuario,)
-        )
-        resultado = cursor.fetchone()
-        if resultado:
-            hashed = resultado[0].encode('utf-8')
-            return bcrypt.checkpw(contraseña.encode('utf-8'), hashed)
+    pool = persistencia.obtener_pool()
+    guardado = persistencia.obtener_hash(pool, usuario)
+    if guardado is None:
+        _M_LOGIN_DESCONOCIDO.incrementar()
+        return False
+    hashed = guardado.encode('utf-8')
+    if not comprobar_contraseña(contraseña, hashed):
+        _M_LOGIN_INVALIDO.incrementar()
         return False
-    finally:
-        conn.close()
+    _M_LOGIN_VALIDO.incrementar()
+    if necesita_rehash(hashed):
+        # Se aprovecha que tenemos la contraseña en claro para llevar el hash al coste actual
+        persistencia.actualizar_hash(pool, usuario, hash_contraseña(contraseña).decode('utf-8'), guardado)
+        _M_REHASH.incrementar()
+    return True
 
 def mostrar_menu():
     """Muestra el menú principal con arte ASCII"""
@@ -195,13 +392,22 @@ def mostrar_menu():
     print("2. Iniciar sesión")
     print("3. Salir\033[0m\n")
 
-def main():
-    
-    mostrar_banner()
+def main(silencioso: bool = False):
+    import getpass
+
+    if not silencioso and sys.stdout.isatty():
+        mostrar_banner()
     
     try:
+        rate_limiter = obtener_rate_limiter()
+        # Con PASSCOR_LIMITES=limites.db los fallos se cuentan en SQLite, compartidos entre procesos
+        compartido = limitador_compartido()
+        calibrar_al_arrancar()
         inicializar_bd()
-        contraseñas_comunes = cargar_contraseñas('TXT/contras.txt')
+        contraseñas_comunes = cargar_indice('TXT/contras.txt')
+        automata = cargar_automata('TXT/contras.txt')
+        cache = CacheVeredictos(capacidad=1024, ttl=600)
+        rangos = cargar_rangos('TXT/rangos')
     except Exception as e:
         mostrar_error()
         print(f"\nError al inicializar el sistema: {e}")
@@ -224,13 +430,10 @@ def main():
             while True:
                 contraseña = getpass.getpass("Ingrese su contraseña (mínimo 12 caracteres, mayúsculas, minúsculas, números y caracteres especiales): ")
 
-                es_valida, mensaje = validar_fortaleza(contraseña)
-                if not es_valida:
-                    print(f"Error: {mensaje}")
-                    continue
-
-                if es_contraseña_comun(contraseña, contraseñas_comunes):
-                    print("¡Alerta! Esta contraseña es muy común y fácil de adivinar.")
+                motivo = cache.obtener(contraseña, lambda: motivo_rechazo(contraseña, contraseñas_comunes,
+                                                                           automata, rangos))
+                if motivo is not None:
+                    print(f"Error: {motivo}")
                     continue
 
                 confirmacion = getpass.getpass("Confirme su contraseña: ")
@@ -249,28 +452,41 @@ def main():
             usuario = input("Usuario: ").strip()
             contraseña = getpass.getpass("Contraseña: ")
 
-            if not rate_limiter.register_attempt(usuario, False):
+            clave = clave_usuario(usuario)
+            if compartido is not None:
+                # El intento se cuenta antes de comprobar la contraseña y se borra si es correcta
+                permitido = compartido.registrar_intento(clave, False)
+            else:
+                permitido = rate_limiter.register_attempt(usuario, False)
+            if not permitido:
                 print("Demasiados intentos fallidos. Por favor, intente más tarde.")
                 time.sleep(2)
                 continue
 
             credenciales_validas = verificar_contraseña(usuario, contraseña)
             
-            rate_limiter.register_attempt(usuario, credenciales_validas)
+            if compartido is None:
+                rate_limiter.register_attempt(usuario, credenciales_validas)
 
             if credenciales_validas:
                 print("\n" + "="*50)
                 print(f"¡Bienvenido, {usuario}!")
                 print("="*50 + "\n")
-                rate_limiter.register_attempt(usuario, True)
+                if compartido is not None:
+                    compartido.registrar_intento(clave, True)
+                else:
+                    rate_limiter.register_attempt(usuario, True)
                 break
             else:
                 print("Usuario o contraseña incorrectos. Intente de nuevo.")
-                ip = rate_limiter._get_client_ip()
-                if ip in rate_limiter.attempts:
-                    remaining_attempts = rate_limiter.max_attempts - rate_limiter.attempts[ip].intentos
-                    if remaining_attempts > 0:
-                        print(f"Advertencia: Le quedan {remaining_attempts} intentos antes del bloqueo.")
+                if compartido is not None:
+                    remaining_attempts = compartido.intentos_restantes(clave)
+                else:
+                    ip = rate_limiter._get_client_ip()
+                    remaining_attempts = (rate_limiter.max_attempts - rate_limiter.attempts[ip].intentos
+                                          if ip in rate_limiter.attempts else 0)
+                if remaining_attempts > 0:
+                    print(f"Advertencia: Le quedan {remaining_attempts} intentos antes del bloqueo.")
                 time.sleep(1)
 
         else:
@@ -283,4 +499,16 @@ if __name__ == "__main__":
         print("Error: El módulo 'bcrypt' no está instalado.")
         print("Por favor, instálalo con: pip install bcrypt")
         exit(1)
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == 'audit':
+        from auditoria import main as auditar
+        sys.exit(auditar(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'import':
+        from importacion import main_importar
+        sys.exit(main_importar(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'export':
+        from importacion import main_exportar
+        sys.exit(main_exportar(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'sweep':
+        from barrido import main as barrer
+        sys.exit(barrer(sys.argv[2:]))
+    main(silencioso='-q' in sys.argv or '--quiet' in sys.argv)
@@ -0,0 +1,250 @@
+#Codigo hecho por Nocturne Github: https://github.com/nocturne-cybersecurity
+
+import argparse
+import heapq
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import unicodedata
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+from automata import compilar_automata, ruta_automata, leer_terminos
+from indice import compilar_indice, ruta_indice, escritura_atomica
+from filtro import construir_filtro, ruta_filtro
+
+MEMORIA_MB = 256
+# Tramos que se mezclan a la vez; con más se hace una pasada intermedia
+MAX_TRAMOS = 64
+LONGITUD_MAXIMA = 256
+SEPARADOR = '\x00'
+CONTROL = re.compile(r'[\x00-\x1f\x7f]')
+
+def normalizar(linea: bytes, minusculas: bool = False, estadisticas: Optional[Dict[str, int]] = None) -> Optional[str]:
+    """Convierte una línea en bruto de un volcado en una contraseña limpia, o None si hay que descartarla.
+
+    Quita espacios y saltos de línea, decodifica $HEX[...] (formato de hashcat), repara las
+    líneas que no son UTF-8 (se leen como cp1252 o latin-1) y el UTF-8 codificado dos veces
+    ('contraseÃ±a'), normaliza a NFC y, si se pide, pasa a minúsculas.
+    """
+    linea = linea.strip()
+    if linea.startswith(b'$HEX[') and linea.endswith(b']'):
+        try:
+            linea = bytes.fromhex(linea[5:-1].decode('ascii'))
+        except ValueError:
+            return None
+    try:
+        texto = linea.decode('utf-8')
+        if not texto.isascii():
+            try:
+                texto = texto.encode('cp1252').decode('utf-8')
+                if estadisticas is not None:
+                    estadisticas["reparadas"] += 1
+            except UnicodeError:
+                pass
+    except UnicodeDecodeError:
+        try:
+            texto = linea.decode('cp1252')
+        except UnicodeDecodeError:
+            texto = linea.decode('latin-1')
+        if estadisticas is not None:
+            estadisticas["reparadas"] += 1
+
+    texto = unicodedata.normalize('NFC', texto).strip()
+    if not texto or CONTROL.search(texto):
+        return None
+    return texto.casefold() if minusculas else texto
+
+def _volcar_tramo(bloque: Iterable[str], directorio: str) -> str:
+    descriptor, ruta = tempfile.mkstemp(suffix='.tramo', dir=directorio)
+    with os.fdopen(descriptor, 'w', encoding='utf-8') as f:
+        for registro in bloque:
+            f.write(registro)
+            f.write('\n')
+    return ruta
+
+def _leer_tramo(ruta: str) -> Iterator[str]:
+    with open(ruta, 'r', encoding='utf-8', newline='\n') as f:
+        for registro in f:
+            yield registro[:-1]
+
+def ordenar_externo(registros: Iterable[str], directorio: str, memoria: int = MEMORIA_MB << 20) -> Iterator[str]:
+    """Ordena cadenas sin salto de línea con memoria acotada (ordenación externa por tramos).
+
+    Los registros se acumulan hasta ocupar unos memoria bytes, se ordenan y se vuelcan a
+    un archivo temporal; al final se mezclan todos los tramos con heapq.merge, en varias
+    pasadas si hay más de MAX_TRAMOS.
+    """
+    tramos: List[str] = []
+    try:
+        bloque: List[str] = []
+        ocupado = 0
+        for registro in registros:
+            bloque.append(registro)
+            ocupado += sys.getsizeof(registro) + 8
+            if ocupado >= memoria:
+                bloque.sort()
+                tramos.append(_volcar_tramo(bloque, directorio))
+                bloque, ocupado = [], 0
+        bloque.sort()
+        if not tramos:
+            yield from bloque
+            return
+        if bloque:
+            tramos.append(_volcar_tramo(bloque, directorio))
+        del bloque
+
+        while len(tramos) > MAX_TRAMOS:
+            grupo = tramos[:MAX_TRAMOS]
+            tramos = tramos[MAX_TRAMOS:] + [_volcar_tramo(heapq.merge(*map(_leer_tramo, grupo)), directorio)]
+            for tramo in grupo:
+                os.unlink(tramo)
+        yield from heapq.merge(*map(_leer_tramo, tramos))
+    finally:
+        for tramo in tramos:
+            if os.path.exists(tramo):
+                os.unlink(tramo)
+
+def _abrir_entrada(ruta: str) -> BinaryIO:
+    return sys.stdin.buffer if ruta == '-' else open(ruta, 'rb')
+
+def _leer_entradas(rutas: List[str], minusculas: bool, longitud_minima: int, longitud_maxima: int,
+                   estadisticas: Dict[str, int]) -> Iterator[str]:
+    for ruta in rutas:
+        entrada = _abrir_entrada(ruta)
+        try:
+            for linea in entrada:
+                estadisticas["leidas"] += 1
+                texto = normalizar(linea, minusculas, estadisticas)
+                if texto is None or not longitud_minima <= len(texto) <= longitud_maxima:
+                    estadisticas["descartadas"] += 1
+                    continue
+                yield texto
+        finally:
+            if entrada is not sys.stdin.buffer:
+                entrada.close()
+
+def combinar(rutas: List[str], destino: str, minusculas: bool = False, longitud_minima: int = 1,
+             longitud_maxima: int = LONGITUD_MAXIMA, orden: str = 'original',
+             memoria: int = MEMORIA_MB << 20) -> Dict[str, int]:
+    """Mezcla varias listas en destino, normalizadas y sin duplicados, con memoria acotada.
+
+    Con orden 'original' cada contraseña conserva la posición de su primera aparición
+    (las listas filtradas suelen venir ordenadas por frecuencia y el estimador usa esa
+    posición como rango); hace falta una segunda ordenación externa por posición. Con
+    'alfabetico' basta una. El destino puede ser una de las entradas: se escribe en un
+    temporal y se sustituye al final.
+    """
+    estadisticas = {"leidas": 0, "descartadas": 0, "reparadas": 0, "unicas": 0}
+    inicio = time.perf_counter()
+    directorio = os.path.dirname(os.path.abspath(destino))
+
+    with tempfile.TemporaryDirectory(prefix='passcor-', dir=directorio) as tmp:
+        textos = _leer_entradas(rutas, minusculas, longitud_minima, longitud_maxima, estadisticas)
+        # La posición en hexadecimal de ancho fijo ordena igual como texto que como número
+        registros = (f"{texto}{SEPARADOR}{n:016x}" for n, texto in enumerate(textos))
+
+        def unicos() -> Iterator[str]:
+            anterior = None
+            for registro in ordenar_externo(registros, tmp, memoria):
+                texto, posicion = registro.split(SEPARADOR)
+                if texto != anterior:
+                    anterior = texto
+                    yield posicion + SEPARADOR + texto
+
+        if orden == 'original':
+            salida = (r.split(SEPARADOR)[1] for r in ordenar_externo(unicos(), tmp, memoria))
+        else:
+            salida = (r.split(SEPARADOR)[1] for r in unicos())
+
+        with escritura_atomica(destino) as f:
+            for texto in salida:
+                f.write(texto.encode('utf-8'))
+                f.write(b'\n')
+                estadisticas["unicas"] += 1
+
+    estadisticas["duplicadas"] = estadisticas["leidas"] - estadisticas["descartadas"] - estadisticas["unicas"]
+    estadisticas["segundos"] = round(time.perf_counter() - inicio, 2)
+    return estadisticas
+
+def agregar_a_datos(ruta_lista: str, ruta_datos: str, categoria: str, limite: int) -> int:
+    """Añade a una categoría de data.JSON las primeras contraseñas de la lista que aún no estén"""
+    with open(ruta_datos, 'r', encoding='utf-8') as f:
+        datos = json.load(f)
+    palabras = datos.setdefault('categorias', {}).setdefault(categoria, [])
+    existentes = set(palabras)
+    añadidas = 0
+    with open(ruta_lista, 'r', encoding='utf-8') as f:
+        for linea in f:
+            if añadidas >= limite:
+                break
+            palabra = linea.rstrip('\n')
+            if palabra not in existentes:
+                palabras.append(palabra)
+                existentes.add(palabra)
+                añadidas += 1
+
+    estadisticas = datos.setdefault('estadisticas', {})
+    estadisticas['total_contraseñas'] = sum(len(v) for v in datos['categorias'].values())
+    estadisticas['fecha_actualizacion'] = time.strftime('%Y-%m-%d')
+    with escritura_atomica(ruta_datos) as f:
+        f.write(json.dumps(datos, ensure_ascii=False, indent=2).encode('utf-8'))
+        f.write(b'\n')
+    return añadidas
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='passcor-wordlist',
+        description='Mezcla listas de contraseñas filtradas en TXT/contras.txt, normalizadas y sin duplicados, '
+                    'con memoria acotada, y genera el índice y el autómata que usa el validador'
+    )
+    parser.add_argument('entradas', nargs='+', help="Listas a mezclar, una contraseña por línea ('-' para stdin)")
+    parser.add_argument('-o', '--salida', default='TXT/contras.txt',
+                        help='Lista resultante (por defecto: TXT/contras.txt). Inclúyela también como primera '
+                             'entrada para conservar su contenido y sus posiciones')
+    parser.add_argument('--minusculas', action='store_true',
+                        help='Pasar todo a minúsculas (el validador compara de forma exacta, así que se pierden variantes)')
+    parser.add_argument('--min-longitud', type=int, default=1, help='Descartar contraseñas más cortas (por defecto: 1)')
+    parser.add_argument('--max-longitud', type=int, default=LONGITUD_MAXIMA,
+                        help=f'Descartar contraseñas más largas (por defecto: {LONGITUD_MAXIMA})')
+    parser.add_argument('--orden', choices=['original', 'alfabetico'], default='original',
+                        help='Conservar el orden de primera aparición o ordenar alfabéticamente (por defecto: original)')
+    parser.add_argument('--memoria', type=int, default=MEMORIA_MB,
+                        help=f'Memoria para ordenar, en MB (por defecto: {MEMORIA_MB})')
+    parser.add_argument('--sin-indice', action='store_true', help='No generar el índice (.idx), el autómata (.aho) ni el filtro')
+    parser.add_argument('--filtro', action='store_true', default=os.environ.get('PASSCOR_FILTRO') == '1',
+                        help='Generar también el filtro de Bloom (.bloom), que solo se usa con PASSCOR_FILTRO=1 '
+                             '(por defecto: solo si PASSCOR_FILTRO=1)')
+    parser.add_argument('--datos', default='data.JSON', help='Archivo de categorías para --categoria (por defecto: data.JSON)')
+    parser.add_argument('--categoria', help='Añadir además las primeras contraseñas a esta categoría de data.JSON')
+    parser.add_argument('--limite-categoria', type=int, default=100,
+                        help='Contraseñas a añadir a la categoría (por defecto: 100)')
+    args = parser.parse_args(argv)
+
+    try:
+        resumen = combinar(args.entradas, args.salida, args.minusculas, args.min_longitud, args.max_longitud,
+                           args.orden, args.memoria << 20)
+        if args.categoria:
+            resumen["categoria"] = agregar_a_datos(args.salida, args.datos, args.categoria, args.limite_categoria)
+        if not args.sin_indice:
+            # El índice ordena sus claves por tramos con la misma cota de memoria
+            resumen["indice"] = compilar_indice(args.salida, ruta_indice(args.salida),
+                                                max(1024, (args.memoria << 20) // 40))
+            # El alta busca contraseñas comunes dentro de la nueva con el autómata de la lista y data.JSON
+            resumen["automata"] = compilar_automata(leer_terminos(args.salida, args.datos), ruta_automata(args.salida))
+            if args.filtro:
+                resumen["filtro"] = construir_filtro(args.salida, ruta_filtro(args.salida))
+    except FileNotFoundError as e:
+        print(f"Error: No se encontró el archivo {e.filename}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print("\n[!] Operación cancelada por el usuario", file=sys.stderr)
+        return 1
+
+    print(json.dumps(resumen, ensure_ascii=False), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())